@@ -0,0 +1,99 @@
+"""Configuration load benchmark for component startup.
+
+Usage:
+    python benchmarks/config_load.py [--iterations 20]
+
+Builds the blog and video workflows plus the core App from one config file
+and reports the startup time and how many times the YAML was parsed. The
+first ("cold") startup parses the file; later ("warm") startups should reuse
+the cached snapshot and parse nothing.
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+EXAMPLE_CONFIG = (
+    Path(__file__).resolve().parent.parent / "src" / "com" / "brykly" / "config" / "config.yaml.example"
+)
+
+def write_config(directory: Path) -> Path:
+    """Write the example config, filled in so every component accepts it."""
+    config = yaml.safe_load(EXAMPLE_CONFIG.read_text())
+    config["api"]["openai"]["api_url"] = "http://localhost/v1/chat/completions"
+    config["openai"] = {"api_key": "benchmark"}
+    config["openrouter"] = {"api_key": "benchmark"}
+    config["paths"] = {"temp_dir": str(directory / "temp"), "output_dir": str(directory / "output")}
+    config["output"]["directory"] = str(directory / "output")
+    config["output"]["templates"] = {"markdown": "templates/blog_post.md.j2"}
+    config["logging"] = {"level": "ERROR"}
+    path = directory / "config.yaml"
+    path.write_text(yaml.dump(config))
+    return path
+
+def count_parses() -> Dict[str, int]:
+    """Patch the YAML entry points to count document parses."""
+    counter = {"parses": 0}
+
+    def counting(original: Callable[..., Any]) -> Callable[..., Any]:
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            counter["parses"] += 1
+            return original(*args, **kwargs)
+        return wrapper
+
+    yaml.load = counting(yaml.load)
+    yaml.safe_load = counting(yaml.safe_load)
+    return counter
+
+def startup(config_path: str) -> None:
+    """Construct the components a batch service creates at startup."""
+    from com.brykly.core.app import App
+    from com.brykly.workflow.blog import BlogGenerationWorkflow
+    from com.brykly.workflow.video import VideoProcessingWorkflow
+
+    BlogGenerationWorkflow(config_path)
+    VideoProcessingWorkflow(config_path)
+    App(config_path)
+
+def measure(config_path: str, counter: Dict[str, int], iterations: int) -> Tuple[float, float, float]:
+    """Return (cold ms, warm ms, warm parses per startup)."""
+    from com.brykly.config.configuration_manager import clear_config_cache
+
+    clear_config_cache()
+    started = time.perf_counter()
+    startup(config_path)
+    cold_ms = (time.perf_counter() - started) * 1000
+
+    counter["parses"] = 0
+    started = time.perf_counter()
+    for _ in range(iterations):
+        startup(config_path)
+    warm_ms = (time.perf_counter() - started) * 1000 / iterations
+    return cold_ms, warm_ms, counter["parses"] / iterations
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure config load cost at startup")
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config_path = str(write_config(Path(tmp)))
+        counter = count_parses()
+
+        from com.brykly.config.configuration_manager import ConfigurationManager
+        ConfigurationManager(config_path)
+
+        cold_ms, warm_ms, warm_parses = measure(config_path, counter, args.iterations)
+        print(f"cold startup: {cold_ms:.2f} ms")
+        print(f"warm startup: {warm_ms:.2f} ms ({warm_parses:.1f} YAML parses per startup)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
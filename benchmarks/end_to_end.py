@@ -0,0 +1,236 @@
+"""End-to-end pipeline benchmark with offline backends.
+
+Usage:
+    python benchmarks/end_to_end.py [--runs 20] [--videos 16] [--concurrency 1,4,8]
+        [--latency-ms 50] [--tokens-per-s 0] [--output results.json]
+        [--baseline benchmarks/baselines/end_to_end.json] [--tolerance 0.2]
+        [--save-baseline]
+
+Runs ``App.process_video`` and ``WorkflowOrchestrator.run_batch`` against
+fake yt-dlp and transcript backends (see ``fakes.py``) and a local stub LLM
+server (see ``llm_stub.py``), so nothing touches the network. It reports:
+
+- single-video latency (mean, p50, p95) and the mean time per stage,
+- batch throughput in videos per second at each concurrency level,
+- the process's peak RSS.
+
+Results are written as JSON. With ``--baseline`` each metric is compared to
+the stored run and the exit status is 1 if any is worse by more than
+``--tolerance``. Baselines depend on the machine; record your own with
+``--save-baseline`` before comparing.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.fakes import FakeBackendSettings, offline_backends, video_url
+from benchmarks.llm_stub import StubLLMServer
+
+DEFAULT_BASELINE = ROOT / "benchmarks" / "baselines" / "end_to_end.json"
+STAGES = ("extract_metadata", "generate_content", "save_output")
+
+def write_config(directory: Path, api_url: str, formats: List[str]) -> Path:
+    """A complete config pointing at the stub LLM and a scratch output dir."""
+    config = {
+        "api": {"openai": {
+            "api_key": "benchmark",
+            "api_url": api_url,
+            "model": "benchmark-model",
+            "temperature": 0.7,
+            "max_tokens": 2000,
+        }},
+        "workflow": {"backend": "asyncio", "max_workers": 1},
+        "output": {
+            "formats": formats,
+            "directory": str(directory / "output"),
+            "templates": {
+                "markdown": "templates/blog_post.md.j2",
+                "html": "templates/blog_post.html.j2",
+                "pdf": "templates/blog_post.pdf.j2",
+            },
+        },
+        "logging": {"level": "ERROR"},
+        "paths": {"output_dir": str(directory / "output")},
+    }
+    path = directory / "config.yaml"
+    path.write_text(yaml.dump(config))
+    return path
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process, if the platform reports it."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+def measure_single(config_path: str, runs: int, mode: str) -> Dict[str, Any]:
+    """Latency of App.process_video, one video at a time."""
+    from com.brykly.core.app import App
+    from com.brykly.utils.metrics import STAGE_SECONDS, registry
+
+    app = App(config_path)
+    app.process_video(video_url(0), mode)  # warm-up: imports, templates, connections
+    registry.reset()
+
+    latencies = []
+    for i in range(runs):
+        started = time.perf_counter()
+        app.process_video(video_url(i + 1), mode)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    return {
+        "runs": runs,
+        "mean_ms": statistics.fmean(latencies),
+        "p50_ms": percentile(latencies, 0.5),
+        "p95_ms": percentile(latencies, 0.95),
+        "stages_ms": {
+            stage: STAGE_SECONDS.sum(stage=stage, status="ok") * 1000 / runs for stage in STAGES
+        },
+    }
+
+def measure_batch(config_path: str, videos: int, concurrency: List[int], mode: str) -> Dict[str, Any]:
+    """Throughput of WorkflowOrchestrator.run_batch at each concurrency level."""
+    from com.brykly.workflow.orchestrator import WorkflowOrchestrator
+
+    orchestrator = WorkflowOrchestrator(config_path, backend="asyncio")
+    results = {}
+    offset = 1000
+    for workers in concurrency:
+        orchestrator.max_workers = workers
+        urls = [video_url(offset + i) for i in range(videos)]
+        offset += videos
+        started = time.perf_counter()
+        outputs = orchestrator.run_batch(urls, mode)
+        elapsed = time.perf_counter() - started
+        failed = sum(1 for output in outputs.values() if output is None)
+        if failed:
+            raise RuntimeError(f"{failed} of {videos} videos failed at concurrency {workers}")
+        results[str(workers)] = {"videos": videos, "seconds": elapsed, "videos_per_s": videos / elapsed}
+    return results
+
+def comparable(results: Dict[str, Any]) -> Dict[str, Tuple[float, bool]]:
+    """Metrics to compare against a baseline, as (value, higher_is_better)."""
+    metrics = {
+        "single.p50_ms": (results["single"]["p50_ms"], False),
+        "single.p95_ms": (results["single"]["p95_ms"], False),
+    }
+    for workers, batch in results["batch"].items():
+        metrics[f"batch.{workers}.videos_per_s"] = (batch["videos_per_s"], True)
+    if results.get("peak_rss_mb"):
+        metrics["peak_rss_mb"] = (results["peak_rss_mb"], False)
+    return metrics
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Print a comparison table and return the metrics that regressed."""
+    current = comparable(results)
+    previous = comparable(baseline)
+    regressions = []
+    print(f"\n{'metric':32s} {'baseline':>12s} {'current':>12s} {'change':>8s}")
+    for name, (value, higher_is_better) in current.items():
+        if name not in previous or not previous[name][0]:
+            print(f"{name:32s} {'-':>12s} {value:12.2f}")
+            continue
+        base = previous[name][0]
+        change = (value - base) / base
+        worse = -change if higher_is_better else change
+        flag = "  REGRESSION" if worse > tolerance else ""
+        print(f"{name:32s} {base:12.2f} {value:12.2f} {change:+8.1%}{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the pipeline end to end, offline")
+    parser.add_argument("--runs", type=int, default=20, help="single-video runs")
+    parser.add_argument("--videos", type=int, default=16, help="videos per batch")
+    parser.add_argument("--concurrency", default="1,4,8", help="comma-separated worker counts")
+    parser.add_argument("--mode", choices=["quick", "detailed"], default="detailed")
+    parser.add_argument("--formats", default="markdown,html,pdf")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="stub LLM latency per request")
+    parser.add_argument("--tokens-per-s", type=float, default=0.0, help="stub LLM generation rate; 0 is instant")
+    parser.add_argument("--completion-tokens", type=int, default=800)
+    parser.add_argument("--metadata-delay-ms", type=float, default=0.0, help="fake yt-dlp delay")
+    parser.add_argument("--transcript-delay-ms", type=float, default=0.0, help="fake transcript API delay")
+    parser.add_argument("--transcript-words", type=int, default=3000)
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--baseline", help=f"compare with a stored result (e.g. {DEFAULT_BASELINE.relative_to(ROOT)})")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed fractional regression")
+    parser.add_argument("--save-baseline", action="store_true", help=f"store the results as {DEFAULT_BASELINE.relative_to(ROOT)}")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    concurrency = [int(workers) for workers in args.concurrency.split(",") if workers]
+    settings = FakeBackendSettings(
+        args.metadata_delay_ms / 1000, args.transcript_delay_ms / 1000, args.transcript_words
+    )
+
+    with tempfile.TemporaryDirectory() as tmp, offline_backends(settings), StubLLMServer(
+        latency=args.latency_ms / 1000,
+        tokens_per_s=args.tokens_per_s,
+        completion_tokens=args.completion_tokens
+    ) as llm:
+        config_path = str(write_config(Path(tmp), llm.url, args.formats.split(",")))
+        from com.brykly.config.configuration_manager import ConfigurationManager
+        ConfigurationManager(config_path)
+
+        single = measure_single(config_path, args.runs, args.mode)
+        batch = measure_batch(config_path, args.videos, concurrency, args.mode)
+
+    results = {
+        "benchmark": "end_to_end",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {key: value for key, value in vars(args).items()
+                     if key not in ("output", "baseline", "save_baseline")},
+        "single": single,
+        "batch": batch,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+    print(f"single video ({args.mode}): mean {single['mean_ms']:.1f} ms  "
+          f"p50 {single['p50_ms']:.1f} ms  p95 {single['p95_ms']:.1f} ms")
+    for stage, ms in single["stages_ms"].items():
+        print(f"  {stage:18s} {ms:8.1f} ms")
+    for workers, result in batch.items():
+        print(f"batch x{workers:>3s}: {result['videos_per_s']:6.2f} videos/s ({result['seconds']:.2f} s)")
+    if results["peak_rss_mb"] is not None:
+        print(f"peak RSS: {results['peak_rss_mb']:.1f} MB")
+
+    for path in filter(None, [args.output, DEFAULT_BASELINE if args.save_baseline else None]):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(json.dumps(results, indent=2) + "\n")
+        print(f"wrote {path}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} metric(s) regressed by more than {args.tolerance:.0%}")
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
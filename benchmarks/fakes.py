@@ -0,0 +1,108 @@
+"""Offline stand-ins for yt-dlp and youtube-transcript-api.
+
+``offline_backends()`` swaps fake ``yt_dlp`` and ``youtube_transcript_api``
+modules into ``sys.modules`` for the duration of a block. The package
+imports both lazily, so ``VideoProcessor`` picks the fakes up without any
+patching of its own code. Responses are generated from the video ID, with
+optional delays standing in for network time.
+"""
+
+import random
+import re
+import sys
+import time
+import types
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+_VIDEO_ID = re.compile(r"(?:v=|youtu\.be/)([A-Za-z0-9_-]{11})")
+_WORDS = (
+    "model data pipeline latency video frame cache stage batch worker queue "
+    "token prompt render output python profile memory thread process result"
+).split()
+
+def video_url(index: int) -> str:
+    """A well-formed URL for the ``index``-th fake video."""
+    return f"https://www.youtube.com/watch?v=bench{index:06d}"
+
+class FakeBackendSettings:
+    """Delays and sizes shared by the fake backends."""
+
+    def __init__(self, metadata_delay: float = 0.0, transcript_delay: float = 0.0, transcript_words: int = 3000):
+        self.metadata_delay = metadata_delay
+        self.transcript_delay = transcript_delay
+        self.transcript_words = transcript_words
+
+class TranscriptsDisabled(Exception):
+    pass
+
+class NoTranscriptFound(Exception):
+    pass
+
+def _fake_yt_dlp(settings: FakeBackendSettings) -> types.ModuleType:
+    class YoutubeDL:
+        def __init__(self, params: Optional[Dict[str, Any]] = None):
+            self.params = params or {}
+
+        def __enter__(self) -> "YoutubeDL":
+            return self
+
+        def __exit__(self, *exc_info: Any) -> None:
+            pass
+
+        def extract_info(self, url: str, download: bool = True) -> Dict[str, Any]:
+            match = _VIDEO_ID.search(url)
+            if not match:
+                raise ValueError(f"Unsupported URL: {url}")
+            time.sleep(settings.metadata_delay)
+            video_id = match.group(1)
+            return {
+                "id": video_id,
+                "title": f"Benchmark video {video_id}",
+                "description": " ".join(_WORDS) * 10,
+                "duration": 600,
+                "upload_date": "20240101",
+                "channel": "Benchmark channel",
+                "webpage_url": url,
+            }
+
+    module = types.ModuleType("yt_dlp")
+    module.YoutubeDL = YoutubeDL
+    return module
+
+def _fake_transcript_api(settings: FakeBackendSettings) -> types.ModuleType:
+    class YouTubeTranscriptApi:
+        @staticmethod
+        def get_transcript(video_id: str, languages: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+            time.sleep(settings.transcript_delay)
+            rng = random.Random(video_id)
+            entries = []
+            for start in range(0, settings.transcript_words, 10):
+                words = " ".join(rng.choice(_WORDS) for _ in range(10))
+                entries.append({"text": words, "start": start / 3, "duration": 3.3, "lang": "en"})
+            return entries
+
+    module = types.ModuleType("youtube_transcript_api")
+    module.YouTubeTranscriptApi = YouTubeTranscriptApi
+    module.TranscriptsDisabled = TranscriptsDisabled
+    module.NoTranscriptFound = NoTranscriptFound
+    return module
+
+@contextmanager
+def offline_backends(settings: Optional[FakeBackendSettings] = None) -> Iterator[FakeBackendSettings]:
+    """Serve yt-dlp and transcript calls from the fakes inside the block."""
+    settings = settings or FakeBackendSettings()
+    fakes = {
+        "yt_dlp": _fake_yt_dlp(settings),
+        "youtube_transcript_api": _fake_transcript_api(settings),
+    }
+    saved = {name: sys.modules.get(name) for name in fakes}
+    sys.modules.update(fakes)
+    try:
+        yield settings
+    finally:
+        for name, module in saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
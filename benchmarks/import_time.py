@@ -0,0 +1,68 @@
+"""Startup-time benchmark based on ``python -X importtime``.
+
+Usage:
+    python benchmarks/import_time.py [--module com.brykly.cli] [--budget-ms 500]
+
+Exits with status 1 when the cumulative import time of the module exceeds
+the budget or when any heavy optional backend is imported eagerly.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+DEFAULT_MODULE = "com.brykly.cli"
+DEFAULT_BUDGET_MS = 500.0
+HEAVY_MODULES = ("prefect", "ultralytics", "cv2", "reportlab", "torch", "yt_dlp")
+
+def measure_import_time(module: str = DEFAULT_MODULE) -> Dict[str, int]:
+    """Import a module in a fresh interpreter and return cumulative times in us."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")]))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True
+    )
+    times: Dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative_us)
+    return times
+
+def heavy_imports(times: Dict[str, int]) -> List[str]:
+    """Return heavy optional backends that were imported."""
+    return sorted(name for name in times if name.split(".")[0] in HEAVY_MODULES)
+
+def slowest(times: Dict[str, int], count: int = 10) -> List[Tuple[str, int]]:
+    """Return the top-level imports with the largest cumulative time."""
+    return sorted(times.items(), key=lambda item: item[1], reverse=True)[:count]
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure package import time")
+    parser.add_argument("--module", default=DEFAULT_MODULE)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    args = parser.parse_args()
+
+    times = measure_import_time(args.module)
+    total_ms = times[args.module] / 1000
+    print(f"{args.module}: {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    for name, cumulative_us in slowest(times):
+        print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+
+    heavy = heavy_imports(times)
+    if heavy:
+        print(f"Heavy modules imported eagerly: {', '.join(heavy)}")
+    return 1 if heavy or total_ms > args.budget_ms else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
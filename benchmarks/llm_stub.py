@@ -0,0 +1,159 @@
+"""Local OpenAI-compatible chat completions server for benchmarks.
+
+Usage:
+    python benchmarks/llm_stub.py [--port 8089] [--latency-ms 200] [--tokens-per-s 80]
+
+``POST /v1/chat/completions`` answers after ``latency`` plus the time to
+"generate" ``completion_tokens`` at ``tokens_per_s``, with a body in the
+section format ``ContentGenerator`` parses and a ``usage`` block. Point
+``api.openai.api_url`` at ``http://127.0.0.1:<port>/v1/chat/completions``.
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+
+def completion_text(tokens: int) -> str:
+    """A blog post in ContentGenerator's section format, about ``tokens`` words long."""
+    body_words = max(tokens - 40, 10)
+    paragraphs = []
+    for start in range(0, body_words, 80):
+        count = min(80, body_words - start)
+        paragraphs.append(" ".join(["benchmark"] * count) + ".")
+    return "\n\n".join([
+        "[Title]\nA Benchmark Blog Post",
+        "[Content]\n" + "\n\n".join(paragraphs),
+        "[Tags]\nbenchmark, performance, testing",
+        "[Takeaways]\nMeasure first\nCompare against a baseline\nAutomate the run",
+    ])
+
+class StubLLMServer:
+    """A threaded HTTP server that imitates a chat completions endpoint.
+
+    ``requests`` counts the completions served. Use as a context manager
+    or call ``start``/``stop``.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        tokens_per_s: float = 0.0,
+        completion_tokens: int = 800
+    ):
+        self.latency = latency
+        self.tokens_per_s = tokens_per_s
+        self.completion_tokens = completion_tokens
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._content = completion_text(completion_tokens)
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self._server.server_address[:2]
+
+    @property
+    def url(self) -> str:
+        host, port = self.address
+        return f"http://{host}:{port}/v1/chat/completions"
+
+    def _respond(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        prompt = " ".join(str(message.get("content", "")) for message in request.get("messages", []))
+        delay = self.latency
+        if self.tokens_per_s:
+            delay += self.completion_tokens / self.tokens_per_s
+        time.sleep(delay)
+        with self._lock:
+            self.requests += 1
+        prompt_tokens = len(prompt) // 4
+        return {
+            "id": f"stub-{self.requests}",
+            "object": "chat.completion",
+            "model": request.get("model", "stub"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": self._content},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": self.completion_tokens,
+                "total_tokens": prompt_tokens + self.completion_tokens,
+            },
+        }
+
+    def _handler(self) -> type:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self) -> None:
+                if not self.path.rstrip("/").endswith("/chat/completions"):
+                    self.send_error(404)
+                    return
+                length = int(self.headers.get("Content-Length", 0))
+                try:
+                    request = json.loads(self.rfile.read(length) or b"{}")
+                except ValueError:
+                    self.send_error(400, "Invalid JSON")
+                    return
+                body = json.dumps(stub._respond(request)).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
+
+    def start(self) -> "StubLLMServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="llm-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "StubLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Serve a stub OpenAI-compatible endpoint")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    parser.add_argument("--tokens-per-s", type=float, default=0.0)
+    parser.add_argument("--completion-tokens", type=int, default=800)
+    args = parser.parse_args()
+
+    server = StubLLMServer(
+        args.host, args.port, args.latency_ms / 1000, args.tokens_per_s, args.completion_tokens
+    )
+    print(f"Serving {server.url} (Ctrl-C to stop)")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""Log-call overhead under concurrent workers, synchronous vs. queued.
+
+Usage:
+    python benchmarks/logging_overhead.py [--workers 8] [--records 2000]
+
+Each worker thread logs ``--records`` messages to a file sink (console
+output is disabled) and the per-call latency is recorded. The synchronous
+mode writes in the calling thread; the async modes only enqueue, with the
+``drop`` policy never waiting for the writer.
+
+``--sink-delay-ms`` adds a sink that blocks for that long per record, like
+a stdout pipe whose reader is slow or a log file on a network share. That
+is the case the queue exists for: on a fast local disk the synchronous
+mode is cheaper, because the writer thread re-emits every record.
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+def run(log: Any, workers: int, records: int) -> Dict[str, float]:
+    """Log from several threads and summarise per-call latency in microseconds."""
+    latencies: List[List[float]] = [[] for _ in range(workers)]
+    barrier = threading.Barrier(workers)
+
+    def work(samples: List[float]) -> None:
+        barrier.wait()
+        for i in range(records):
+            started = time.perf_counter()
+            log.info(f"processed frame batch {i}")
+            samples.append((time.perf_counter() - started) * 1e6)
+
+    threads = [threading.Thread(target=work, args=(samples,)) for samples in latencies]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    calls_done = time.perf_counter() - started
+    log.flush()
+    drained = time.perf_counter() - started
+
+    samples = sorted(sample for worker in latencies for sample in worker)
+    return {
+        "mean_us": statistics.fmean(samples),
+        "p99_us": samples[int(len(samples) * 0.99)],
+        "calls_s": calls_done,
+        "drained_s": drained,
+    }
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure log-call overhead")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--records", type=int, default=2000)
+    parser.add_argument("--sink-delay-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    from loguru import logger
+    from com.brykly.config.configuration_manager import ConfigurationManager
+    from com.brykly.utils.async_logging import is_replayed
+    from com.brykly.utils.logger import Logger
+
+    def slow_sink(message: str) -> None:
+        time.sleep(args.sink_delay_ms / 1000)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config_path = Path(tmp) / "config.yaml"
+        config_path.write_text("logging:\n  level: CRITICAL\n")
+        ConfigurationManager(str(config_path))
+        log = Logger()
+
+        modes = {
+            "sync": {},
+            "async/block": {"async": True, "overflow": "block"},
+            "async/drop": {"async": True, "overflow": "drop", "queue_size": 1000},
+        }
+        print(f"{args.workers} workers x {args.records} records, sink delay {args.sink_delay_ms} ms")
+        for name, options in modes.items():
+            log_file = Path(tmp) / f"{name.replace('/', '_')}.log"
+            log.configure({"file": str(log_file), "console_level": "CRITICAL", "file_level": "INFO", **options})
+            if args.sink_delay_ms:
+                logger.add(slow_sink, level="INFO", filter=is_replayed if options else None)
+            result = run(log, args.workers, args.records)
+            dropped = log._queue.dropped if log._queue else 0
+            print(
+                f"  {name:12s} mean {result['mean_us']:7.1f} us  p99 {result['p99_us']:8.1f} us  "
+                f"calls {result['calls_s']:.2f} s  drained {result['drained_s']:.2f} s  dropped {dropped}"
+            )
+        log.configure({"level": "CRITICAL"})
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
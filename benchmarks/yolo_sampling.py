@@ -0,0 +1,113 @@
+"""Frames-per-second benchmark for YOLOAdapter.analyze_video.
+
+Writes a synthetic clip, then compares the legacy read-every-frame,
+one-call-per-frame loop against the frame-skipping batched analyser.
+
+Usage:
+    python benchmarks/yolo_sampling.py [--seconds 60] [--model yolov8n.pt]
+
+Without ``--model`` a stand-in model with a fixed per-call and per-frame
+cost is used, so the benchmark runs without ultralytics installed.
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, List
+
+import cv2
+import numpy as np
+import yaml
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from com.brykly.config.configuration_manager import ConfigurationManager  # noqa: E402
+from com.brykly.external_integration.yolo_adapter import YOLOAdapter  # noqa: E402
+
+class StubModel:
+    """Model stand-in that costs call_ms per call plus frame_ms per frame."""
+
+    def __init__(self, call_ms: float = 8.0, frame_ms: float = 2.0):
+        self.call_ms = call_ms
+        self.frame_ms = frame_ms
+
+    def __call__(self, source: Any, **kwargs: Any) -> List[Any]:
+        frames = source if isinstance(source, list) else [source]
+        time.sleep((self.call_ms + self.frame_ms * len(frames)) / 1000)
+        boxes = SimpleNamespace(cls=[], conf=[], xyxy=[])
+        return [SimpleNamespace(boxes=boxes, names={}) for _ in frames]
+
+def write_clip(path: Path, seconds: int, fps: int = 30, size: tuple = (640, 360)) -> int:
+    """Write a synthetic moving-gradient clip and return its frame count."""
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"mp4v"), fps, size)
+    width, height = size
+    base = np.tile(np.linspace(0, 255, width, dtype=np.uint8), (height, 1))
+    frame_count = seconds * fps
+    for i in range(frame_count):
+        frame = np.dstack([np.roll(base, i * 4, axis=1), base, np.full_like(base, i % 256)])
+        writer.write(frame)
+    writer.release()
+    return frame_count
+
+def legacy_analyze(model: Any, video_path: str, sample_rate: int = 30) -> None:
+    """The original loop: decode every frame, convert, one model call each."""
+    cap = cv2.VideoCapture(video_path)
+    frame_count = 0
+    while cap.isOpened():
+        ret, frame = cap.read()
+        if not ret:
+            break
+        if frame_count % sample_rate == 0:
+            frame_pil = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+            model(frame_pil)
+        frame_count += 1
+    cap.release()
+
+def make_adapter(model: Any, config_dir: Path) -> YOLOAdapter:
+    """Create an adapter wired to the given model."""
+    config_path = config_dir / "config.yaml"
+    config_path.write_text(yaml.dump({"api": {"yolo": {"batch_size": 16}}, "logging": {}}))
+    ConfigurationManager(str(config_path))
+    adapter = YOLOAdapter()
+    adapter.model = model
+    adapter._authenticated = True
+    return adapter
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="YOLO video sampling benchmark")
+    parser.add_argument("--seconds", type=int, default=60)
+    parser.add_argument("--model", help="Real YOLO weights (requires ultralytics)")
+    args = parser.parse_args()
+
+    if args.model:
+        from ultralytics import YOLO
+        model = YOLO(args.model)
+    else:
+        model = StubModel()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        clip = tmp_dir / "clip.mp4"
+        frame_count = write_clip(clip, args.seconds)
+        adapter = make_adapter(model, tmp_dir)
+
+        start = time.perf_counter()
+        legacy_analyze(model, str(clip))
+        legacy_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        insights = adapter.analyze_video(str(clip))
+        batched_seconds = time.perf_counter() - start
+
+    print(f"clip: {frame_count} frames ({args.seconds}s @ 30fps)")
+    print(f"legacy : {frame_count / legacy_seconds:8.1f} video frames/s ({legacy_seconds:.2f}s)")
+    print(f"batched: {frame_count / batched_seconds:8.1f} video frames/s ({batched_seconds:.2f}s)")
+    print(f"stages : {insights.stats.to_dict()}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
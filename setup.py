@@ -28,12 +28,10 @@ setup(
         "youtube-transcript-api>=0.6.1",
         "openai>=1.12.0",
         "aiohttp>=3.9.1",
-        "prefect>=2.14.0",
         "markdown>=3.5.1",
         "jinja2>=3.1.2",
         "reportlab>=4.0.8",
         "pillow>=10.2.0",
-        "ultralytics>=8.1.0",
         "pytest>=8.0.0",
         "pytest-asyncio>=0.23.5",
         "pytest-cov>=4.1.0",
@@ -43,6 +41,10 @@ setup(
         "fastapi>=0.109.0",
         "uvicorn>=0.27.0"
     ],
+    extras_require={
+        "prefect": ["prefect>=2.14.0"],
+        "vision": ["ultralytics>=8.1.0"],
+    },
     entry_points={
         'console_scripts': [
             'agentic-fun=com.brykly.cli:main',
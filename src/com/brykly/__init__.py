@@ -2,24 +2,31 @@
 
 __version__ = '0.1.0'
 
-from .core.app import App
-from .config.configuration_manager import ConfigurationManager
-from .utils.logger import Logger
-from .workflow.orchestrator import WorkflowOrchestrator
-from .output_management.output_manager import OutputManager
-from .external_integration.base_adapter import ExternalAPIAdapter
-from .external_integration.yolo_adapter import YOLOAdapter
-from .external_integration.openai import OpenAIAdapter
-from .external_integration.youtube import YouTubeAdapter
+from importlib import import_module
+from typing import Any
 
-__all__ = [
-    'App',
-    'ConfigurationManager',
-    'Logger',
-    'WorkflowOrchestrator',
-    'OutputManager',
-    'ExternalAPIAdapter',
-    'YOLOAdapter',
-    'OpenAIAdapter',
-    'YouTubeAdapter'
-] 
\ No newline at end of file
+# Public names are resolved on first access so that importing the package
+# does not pull in heavy optional backends (Prefect, YOLO, OpenCV, ReportLab).
+_LAZY_ATTRIBUTES = {
+    'App': '.core.app',
+    'ConfigurationManager': '.config.configuration_manager',
+    'Logger': '.utils.logger',
+    'WorkflowOrchestrator': '.workflow.orchestrator',
+    'OutputManager': '.output_management.output_manager',
+    'ExternalAPIAdapter': '.external_integration.base_adapter',
+    'YOLOAdapter': '.external_integration.yolo_adapter',
+    'OpenAIAdapter': '.external_integration.openai',
+    'YouTubeAdapter': '.external_integration.youtube',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list:
+    return sorted(list(globals()) + __all__)
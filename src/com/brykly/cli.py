@@ -2,21 +2,70 @@
 
 import argparse
 import sys
+from itertools import islice
 from pathlib import Path
+from contextlib import nullcontext
 from typing import Optional
+from .config.configuration_manager import load_config
 from .core.app import App
+from .core.video_processor import VideoProcessor, is_collection_url
 from .utils.logger import Logger
+from .utils.profiling import DEFAULT_PROFILE_MODE, PROFILE_MODES, profile_videos
 
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description='YouTube Content Generator')
-    parser.add_argument('url', help='YouTube video URL')
-    parser.add_argument('--mode', choices=['quick', 'detailed'], default='quick',
-                      help='Processing mode (quick or detailed)')
+    parser.add_argument('url', nargs='?', help='YouTube video URL')
+    parser.add_argument('--mode', choices=['quick', 'detailed', 'visual'], default='quick',
+                      help='Processing mode (quick, detailed, or visual)')
+    parser.add_argument('--video-file',
+                      help='Local copy of the video to analyze in visual mode')
     parser.add_argument('--config', help='Path to configuration file')
     parser.add_argument('--debug', action='store_true',
                       help='Enable debug logging')
-    return parser.parse_args()
+    parser.add_argument('--profile', action='store_true',
+                      help='Profile the run and write .pstats and .collapsed files')
+    parser.add_argument('--profile-mode', choices=PROFILE_MODES, default=DEFAULT_PROFILE_MODE,
+                      help='Profiler to use with --profile (cprofile or sampling)')
+    parser.add_argument('--enqueue', action='store_true',
+                      help='Add the video to the job queue instead of processing it now')
+    parser.add_argument('--worker', action='store_true',
+                      help='Process jobs from the job queue until interrupted')
+    parser.add_argument('--drain', action='store_true',
+                      help='With --worker, exit once the queue is empty')
+    parser.add_argument('--sync', action='store_true',
+                      help='Queue new uploads of the channel URL, or of every channel in sync.channels')
+    args = parser.parse_args()
+    if not args.url and not (args.worker or args.sync):
+        parser.error('a URL is required unless --worker or --sync is given')
+    if args.mode == 'visual' and not args.video_file:
+        parser.error('--mode visual requires --video-file')
+    return args
+
+def sync_channels(args: argparse.Namespace, logger: Logger) -> int:
+    """Queue new uploads of the given or configured channels."""
+    from .workflow.channel_sync import DEFAULT_BACKFILL, ChannelSync
+    from .workflow.job_queue import JobQueue
+    config = load_config(args.config)
+    sync_config = config.get('sync') or {}
+    channels = [args.url] if args.url else list(sync_config.get('channels') or [])
+    if not channels:
+        logger.error("No channels to sync; pass a channel URL or set sync.channels")
+        return 1
+    
+    queue = JobQueue.from_config(config.get('queue') or {})
+    channel_sync = ChannelSync(
+        queue, VideoProcessor(config.data), sync_config.get('backfill', DEFAULT_BACKFILL)
+    )
+    failed = 0
+    for channel in channels:
+        try:
+            result = channel_sync.sync(channel, args.mode)
+            logger.info(f"{channel}: queued {len(result.job_ids)} new videos")
+        except Exception as e:
+            failed += 1
+            logger.error(f"Failed to sync {channel}: {str(e)}")
+    return 1 if failed else 0
 
 def main() -> Optional[int]:
     """Main entry point."""
@@ -28,11 +77,59 @@ def main() -> Optional[int]:
         if not args.config:
             args.config = str(Path(__file__).parent / "config" / "config.yaml")
         
+        if args.debug:
+            log_config = load_config(args.config).get('logging') or {}
+            logger.configure({**log_config, 'level': 'DEBUG', 'console_level': 'DEBUG'})
+        
+        if args.sync:
+            return sync_channels(args, logger)
+        
+        if args.enqueue:
+            from .workflow.job_queue import JobQueue
+            queue = JobQueue.from_config(load_config(args.config).get('queue') or {})
+            extra = {'video_path': args.video_file} if args.video_file else {}
+            if is_collection_url(args.url):
+                config = load_config(args.config)
+                playlist_config = config.get('playlists') or {}
+                urls = islice(
+                    VideoProcessor(config.data).iter_video_urls(args.url),
+                    playlist_config.get('max_videos') or None
+                )
+                count = queue.enqueue_stream(urls, args.mode, playlist_config.get('page_size', 50), **extra)
+                logger.info(f"Queued {count} jobs from {args.url} in {queue.path}")
+                return 0
+            job_id = queue.enqueue(args.url, args.mode, **extra)
+            logger.info(f"Queued job {job_id} in {queue.path}")
+            return 0
+        
+        if args.worker:
+            from .workflow.orchestrator import WorkflowOrchestrator
+            orchestrator = WorkflowOrchestrator(args.config)
+            App(config_path=args.config).initialize_paths()
+            try:
+                with profile_videos(args.profile_mode) if args.profile else nullcontext():
+                    completed = orchestrator.run_queue(drain=args.drain)
+            except KeyboardInterrupt:
+                logger.info("Worker stopped; unfinished jobs return to the queue when their leases expire")
+                return 130
+            logger.info(f"Worker finished after {completed} completed jobs")
+            return 0
+        
         app = App(config_path=args.config)
         app.initialize_paths()
         
+        if is_collection_url(args.url):
+            from .workflow.orchestrator import WorkflowOrchestrator
+            results = WorkflowOrchestrator(args.config).run_batch(
+                [args.url], args.mode, profile=args.profile_mode if args.profile else None
+            )
+            failed = sum(1 for output_files in results.values() if output_files is None)
+            logger.info(f"Processed {len(results) - failed} of {len(results)} videos from {args.url}")
+            return 1 if failed or not results else 0
+        
         # Process the video
-        output_files = app.process_video(args.url, args.mode)
+        with profile_videos(args.profile_mode) if args.profile else nullcontext():
+            output_files = app.process_video(args.url, args.mode, args.video_file)
         
         if output_files:
             logger.info("Successfully generated blog post!")
@@ -0,0 +1,81 @@
+"""Polling file watcher that triggers configuration reloads."""
+
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple
+from loguru import logger
+
+DEFAULT_POLL_INTERVAL = 2.0
+
+class ConfigWatcher:
+    """Calls ``on_change`` when a configuration file is modified.
+
+    The file's modification time and size are polled every ``interval``
+    seconds from a daemon thread. Polling needs no platform-specific
+    dependencies and a config file changes rarely, so the cost is one
+    ``stat`` per interval. ``check()`` runs a single poll synchronously.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        on_change: Callable[[], Any],
+        interval: float = DEFAULT_POLL_INTERVAL
+    ):
+        self.path = Path(path)
+        self.on_change = on_change
+        self.interval = interval
+        self._signature = self._stat()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        """Modification time and size of the file, or None if missing."""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def check(self) -> bool:
+        """Poll once, calling ``on_change`` if the file changed.
+
+        A file that disappears (e.g. mid-way through an editor's atomic
+        save) is ignored until it reappears.
+        """
+        signature = self._stat()
+        if signature is None or signature == self._signature:
+            return False
+        self._signature = signature
+        logger.info(f"Configuration file changed: {self.path}")
+        try:
+            self.on_change()
+        except Exception as e:
+            logger.error(f"Configuration reload failed: {e}")
+        return True
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def start(self) -> "ConfigWatcher":
+        """Start polling in a background thread."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="config-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop polling and wait for the thread to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "ConfigWatcher":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
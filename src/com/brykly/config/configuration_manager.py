@@ -1,85 +1,423 @@
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import copy
+import threading
+import weakref
 import yaml
 from loguru import logger
 from dotenv import load_dotenv
 import os
+from ..utils.exceptions import ConfigurationError
+
+# The C parser is several times faster; fall back to pure Python without libyaml.
+_YAMLLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+DEFAULT_CONFIG_PATH = Path(__file__).parent / "config.yaml"
+
+_READ_ONLY_MESSAGE = "Configuration snapshots are read-only; use ConfigurationManager.set()"
+
+class FrozenDict(dict):
+    """A dict that refuses mutation, used for configuration snapshots."""
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError(_READ_ONLY_MESSAGE)
+
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> Dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[str, Any]:
+        return thaw(self)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Unpickling a dict subclass fills it with __setitem__.
+        return (FrozenDict, (dict(self),))
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists to read-only equivalents."""
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+def thaw(value: Any) -> Any:
+    """Recursively convert a frozen value back to plain dicts and lists."""
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+def _flatten(data: Dict[str, Any], prefix: str = "", index: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Map every dotted key path, including intermediate sections, to its value."""
+    if index is None:
+        index = {}
+    for key, value in data.items():
+        dotted = f"{prefix}{key}"
+        index[dotted] = value
+        if isinstance(value, dict):
+            _flatten(value, f"{dotted}.", index)
+    return index
+
+NUMBER = (int, float)
+
+# Expected types of known keys. Unknown keys are allowed and None is always
+# accepted, so optional settings can be left empty.
+CONFIG_SCHEMA: Dict[str, Tuple[type, ...]] = {
+    "api": (dict,),
+    "api.openai": (dict,),
+    "api.openai.api_key": (str,),
+    "api.openai.api_url": (str,),
+    "api.openai.model": (str,),
+    "api.openai.temperature": NUMBER,
+    "api.openai.max_tokens": (int,),
+    "api.yolo": (dict,),
+    "api.yolo.model": (str,),
+    "api.yolo.device": (str,),
+    "api.yolo.confidence_threshold": NUMBER,
+    "api.yolo.sample_interval": NUMBER,
+    "api.yolo.batch_size": (int,),
+    "api.yolo.max_key_frames": (int,),
+    "api.yolo.queue_size": (int,),
+    "api.yolo.shards": (int,),
+    "api.yolo.min_shard_seconds": NUMBER,
+    "workflow": (dict,),
+    "workflow.max_workers": (int,),
+    "workflow.backend": (str,),
+    "workflow.config_reload_interval": NUMBER,
+    "output": (dict,),
+    "output.formats": (list,),
+    "output.directory": (str,),
+    "output.file_naming": (str,),
+    "output.templates": (dict,),
+    "logging": (dict,),
+    "logging.level": (str,),
+    "logging.file": (str,),
+    "logging.format": (str,),
+    "logging.console_level": (str,),
+    "logging.file_level": (str,),
+    "logging.async": (bool,),
+    "logging.queue_size": (int,),
+    "logging.overflow": (str,),
+    "logging.json": (bool,),
+    "logging.intercept_stdlib": (bool,),
+    "metrics": (dict,),
+    "metrics.port": (int,),
+    "metrics.host": (str,),
+    "metrics.file": (str,),
+    "cassettes": (dict,),
+    "cassettes.mode": (str,),
+    "cassettes.path": (str,),
+    "cassettes.replay_latency": (bool,),
+    "profiling": (dict,),
+    "profiling.enabled": (bool,),
+    "profiling.mode": (str,),
+    "profiling.output_dir": (str,),
+    "profiling.interval_ms": NUMBER,
+    "profiling.videos": (list,),
+    "download": (dict,),
+    "download.max_filesize_mb": NUMBER,
+    "download.max_height": (int,),
+    "speech": (dict,),
+    "speech.enabled": (bool,),
+    "speech.backend": (str,),
+    "speech.model": (str,),
+    "speech.language": (str,),
+    "speech.chunk_seconds": NUMBER,
+    "speech.workers": (int,),
+    "playlists": (dict,),
+    "playlists.max_videos": (int,),
+    "playlists.page_size": (int,),
+    "sync": (dict,),
+    "sync.channels": (list,),
+    "sync.backfill": (int,),
+    "queue": (dict,),
+    "queue.path": (str,),
+    "queue.visibility_timeout": NUMBER,
+    "queue.max_attempts": (int,),
+    "queue.retry_delay": NUMBER,
+    "queue.poll_interval": NUMBER,
+    "queue.priorities": (dict,),
+    "service": (dict,),
+    "service.host": (str,),
+    "service.port": (int,),
+    "service.workers": (int,),
+    "service.queue_size": (int,),
+    "service.retained_jobs": (int,),
+    "modes": (dict,),
+    "paths": (dict,),
+}
+
+ConfigListener = Callable[["ConfigSnapshot", "ConfigSnapshot"], None]
+
+def validate_config(config: Any) -> None:
+    """Check a loaded configuration against CONFIG_SCHEMA.
+
+    Raises:
+        ConfigurationError: Listing every key with an unexpected type.
+    """
+    if not isinstance(config, dict):
+        raise ConfigurationError("Configuration must be a mapping")
+
+    errors = []
+    for key, value in _flatten(config).items():
+        expected = CONFIG_SCHEMA.get(key)
+        if expected is None or value is None:
+            continue
+        if not isinstance(value, expected) or (isinstance(value, bool) and bool not in expected):
+            names = " or ".join(t.__name__ for t in expected)
+            errors.append(f"'{key}' must be {names}, got {type(value).__name__}")
+    if errors:
+        raise ConfigurationError(f"Invalid configuration: {'; '.join(errors)}")
+
+class ConfigSnapshot:
+    """An immutable configuration with a precomputed dotted-key index.
+
+    Snapshots are never modified after construction, so any number of
+    threads can read one without locking. Changes produce a new snapshot
+    (copy-on-write) that the manager swaps in atomically.
+    """
+    __slots__ = ("data", "version", "_index")
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None, version: int = 0):
+        self.data = freeze(data or {})
+        self.version = version
+        self._index = _flatten(self.data)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (ConfigSnapshot, (self.data, self.version))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value by dotted key, e.g. ``api.yolo.model``."""
+        return self._index.get(key, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """A mutable deep copy of the configuration."""
+        return thaw(self.data)
+
+    def with_value(self, key: str, value: Any) -> "ConfigSnapshot":
+        """A new snapshot with one dotted key set."""
+        data = self.to_dict()
+        keys = key.split('.')
+        section = data
+        for k in keys[:-1]:
+            if not isinstance(section.get(k), dict):
+                section[k] = {}
+            section = section[k]
+        section[keys[-1]] = copy.deepcopy(value)
+        return ConfigSnapshot(data, self.version + 1)
+
+def _apply_environment(config: Dict[str, Any]) -> None:
+    """Override API keys and sensitive data from environment variables."""
+    load_dotenv()
+    if os.getenv("OPENAI_API_KEY"):
+        config.setdefault("api", {}).setdefault("openai", {})["api_key"] = os.getenv("OPENAI_API_KEY")
+    if os.getenv("YOLO_MODEL_PATH"):
+        config.setdefault("api", {}).setdefault("yolo", {})["model"] = os.getenv("YOLO_MODEL_PATH")
+
+def read_config_file(config_path: Union[str, Path]) -> Dict[str, Any]:
+    """Parse a config file as written, without environment overrides.
+
+    Raises:
+        ConfigurationError: If the file cannot be read or parsed.
+    """
+    try:
+        with open(config_path, 'r') as f:
+            return yaml.load(f, Loader=_YAMLLoader) or {}
+    except (OSError, yaml.YAMLError) as e:
+        raise ConfigurationError(f"Failed to load configuration: {e}") from e
+
+_cache: Dict[Path, Tuple[Tuple[int, int], ConfigSnapshot]] = {}
+_cache_lock = threading.Lock()
+
+def load_config(config_path: Optional[Union[str, Path]] = None) -> ConfigSnapshot:
+    """Load, override from the environment and validate a config file.
+
+    This is the single place the package parses configuration. Results are
+    cached per file and re-parsed only when the file's modification time or
+    size changes, so every component constructed from the same path shares
+    one snapshot instead of re-reading the YAML.
+
+    Raises:
+        ConfigurationError: If the file cannot be read or fails validation.
+    """
+    path = Path(config_path or DEFAULT_CONFIG_PATH).resolve()
+    try:
+        stat = path.stat()
+    except OSError as e:
+        raise ConfigurationError(f"Failed to load configuration: {e}") from e
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    with _cache_lock:
+        cached = _cache.get(path)
+        if cached and cached[0] == signature:
+            return cached[1]
+        config = read_config_file(path)
+        _apply_environment(config)
+        validate_config(config)
+        version = cached[1].version + 1 if cached else 0
+        snapshot = ConfigSnapshot(config, version)
+        _cache[path] = (signature, snapshot)
+        logger.debug(f"Configuration parsed from {path}")
+        return snapshot
+
+def clear_config_cache(config_path: Optional[Union[str, Path]] = None) -> None:
+    """Forget parsed files so the next load_config re-reads them.
+
+    With ``config_path`` only that file is forgotten.
+    """
+    with _cache_lock:
+        if config_path is None:
+            _cache.clear()
+        else:
+            _cache.pop(Path(config_path).resolve(), None)
 
 class ConfigurationManager:
+    """Process-wide configuration, published as immutable snapshots.
+
+    Reads go to the current snapshot without locking; ``set`` and
+    ``reload`` build a new snapshot and swap it in under a lock, then notify
+    subscribers. Code that needs a consistent view across several reads,
+    such as an in-flight job, should hold on to ``snapshot()``.
+    """
     _instance = None
-    _config: Dict[str, Any] = {}
     _config_path: Optional[Path] = None
 
     def __new__(cls, config_path: Optional[str] = None):
         if cls._instance is None:
-            cls._instance = super(ConfigurationManager, cls).__new__(cls)
+            instance = super(ConfigurationManager, cls).__new__(cls)
+            instance._snapshot = ConfigSnapshot()
+            # The snapshot last returned by the loader, to detect unchanged files.
+            instance._loaded: Optional[ConfigSnapshot] = None
+            instance._lock = threading.Lock()
+            instance._listeners: List[Any] = []
             if config_path:
                 cls._config_path = Path(config_path)
+            cls._instance = instance
         return cls._instance
 
     def __init__(self, config_path: Optional[str] = None):
-        if not self._config:
-            if config_path:
-                self._config_path = Path(config_path)
-            self._load_config()
-            self._load_environment_variables()
+        if not self._snapshot.data:
+            with self._lock:
+                if not self._snapshot.data:
+                    if config_path:
+                        self._config_path = Path(config_path)
+                    self._snapshot = self._loaded = self._load_config()
 
-    def _load_config(self) -> None:
-        """Load configuration from YAML file."""
+    @property
+    def _config(self) -> Dict[str, Any]:
+        """Read-only data of the current snapshot."""
+        return self._snapshot.data
+
+    def _load_config(self) -> ConfigSnapshot:
+        """Load the configuration file through the shared loader."""
         if not self._config_path:
-            self._config_path = Path(__file__).parent / "config.yaml"
+            self._config_path = DEFAULT_CONFIG_PATH
         try:
-            with open(self._config_path, 'r') as f:
-                self._config = yaml.safe_load(f)
+            snapshot = load_config(self._config_path)
             logger.info("Configuration loaded successfully")
+            return snapshot
         except Exception as e:
             logger.error(f"Failed to load configuration: {e}")
             raise
 
-    def _load_environment_variables(self) -> None:
-        """Load environment variables and override config values."""
-        load_dotenv()
-        # Override API keys and sensitive data from environment variables
-        if os.getenv("OPENAI_API_KEY"):
-            self._config["api"]["openai"]["api_key"] = os.getenv("OPENAI_API_KEY")
-        if os.getenv("YOLO_MODEL_PATH"):
-            self._config["api"]["yolo"]["model"] = os.getenv("YOLO_MODEL_PATH")
+    def snapshot(self) -> ConfigSnapshot:
+        """The current configuration snapshot."""
+        return self._snapshot
 
     def get(self, key: str, default: Any = None) -> Any:
-        """Get configuration value by key."""
-        keys = key.split('.')
-        value = self._config
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k, default)
-            else:
-                return default
-        return value
+        """Get configuration value by key.
+
+        Sections are returned as read-only mappings; use the ``get_*_config``
+        methods for a mutable copy.
+        """
+        return self._snapshot.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
-        """Set configuration value by key."""
-        keys = key.split('.')
-        config = self._config
-        for k in keys[:-1]:
-            config = config.setdefault(k, {})
-        config[keys[-1]] = value
+        """Set configuration value by key, publishing a new snapshot."""
+        with self._lock:
+            old = self._snapshot
+            new = self._snapshot = old.with_value(key, value)
+        self._notify(old, new)
+
+    def reload(self) -> bool:
+        """Re-read the configuration file and publish it if it is valid.
+
+        An invalid or unreadable file leaves the current snapshot in place.
+        Returns True if a new snapshot was published.
+        """
+        try:
+            snapshot = self._load_config()
+        except Exception as e:
+            logger.error(f"Configuration reload rejected: {e}")
+            return False
+
+        with self._lock:
+            # The loader returns its cached snapshot while the file is unchanged.
+            if snapshot is self._loaded:
+                return False
+            self._loaded = snapshot
+            old = self._snapshot
+            # Keep versions increasing across set() and reloads.
+            new = self._snapshot = ConfigSnapshot(snapshot.data, old.version + 1)
+        logger.info(f"Configuration reloaded (version {new.version})")
+        self._notify(old, new)
+        return True
+
+    def subscribe(self, listener: ConfigListener) -> None:
+        """Call ``listener(old, new)`` whenever a new snapshot is published.
+
+        Bound methods are held weakly, so subscribing does not keep their
+        object alive.
+        """
+        ref = weakref.WeakMethod(listener) if hasattr(listener, "__self__") else (lambda: listener)
+        with self._lock:
+            self._listeners.append(ref)
+
+    def unsubscribe(self, listener: ConfigListener) -> None:
+        """Stop notifying a listener."""
+        with self._lock:
+            self._listeners = [ref for ref in self._listeners if ref() not in (None, listener)]
+
+    def _notify(self, old: ConfigSnapshot, new: ConfigSnapshot) -> None:
+        """Call live listeners, dropping the ones that were garbage collected."""
+        with self._lock:
+            self._listeners = [ref for ref in self._listeners if ref() is not None]
+            listeners = [ref() for ref in self._listeners]
+        for listener in listeners:
+            if listener is None:
+                continue
+            try:
+                listener(old, new)
+            except Exception as e:
+                logger.error(f"Configuration listener failed: {e}")
+
+    def _get_section(self, key: str) -> Dict[str, Any]:
+        """Get a mutable copy of a configuration section."""
+        return thaw(self._snapshot.get(key, {}))
 
     def get_api_config(self, service_name: str) -> Dict[str, Any]:
         """Get API configuration for a specific service."""
-        return self.get(f"api.{service_name}", {})
+        return self._get_section(f"api.{service_name}")
 
     def get_workflow_config(self) -> Dict[str, Any]:
         """Get workflow configuration."""
-        return self.get("workflow", {})
+        return self._get_section("workflow")
 
     def get_output_config(self) -> Dict[str, Any]:
         """Get output configuration."""
-        return self.get("output", {})
+        return self._get_section("output")
 
     def get_logging_config(self) -> Dict[str, Any]:
         """Get logging configuration."""
-        return self.get("logging", {})
+        return self._get_section("logging")
+
+    def get_metrics_config(self) -> Dict[str, Any]:
+        """Get metrics configuration."""
+        return self._get_section("metrics")
 
     def get_mode_config(self, mode: str) -> Dict[str, Any]:
         """Get configuration for a specific processing mode."""
-        return self.get(f"modes.{mode}", {}) 
\ No newline at end of file
+        return self._get_section(f"modes.{mode}")
@@ -1,36 +1,177 @@
 """Core application module."""
 
 import os
-import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
-from .video_processor import VideoProcessor
-from .content_generator import ContentGenerator
+from .video_processor import VideoMetadata, VideoProcessor, extract_video_id
+from .content_generator import BlogPost, ContentGenerator
 from .output_manager import OutputManager
+from .visual_summary import VisualSummarizer
+from ..config.config_watcher import DEFAULT_POLL_INTERVAL, ConfigWatcher
+from ..config.configuration_manager import load_config
+from ..utils.log_context import log_context, new_run_id, run_id_var, timed_stage
 from ..utils.logger import Logger
+from ..utils.profiling import video_profiler
+from ..utils.single_flight import flights
+
+# Mode -> its profile under ``modes`` in the configuration.
+MODE_PROFILES = {'quick': 'quick_summary', 'detailed': 'detailed_review', 'visual': 'visual_review'}
+
+class AppComponents:
+    """The components built from one version of the configuration.
+    
+    A job holds on to one instance from start to finish, so a config
+    reload never changes settings underneath it.
+    """
+    
+    def __init__(self, config: Dict[str, Any], logger: Logger):
+        self.config = config
+        self.logger = logger
+        self.video_processor = VideoProcessor(config)
+        self.content_generator = ContentGenerator(config)
+        self.output_manager = OutputManager(config)
+        self._visual_summarizer = None
+    
+    @property
+    def visual_summarizer(self) -> VisualSummarizer:
+        """Summariser for visual mode, created on first use."""
+        if self._visual_summarizer is None:
+            self._visual_summarizer = VisualSummarizer(self.config)
+        return self._visual_summarizer
+    
+    def include_transcript(self, mode: str) -> bool:
+        """Whether a mode uses the transcript, per its profile's
+        ``include_transcript``.
+        
+        Quick summaries are written from the title and description, so
+        unless their profile says otherwise the transcript is not fetched.
+        """
+        profile = self.config.get('modes', {}).get(MODE_PROFILES.get(mode, mode)) or {}
+        return profile.get('include_transcript', mode != 'quick')
+    
+    def generate_content(
+        self,
+        metadata: VideoMetadata,
+        mode: str = 'quick',
+        video_path: Optional[str] = None
+    ) -> BlogPost:
+        """Generate blog content for the given mode.
+        
+        Visual mode is a detailed review enriched with a per-scene summary
+        of the objects detected in ``video_path``, a local copy of the
+        video. If the visual analysis fails, the review is generated
+        without it.
+        
+        Concurrent requests for the same video, mode and model settings
+        share one generation.
+        """
+        api_config = self.config['api']['openai']
+        params = (
+            mode, video_path, api_config.get('api_url'), api_config.get('model'),
+            api_config.get('temperature'), api_config.get('max_tokens')
+        )
+        return flights.do(
+            metadata.video_id, 'generate_content', params,
+            lambda: self._generate_content(metadata, mode, video_path)
+        )
+    
+    def _generate_content(
+        self,
+        metadata: VideoMetadata,
+        mode: str,
+        video_path: Optional[str]
+    ) -> BlogPost:
+        if mode == 'quick':
+            return self.content_generator.generate_quick_summary(metadata)
+        
+        visual_summary = None
+        if mode == 'visual':
+            if not video_path:
+                raise ValueError("Visual mode requires a local video file")
+            try:
+                visual_summary = self.visual_summarizer.summary_text(video_path)
+            except Exception as e:
+                self.logger.warning(f"Visual analysis failed, continuing without it: {str(e)}")
+        return self.content_generator.generate_detailed_review(metadata, visual_summary)
 
 class App:
-    """Core application class."""
+    """Core application class.
+    
+    Components are rebuilt by ``reload_config`` and swapped in atomically;
+    jobs already running keep the components they started with.
+    """
     
     def __init__(self, config_path: str = 'config.yaml'):
         """Initialize the application."""
         self.config_path = config_path
-        self.config = self._load_config()
         self.logger = Logger()
-        
-        # Initialize components
-        self.video_processor = VideoProcessor(self.config)
-        self.content_generator = ContentGenerator(self.config)
-        self.output_manager = OutputManager(self.config)
+        self._components = AppComponents(self._load_config(), self.logger)
+        self._watcher: Optional[ConfigWatcher] = None
+    
+    @property
+    def components(self) -> AppComponents:
+        """Components for the current configuration."""
+        return self._components
+    
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Current configuration."""
+        return self._components.config
+    
+    @property
+    def video_processor(self) -> VideoProcessor:
+        """Current video processor."""
+        return self._components.video_processor
+    
+    @property
+    def content_generator(self) -> ContentGenerator:
+        """Current content generator."""
+        return self._components.content_generator
+    
+    @property
+    def output_manager(self) -> OutputManager:
+        """Current output manager."""
+        return self._components.output_manager
+    
+    @property
+    def visual_summarizer(self) -> VisualSummarizer:
+        """Current visual summariser."""
+        return self._components.visual_summarizer
     
     def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from YAML file."""
+        """Load the shared, validated configuration (read-only)."""
         try:
-            with open(self.config_path, 'r') as f:
-                return yaml.safe_load(f)
+            return load_config(self.config_path).data
         except Exception as e:
             raise RuntimeError(f"Failed to load configuration: {str(e)}")
     
+    def reload_config(self) -> bool:
+        """Re-read the configuration file and rebuild the components.
+        
+        The new components replace the old ones only if the file loads,
+        validates and every component accepts it. Returns True on success.
+        """
+        try:
+            components = AppComponents(self._load_config(), self.logger)
+        except Exception as e:
+            self.logger.error(f"Configuration reload rejected: {str(e)}")
+            return False
+        self._components = components
+        self.logger.info(f"Reloaded configuration from {self.config_path}")
+        return True
+    
+    def watch_config(self, interval: float = DEFAULT_POLL_INTERVAL) -> ConfigWatcher:
+        """Reload the configuration whenever its file changes."""
+        if self._watcher is None:
+            self._watcher = ConfigWatcher(self.config_path, self.reload_config, interval)
+        return self._watcher.start()
+    
+    def stop_watching_config(self) -> None:
+        """Stop the watcher started by ``watch_config``."""
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+    
     def initialize_paths(self) -> None:
         """Initialize application directories."""
         paths = self.config.get('paths', {})
@@ -38,28 +179,52 @@ class App:
             path = Path(path_value)
             path.mkdir(parents=True, exist_ok=True)
     
-    def process_video(self, url: str, mode: str = 'quick') -> Optional[Dict[str, str]]:
-        """Process a YouTube video and generate blog content."""
-        try:
-            # Extract video metadata
-            self.logger.info(f"Processing video: {url}")
-            metadata = self.video_processor.extract_metadata(url)
-            self.logger.info(f"Extracted metadata for: {metadata.title}")
-            
-            # Generate content based on mode
-            if mode == 'quick':
-                blog_post = self.content_generator.generate_quick_summary(metadata)
-            else:
-                blog_post = self.content_generator.generate_detailed_review(metadata)
-            
-            self.logger.info("Generated blog post content")
-            
-            # Save in configured formats
-            output_files = self.output_manager.save_all_formats(blog_post)
-            self.logger.info(f"Saved blog post in formats: {', '.join(output_files.keys())}")
-            
-            return output_files
-            
-        except Exception as e:
-            self.logger.error(f"Error processing video: {str(e)}")
-            raise 
\ No newline at end of file
+    def generate_content(
+        self,
+        metadata: VideoMetadata,
+        mode: str = 'quick',
+        video_path: Optional[str] = None
+    ) -> BlogPost:
+        """Generate blog content for the given mode (see AppComponents)."""
+        return self._components.generate_content(metadata, mode, video_path)
+    
+    def process_video(
+        self,
+        url: str,
+        mode: str = 'quick',
+        video_path: Optional[str] = None
+    ) -> Optional[Dict[str, str]]:
+        """Process a YouTube video and generate blog content.
+        
+        The run is profiled if requested (see ``utils.profiling``).
+        """
+        components = self._components
+        run_id = run_id_var.get() or new_run_id()
+        video_id = extract_video_id(url)
+        with log_context(run_id=run_id, video_id=video_id), \
+                video_profiler(components.config, f"{run_id}_{video_id or 'video'}", video_id):
+            try:
+                # Extract video metadata
+                self.logger.info(f"Processing video: {url}")
+                with timed_stage("extract_metadata"):
+                    metadata = components.video_processor.extract_metadata(
+                        url, components.include_transcript(mode)
+                    )
+                self.logger.info(f"Extracted metadata for: {metadata.title}")
+                
+                # Generate content based on mode
+                with timed_stage("generate_content", mode=mode):
+                    blog_post = components.generate_content(metadata, mode, video_path)
+                
+                self.logger.info("Generated blog post content")
+                
+                # Save in configured formats
+                with timed_stage("save_output"):
+                    output_files = components.output_manager.save_all_formats(blog_post)
+                self.logger.info(f"Saved blog post in formats: {', '.join(output_files.keys())}")
+                
+                return output_files
+                
+            except Exception as e:
+                self.logger.error(f"Error processing video: {str(e)}")
+                raise 
\ No newline at end of file
@@ -3,8 +3,11 @@
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 import json
+import time
 import requests
 from .video_processor import VideoMetadata
+from ..utils.cassette import get_cassette, request_key
+from ..utils.metrics import LLM_REQUEST_SECONDS, LLM_TOKENS
 import re
 
 @dataclass
@@ -31,6 +34,13 @@ class ContentGenerator:
             "HTTP-Referer": "https://github.com/yourusername/agenticFunProject",  # Replace with your actual repo URL
             "Content-Type": "application/json"
         }
+        self.cassette = get_cassette(config)
+    
+    def _post(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a chat completion request and return the decoded response."""
+        response = requests.post(self.api_url, headers=self.headers, json=payload)
+        response.raise_for_status()
+        return response.json()
     
     def _make_api_request(self, prompt: str) -> str:
         """Make a request to OpenRouter API."""
@@ -41,10 +51,25 @@ class ContentGenerator:
             "max_tokens": self.config['api']['openai']['max_tokens']
         }
         
-        response = requests.post(self.api_url, headers=self.headers, json=payload)
-        response.raise_for_status()
+        model = payload["model"]
+        started = time.perf_counter()
+        status = "error"
+        try:
+            if self.cassette is None:
+                data = self._post(payload)
+            else:
+                data = self.cassette.call('llm', request_key(self.api_url, payload), lambda: self._post(payload))
+            status = "ok"
+        finally:
+            LLM_REQUEST_SECONDS.observe(time.perf_counter() - started, model=model, status=status)
         
-        return response.json()['choices'][0]['message']['content']
+        usage = data.get('usage') or {}
+        for kind in ("prompt", "completion"):
+            tokens = usage.get(f"{kind}_tokens")
+            if isinstance(tokens, int):
+                LLM_TOKENS.inc(tokens, model=model, kind=kind)
+        
+        return data['choices'][0]['message']['content']
     
     def _clean_section_markers(self, text: str) -> str:
         """Remove section markers from text."""
@@ -126,14 +151,30 @@ List 3-5 actionable takeaways, one per line."""
             actionable_takeaways=parsed.get('actionable_takeaways', ["Watch the video for more details"])
         )
     
-    def generate_detailed_review(self, metadata: VideoMetadata) -> BlogPost:
-        """Generate a detailed review of the video."""
+    def generate_detailed_review(
+        self,
+        metadata: VideoMetadata,
+        visual_summary: Optional[str] = None
+    ) -> BlogPost:
+        """Generate a detailed review of the video.
+
+        ``visual_summary`` lists the objects detected per scene (see
+        ``VisualSummarizer``) and is added to the prompt when given.
+        """
+        visual_section = ""
+        if visual_summary:
+            visual_section = f"""
+Visual analysis (objects detected on screen, per scene):
+{visual_summary}
+
+Where relevant, refer to what is shown on screen in the post.
+"""
         prompt = f"""Create a comprehensive, long-form blog post about this YouTube video:
 Title: {metadata.title}
 Description: {metadata.description}
 Channel: {metadata.channel}
 Transcript: {metadata.transcript if metadata.transcript else 'No transcript available'}
-
+{visual_section}
 Please write a detailed blog post in the following format:
 
 [Title]
@@ -2,13 +2,12 @@
 
 import os
 from datetime import datetime
-from typing import Dict, Any
+from typing import Callable, Dict, Any, List, Optional
 from pathlib import Path
 import markdown
 import jinja2
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter
 from .content_generator import BlogPost
+from ..utils.metrics import OUTPUT_BYTES, OUTPUT_SAVE_SECONDS
 import json
 import re
 
@@ -121,6 +120,9 @@ class OutputManager:
         filepath = self.blog_dir / filename
         
         try:
+            from reportlab.pdfgen import canvas
+            from reportlab.lib.pagesizes import letter
+
             # Render content using template
             content = self.templates['pdf'].render(
                 title=blog_post.title,
@@ -150,20 +152,27 @@ class OutputManager:
         except Exception as e:
             raise RuntimeError(f"Failed to save PDF: {str(e)}")
     
-    def save_all_formats(self, blog_post: BlogPost) -> Dict[str, str]:
-        """Save blog post in all configured formats."""
+    def _timed_save(self, format: str, save: Callable[[BlogPost], str], blog_post: BlogPost) -> str:
+        """Run one save, recording its duration and the bytes written."""
+        with OUTPUT_SAVE_SECONDS.time(format=format):
+            filepath = save(blog_post)
+        OUTPUT_BYTES.inc(os.path.getsize(filepath), format=format)
+        return filepath
+    
+    def save_all_formats(self, blog_post: BlogPost, formats: Optional[List[str]] = None) -> Dict[str, str]:
+        """Save blog post in all configured formats, or only in ``formats``."""
         results = {}
         
         # Save metadata first
-        results['metadata'] = self.save_metadata(blog_post)
+        results['metadata'] = self._timed_save('metadata', self.save_metadata, blog_post)
         
         # Save blog content in different formats
-        for format in self.config['output']['formats']:
+        for format in formats if formats is not None else self.config['output']['formats']:
             if format == 'markdown':
-                results['markdown'] = self.save_markdown(blog_post)
+                results['markdown'] = self._timed_save(format, self.save_markdown, blog_post)
             elif format == 'html':
-                results['html'] = self.save_html(blog_post)
+                results['html'] = self._timed_save(format, self.save_html, blog_post)
             elif format == 'pdf':
-                results['pdf'] = self.save_pdf(blog_post)
+                results['pdf'] = self._timed_save(format, self.save_pdf, blog_post)
         
         return results 
\ No newline at end of file
@@ -1,23 +1,99 @@
 """Video processing module."""
 
-import yt_dlp
-from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+import re
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, Any, Iterator, Optional, List, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
 from loguru import logger
+from ..config.configuration_manager import thaw
+from ..utils.cassette import get_cassette, request_key
+from ..utils.constants import DEFAULT_TEMP_DIR
+from ..utils.single_flight import flights
+
+_VIDEO_ID_PATTERN = re.compile(
+    r'(?:v=|/shorts/|/embed/|/live/|youtu\.be/)([A-Za-z0-9_-]{11})'
+)
+_COLLECTION_PATTERN = re.compile(
+    r'youtube\.com/(?:@|channel/|c/|user/|playlist\b)|[?&]list='
+)
+WATCH_URL = 'https://www.youtube.com/watch?v={}'
+
+# yt-dlp info fields kept in cassettes; full info dicts are hundreds of KB.
+CASSETTE_INFO_KEYS = ('id', 'title', 'description', 'duration', 'upload_date', 'channel')
+
+def extract_video_id(url: str) -> Optional[str]:
+    """Extract the 11-character YouTube video ID from a URL, if present."""
+    match = _VIDEO_ID_PATTERN.search(url)
+    return match.group(1) if match else None
+
+def is_collection_url(url: str) -> bool:
+    """Whether a URL names a playlist or channel rather than one video."""
+    return extract_video_id(url) is None and bool(_COLLECTION_PATTERN.search(url))
+
+# (transcript_text, language_code, is_auto_generated)
+TranscriptResult = Tuple[str, str, bool]
+
+# Config sections a transcript fetch needs; only these travel with pickled
+# metadata, never API keys.
+TRANSCRIPT_CONFIG_KEYS = ('transcript', 'speech', 'cassettes', 'download', 'paths')
 
 @dataclass
 class VideoMetadata:
-    """Video metadata container."""
+    """Video metadata container.
+    
+    The transcript is loaded on first access of ``transcript``,
+    ``transcript_language`` or ``is_auto_generated`` by calling
+    ``transcript_loader``; without a loader there is no transcript. The
+    loaders made by ``VideoProcessor`` pickle, so metadata can be handed to
+    another process before its transcript is loaded; call
+    ``load_transcript`` first to hand it over with the transcript.
+    """
     title: str
     description: str
     duration: int
     upload_date: str
     channel: str
-    transcript: Optional[str] = None
-    transcript_language: Optional[str] = None
-    is_auto_generated: bool = False
+    video_id: Optional[str] = None
+    transcript_loader: Optional[Callable[[], Optional[TranscriptResult]]] = field(
+        default=None, repr=False, compare=False
+    )
+    _transcript: Optional[TranscriptResult] = field(default=None, init=False, repr=False, compare=False)
+    _transcript_loaded: bool = field(default=False, init=False, repr=False, compare=False)
+    
+    def _load_transcript(self) -> Optional[TranscriptResult]:
+        if not self._transcript_loaded:
+            if self.transcript_loader is not None:
+                self._transcript = self.transcript_loader()
+            self._transcript_loaded = True
+            self.transcript_loader = None
+        return self._transcript
+    
+    def load_transcript(self) -> 'VideoMetadata':
+        """Load the transcript now, if it has not been loaded; returns self."""
+        self._load_transcript()
+        return self
+    
+    @property
+    def transcript_loaded(self) -> bool:
+        """Whether the transcript has been loaded (or there is none to load)."""
+        return self._transcript_loaded or self.transcript_loader is None
+    
+    @property
+    def transcript(self) -> Optional[str]:
+        result = self._load_transcript()
+        return result[0] if result else None
+    
+    @property
+    def transcript_language(self) -> Optional[str]:
+        result = self._load_transcript()
+        return result[1] if result else None
+    
+    @property
+    def is_auto_generated(self) -> bool:
+        result = self._load_transcript()
+        return bool(result and result[2])
 
 class VideoProcessor:
     """Handles YouTube video processing."""
@@ -26,18 +102,22 @@ class VideoProcessor:
         """Initialize the video processor."""
         self.config = config
         self.preferred_languages = config.get('transcript', {}).get('preferred_languages', ['en'])
+        self.speech_config = config.get('speech', {}) or {}
+        self.cassette = get_cassette(config)
     
     def validate_url(self, url: str) -> bool:
         """Validate YouTube URL format."""
         return 'youtube.com' in url or 'youtu.be' in url
     
-    def _get_transcript(self, video_id: str) -> Optional[tuple[str, str, bool]]:
+    def _get_transcript(self, video_id: str) -> Optional[TranscriptResult]:
         """Get transcript for a video, trying multiple languages if needed.
         
         Returns:
             Tuple of (transcript_text, language_code, is_auto_generated)
             or None if no transcript is available.
         """
+        from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
+
         try:
             # First try to get manual captions
             transcript_list = YouTubeTranscriptApi.get_transcript(video_id, languages=self.preferred_languages)
@@ -51,51 +131,213 @@ class VideoProcessor:
                 logger.warning(f"Failed to get transcript for video {video_id}: {str(e)}")
                 return None
     
-    def extract_metadata(self, url: str) -> VideoMetadata:
-        """Extract video metadata and transcript."""
-        if not self.validate_url(url):
-            raise ValueError("Invalid YouTube URL")
+    def _extract_info(self, url: str) -> Optional[Dict[str, Any]]:
+        """Extract video info using yt-dlp."""
+        import yt_dlp
+
+        ydl_opts = {
+            'quiet': True,
+            'no_warnings': True,
+            'extract_flat': False,  # Changed to False to get full metadata
+            'noplaylist': True  # watch?v=...&list=... means the video, not its playlist
+        }
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            return ydl.extract_info(url, download=False)
+    
+    def iter_video_urls(self, url: str) -> Iterator[str]:
+        """Watch URLs of the videos in a playlist or channel, lazily.
+        
+        A single-video URL yields itself. See ``iter_entries``.
+        """
+        if not is_collection_url(url):
+            yield url
+            return
+        for entry in self.iter_entries(url):
+            yield WATCH_URL.format(entry['id'])
+    
+    def iter_entries(self, url: str) -> Iterator[Dict[str, Any]]:
+        """Flat yt-dlp entries (``id``, ``title``, sometimes ``upload_date``
+        or ``timestamp``) of the videos in a playlist or channel, lazily.
         
-        # Extract video info using yt-dlp
+        Uses a flat extraction, so yt-dlp fetches one listing page at a
+        time as the iterator is consumed and never resolves the videos
+        themselves. Channel tabs are listed in turn.
+        """
+        import yt_dlp
+
         ydl_opts = {
             'quiet': True,
             'no_warnings': True,
-            'extract_flat': False  # Changed to False to get full metadata
+            'extract_flat': 'in_playlist',
+            'lazy_playlist': True
         }
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            info = ydl.extract_info(url, download=False, process=False)
+            yield from self._flat_entries(ydl, info)
+    
+    def _flat_entries(self, ydl: Any, info: Optional[Dict[str, Any]], depth: int = 0) -> Iterator[Dict[str, Any]]:
+        """Video entries in a flat playlist result, following channel tabs."""
+        if not info:
+            return
+        entries = info.get('entries')
+        if entries is None:
+            if info.get('_type') in ('url', 'url_transparent') and depth < 2:
+                # A channel's home page points at its tabs (Videos, Shorts, ...)
+                nested = ydl.extract_info(info['url'], download=False, process=False)
+                yield from self._flat_entries(ydl, nested, depth + 1)
+            elif info.get('id') and info.get('_type', 'video') == 'video':
+                yield info
+            return
+        for entry in entries:
+            if not entry:
+                continue
+            if entry.get('_type') == 'playlist' or entry.get('ie_key') == 'YoutubeTab':
+                if depth < 2:
+                    yield from self._flat_entries(ydl, entry if 'entries' in entry else {
+                        '_type': 'url', 'url': entry.get('url')
+                    }, depth + 1)
+            elif entry.get('id'):
+                yield entry
+    
+    def _fetch_info(self, url: str) -> Optional[Dict[str, Any]]:
+        """Video info, recorded to or replayed from the cassette if one is set."""
+        if self.cassette is None:
+            return self._extract_info(url)
+        
+        def fetch() -> Optional[Dict[str, Any]]:
+            info = self._extract_info(url)
+            return {key: info.get(key) for key in CASSETTE_INFO_KEYS if key in info} if info else None
+        
+        return self.cassette.call('yt_dlp', request_key(url), fetch)
+    
+    def _fetch_transcript(self, video_id: str) -> Optional[TranscriptResult]:
+        """Transcript, recorded to or replayed from the cassette if one is set."""
+        if self.cassette is None:
+            return self._get_transcript(video_id)
+        return self.cassette.call(
+            'transcript',
+            request_key(video_id, self.preferred_languages),
+            lambda: self._get_transcript(video_id)
+        )
+    
+    def _speech_transcript(self, url: str) -> Optional[TranscriptResult]:
+        """Transcribe a video's audio locally when it has no captions.
+        
+        Returns:
+            Tuple of (transcript_text, language_code, True), or None if the
+            audio could not be downloaded or transcribed.
+        """
+        from ..external_integration.speech import SpeechTranscriber
+        from ..external_integration.youtube import download_limits, download_media
+
+        _, max_filesize = download_limits(self.config)
+        temp_dir = Path(self.config.get('paths', {}).get('temp_dir', DEFAULT_TEMP_DIR))
+        try:
+            temp_dir.mkdir(parents=True, exist_ok=True)
+            # The audio is only needed until it is transcribed
+            with tempfile.TemporaryDirectory(prefix='speech_', dir=temp_dir) as directory:
+                audio_path = download_media(url, directory, max_filesize=max_filesize)
+                transcript = SpeechTranscriber(self.speech_config).transcribe_file(audio_path)
+        except Exception as e:
+            logger.warning(f"Speech recognition failed for {url}: {str(e)}")
+            return None
+        if not transcript.text:
+            return None
+        return transcript.text, transcript.language or self.speech_config.get('language') or 'unknown', True
+    
+    def _fetch_speech_transcript(self, url: str, video_id: str) -> Optional[TranscriptResult]:
+        """Speech transcript, recorded to or replayed from the cassette if one is set."""
+        if self.cassette is None:
+            return self._speech_transcript(url)
+        return self.cassette.call(
+            'speech',
+            request_key(video_id, self.speech_config.get('backend'), self.speech_config.get('model')),
+            lambda: self._speech_transcript(url)
+        )
+    
+    def load_transcript(self, video_id: str) -> Optional[TranscriptResult]:
+        """Fetch a video's captions, or transcribe its audio if it has none
+        and ``speech.enabled`` is set.
+        
+        Concurrent loads for the same video share one fetch.
+        """
+        transcript_result = flights.do(
+            video_id, 'transcript', tuple(self.preferred_languages),
+            lambda: self._fetch_transcript(video_id)
+        )
+        if not transcript_result and self.speech_config.get('enabled'):
+            logger.info("No captions available; transcribing the audio")
+            transcript_result = flights.do(
+                video_id, 'speech', (),
+                lambda: self._fetch_speech_transcript(WATCH_URL.format(video_id), video_id)
+            )
+        
+        if transcript_result:
+            _, transcript_language, is_auto_generated = transcript_result
+            if is_auto_generated:
+                logger.info(f"Using auto-generated transcript in {transcript_language}")
+            else:
+                logger.info(f"Using manual transcript in {transcript_language}")
+            return tuple(transcript_result)
+        return None
+    
+    def extract_metadata(self, url: str, include_transcript: bool = True) -> VideoMetadata:
+        """Extract video metadata.
+        
+        The transcript is not fetched here but on first use of
+        ``VideoMetadata.transcript``; with ``include_transcript=False`` it
+        is never fetched.
+        """
+        if not self.validate_url(url):
+            raise ValueError("Invalid YouTube URL")
+        if is_collection_url(url):
+            raise ValueError("URL is a playlist or channel; expand it with iter_video_urls")
         
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                if not info:
-                    raise ValueError("Failed to extract video information")
-                
-                # Get transcript if available
-                transcript_result = self._get_transcript(info['id'])
-                transcript = None
-                transcript_language = None
-                is_auto_generated = False
-                
-                if transcript_result:
-                    transcript, transcript_language, is_auto_generated = transcript_result
-                    if is_auto_generated:
-                        logger.info(f"Using auto-generated transcript in {transcript_language}")
-                    else:
-                        logger.info(f"Using manual transcript in {transcript_language}")
-                
-                # Extract and validate required fields
-                title = info.get('title')
-                if not title:
-                    raise ValueError("Video title not found")
-                
-                return VideoMetadata(
-                    title=title,
-                    description=info.get('description', 'No description available'),
-                    duration=info.get('duration', 0),
-                    upload_date=info.get('upload_date', datetime.now().strftime('%Y%m%d')),
-                    channel=info.get('channel', 'Unknown channel'),
-                    transcript=transcript,
-                    transcript_language=transcript_language,
-                    is_auto_generated=is_auto_generated
-                )
+            # Concurrent requests for the same video share one fetch
+            info = flights.do(extract_video_id(url), 'metadata', (), lambda: self._fetch_info(url))
+            if not info:
+                raise ValueError("Failed to extract video information")
+            
+            # Extract and validate required fields
+            title = info.get('title')
+            if not title:
+                raise ValueError("Video title not found")
+            
+            return VideoMetadata(
+                title=title,
+                description=info.get('description', 'No description available'),
+                duration=info.get('duration', 0),
+                upload_date=info.get('upload_date', datetime.now().strftime('%Y%m%d')),
+                channel=info.get('channel', 'Unknown channel'),
+                video_id=info.get('id'),
+                transcript_loader=TranscriptLoader(self, info['id']) if include_transcript else None
+            )
         except Exception as e:
-            raise ValueError(f"Failed to process video: {str(e)}") 
\ No newline at end of file
+            raise ValueError(f"Failed to process video: {str(e)}")
+
+class TranscriptLoader:
+    """Loads one video's transcript for ``VideoMetadata``.
+    
+    Pickles as the video ID and the ``TRANSCRIPT_CONFIG_KEYS`` sections of
+    the config; an unpickled loader builds its own ``VideoProcessor``.
+    """
+    
+    def __init__(self, processor: VideoProcessor, video_id: str):
+        self.video_id = video_id
+        self.config = {
+            key: thaw(processor.config[key]) for key in TRANSCRIPT_CONFIG_KEYS if key in processor.config
+        }
+        self._processor: Optional[VideoProcessor] = processor
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        return {'video_id': self.video_id, 'config': self.config}
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._processor = None
+    
+    def __call__(self) -> Optional[TranscriptResult]:
+        if self._processor is None:
+            self._processor = VideoProcessor(self.config)
+        return self._processor.load_transcript(self.video_id)
@@ -0,0 +1,161 @@
+"""Per-scene summaries of the objects detected in a local video file."""
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+from ..utils.logger import Logger
+from ..utils.metrics import CACHE_REQUESTS
+
+DEFAULT_CACHE_DIR = ".cache/visual_summaries"
+DEFAULT_MAX_SCENES = 20
+HASH_CHUNK_SIZE = 1 << 20
+# Analysis settings that change the result and so belong in the cache key.
+CACHE_KEY_SETTINGS = (
+    "model",
+    "confidence_threshold",
+    "sample_interval",
+    "max_key_frames",
+    "scene_change_threshold"
+)
+
+@dataclass
+class Scene:
+    """Objects visible between two scene changes.
+
+    ``objects`` maps class name to the most instances seen in one frame.
+    """
+    start: float
+    end: float
+    objects: Dict[str, int] = field(default_factory=dict)
+
+def file_hash(path: str) -> str:
+    """SHA-256 of a file's contents, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def build_scenes(detections: Any, key_frames: Sequence[Any], fps: float) -> List[Scene]:
+    """Group detections into scenes bounded by the key frames.
+
+    Key frames are kept on scene changes, so each one starts a new scene;
+    the first scene starts at the beginning of the video.
+    """
+    import numpy as np
+
+    if not len(detections):
+        return []
+
+    starts = sorted({0, *(frame.frame_index for frame in key_frames)})
+    last_frame = int(detections.frame_index.max())
+    starts = [start for start in starts if start <= last_frame]
+    scenes = [
+        Scene(start / fps, (end if end is not None else last_frame + 1) / fps)
+        for start, end in zip(starts, starts[1:] + [None])
+    ]
+
+    scene_ids = np.searchsorted(starts, detections.frame_index, side="right") - 1
+    keys = np.stack(
+        [scene_ids, detections.class_id.astype(np.int64), detections.frame_index],
+        axis=1
+    )
+    unique, counts = np.unique(keys, axis=0, return_counts=True)
+    for (scene_id, class_id, _), count in zip(unique, counts):
+        objects = scenes[scene_id].objects
+        name = detections.names.get(int(class_id), str(class_id))
+        objects[name] = max(objects.get(name, 0), int(count))
+    return [scene for scene in scenes if scene.objects]
+
+def _timestamp(seconds: float) -> str:
+    """Format seconds as m:ss."""
+    minutes, seconds = divmod(int(seconds), 60)
+    return f"{minutes}:{seconds:02d}"
+
+def format_summary(scenes: Sequence[Scene], max_scenes: int = DEFAULT_MAX_SCENES) -> str:
+    """Render scenes as one prompt line each, most populated first if truncated."""
+    if len(scenes) > max_scenes:
+        kept = sorted(scenes, key=lambda scene: sum(scene.objects.values()), reverse=True)[:max_scenes]
+        scenes = sorted(kept, key=lambda scene: scene.start)
+
+    lines = []
+    for number, scene in enumerate(scenes, start=1):
+        objects = ", ".join(
+            f"{name} x{count}"
+            for name, count in sorted(scene.objects.items(), key=lambda item: (-item[1], item[0]))
+        )
+        lines.append(f"Scene {number} ({_timestamp(scene.start)}-{_timestamp(scene.end)}): {objects}")
+    return "\n".join(lines)
+
+class VisualSummarizer:
+    """Summarises a video's detected objects per scene, cached by file hash.
+
+    Summaries are stored as JSON under ``modes.visual_review.cache_dir``,
+    keyed by the SHA-256 of the video and the analysis settings, so a repeat
+    run on the same file skips YOLO inference entirely.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self.yolo_config = config.get('api', {}).get('yolo', {})
+        visual_config = config.get('modes', {}).get('visual_review', {})
+        self.cache_dir = Path(visual_config.get('cache_dir', DEFAULT_CACHE_DIR))
+        self.max_scenes = visual_config.get('max_scenes', DEFAULT_MAX_SCENES)
+        self.logger = Logger()
+        self._adapter = None
+
+    def _cache_path(self, video_path: str) -> Path:
+        settings = json.dumps(
+            {key: self.yolo_config.get(key) for key in CACHE_KEY_SETTINGS}, sort_keys=True
+        )
+        settings_hash = hashlib.sha256(settings.encode()).hexdigest()[:12]
+        return self.cache_dir / f"{file_hash(video_path)}_{settings_hash}.json"
+
+    def _load_cached(self, cache_path: Path) -> Optional[List[Scene]]:
+        try:
+            with open(cache_path, 'r') as f:
+                return [Scene(**scene) for scene in json.load(f)]
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError) as e:
+            self.logger.warning(f"Ignoring unreadable visual summary cache {cache_path}: {str(e)}")
+            return None
+
+    def _save_cached(self, cache_path: Path, scenes: List[Scene]) -> None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump([asdict(scene) for scene in scenes], f)
+        os.replace(tmp_path, cache_path)
+
+    def _analyze(self, video_path: str) -> List[Scene]:
+        """Run YOLO over the video and group its detections into scenes."""
+        if self._adapter is None:
+            from ..external_integration.yolo_adapter import YOLOAdapter
+
+            self._adapter = YOLOAdapter()
+            self._adapter.set_configuration(self.yolo_config)
+        with self._adapter.analyze_video(video_path) as insights:
+            return build_scenes(insights.detections, insights.key_frames, insights.fps)
+
+    def summarize(self, video_path: str) -> List[Scene]:
+        """Return the video's scenes, analysing it only on a cache miss."""
+        cache_path = self._cache_path(video_path)
+        scenes = self._load_cached(cache_path)
+        if scenes is not None:
+            CACHE_REQUESTS.inc(cache="visual_summary", result="hit")
+            self.logger.info(f"Using cached visual summary for {video_path}")
+            return scenes
+        CACHE_REQUESTS.inc(cache="visual_summary", result="miss")
+
+        self.logger.info(f"Analyzing video frames: {video_path}")
+        scenes = self._analyze(video_path)
+        self._save_cached(cache_path, scenes)
+        return scenes
+
+    def summary_text(self, video_path: str) -> str:
+        """Summary of the video formatted for a prompt."""
+        return format_summary(self.summarize(video_path), self.max_scenes)
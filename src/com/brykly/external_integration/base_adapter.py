@@ -1,16 +1,19 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
-from ..config.configuration_manager import ConfigurationManager
+from ..config.configuration_manager import ConfigSnapshot, ConfigurationManager, thaw
 from ..utils.logger import Logger
 
 class ExternalAPIAdapter(ABC):
     """Base class for all external API adapters."""
     
-    def __init__(self, service_name: str):
+    def __init__(self, service_name: str, config: Optional[ConfigSnapshot] = None):
         self.service_name = service_name
         self.config_manager = ConfigurationManager()
         self.logger = Logger()
-        self.config = self.config_manager.get_api_config(service_name)
+        if config is not None:
+            self.config = thaw(config.get(f"api.{service_name}", {}))
+        else:
+            self.config = self.config_manager.get_api_config(service_name)
         self._authenticated = False
 
     @abstractmethod
@@ -24,8 +27,13 @@ class ExternalAPIAdapter(ABC):
         pass
 
     def set_configuration(self, config: Dict[str, Any]) -> None:
-        """Update the adapter's configuration."""
-        self.config.update(config)
+        """Update the adapter's configuration.
+
+        The adapter's dict is replaced rather than updated in place, so the
+        shared configuration and any thread still reading the old settings
+        are unaffected.
+        """
+        self.config = {**self.config, **config}
         self._authenticated = False  # Reset authentication when config changes
 
     def validate_config(self, required_keys: list[str]) -> bool:
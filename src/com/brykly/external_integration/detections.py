@@ -0,0 +1,145 @@
+"""Columnar, NumPy-backed container for object detections."""
+
+import json
+from typing import Any, Dict, Iterator, List, Optional, Sequence, TextIO
+
+import numpy as np
+
+def _to_numpy(values: Any, dtype: Any) -> np.ndarray:
+    """Convert a tensor, array or sequence to a NumPy array."""
+    if hasattr(values, "cpu"):
+        values = values.cpu()
+    if hasattr(values, "numpy"):
+        values = values.numpy()
+    return np.asarray(values, dtype=dtype)
+
+class DetectedObject:
+    def __init__(self, class_name: str, confidence: float, bbox: List[float]):
+        self.class_name = class_name
+        self.confidence = confidence
+        self.bbox = bbox
+
+class Detections:
+    """Detections stored as parallel arrays rather than one object per box.
+
+    Attributes:
+        frame_index: (N,) int64 frame number of each detection
+        class_id: (N,) int32 model class IDs
+        confidence: (N,) float32 detection confidences
+        boxes: (N, 4) float32 xyxy boxes in pixels
+        names: Mapping of class ID to class name
+    """
+
+    def __init__(
+        self,
+        frame_index: np.ndarray,
+        class_id: np.ndarray,
+        confidence: np.ndarray,
+        boxes: np.ndarray,
+        names: Optional[Dict[int, str]] = None
+    ):
+        self.frame_index = frame_index
+        self.class_id = class_id
+        self.confidence = confidence
+        self.boxes = boxes
+        self.names = dict(names or {})
+
+    @classmethod
+    def empty(cls, names: Optional[Dict[int, str]] = None) -> "Detections":
+        """Create a container with no detections."""
+        return cls(
+            np.empty(0, dtype=np.int64),
+            np.empty(0, dtype=np.int32),
+            np.empty(0, dtype=np.float32),
+            np.empty((0, 4), dtype=np.float32),
+            names
+        )
+
+    @classmethod
+    def from_result(cls, result: Any, frame_index: int = 0) -> "Detections":
+        """Build from one ultralytics ``Results`` object."""
+        boxes = result.boxes
+        class_id = _to_numpy(boxes.cls, np.int32).reshape(-1)
+        return cls(
+            np.full(len(class_id), frame_index, dtype=np.int64),
+            class_id,
+            _to_numpy(boxes.conf, np.float32).reshape(-1),
+            _to_numpy(boxes.xyxy, np.float32).reshape(-1, 4),
+            result.names
+        )
+
+    @classmethod
+    def concat(cls, parts: Sequence["Detections"]) -> "Detections":
+        """Concatenate several containers into one."""
+        if not parts:
+            return cls.empty()
+        names: Dict[int, str] = {}
+        for part in parts:
+            names.update(part.names)
+        return cls(
+            np.concatenate([part.frame_index for part in parts]),
+            np.concatenate([part.class_id for part in parts]),
+            np.concatenate([part.confidence for part in parts]),
+            np.concatenate([part.boxes for part in parts]),
+            names
+        )
+
+    def __len__(self) -> int:
+        return len(self.class_id)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate as DetectedObject instances, created on demand."""
+        for class_id, confidence, box in zip(self.class_id, self.confidence, self.boxes):
+            yield DetectedObject(self.names.get(int(class_id), str(class_id)), float(confidence), box.tolist())
+
+    def class_names(self) -> List[str]:
+        """Names of the distinct classes present."""
+        return [self.names.get(int(class_id), str(class_id)) for class_id in np.unique(self.class_id)]
+
+    def class_counts(self) -> Dict[str, int]:
+        """Number of detections per class name."""
+        if not len(self):
+            return {}
+        counts = np.bincount(self.class_id)
+        return {
+            self.names.get(class_id, str(class_id)): int(count)
+            for class_id, count in enumerate(counts)
+            if count
+        }
+
+    def timeline(self, fps: float, bin_seconds: float = 1.0) -> Dict[str, np.ndarray]:
+        """Detections per class in consecutive time bins.
+
+        Returns a mapping of class name to an array of counts, one entry
+        per ``bin_seconds`` of video up to the last detection.
+        """
+        if not len(self):
+            return {}
+        bins = (self.frame_index / (fps * bin_seconds)).astype(np.int64)
+        num_bins = int(bins.max()) + 1
+        timeline = {}
+        for class_id in np.unique(self.class_id):
+            mask = self.class_id == class_id
+            timeline[self.names.get(int(class_id), str(class_id))] = np.bincount(
+                bins[mask], minlength=num_bins
+            )
+        return timeline
+
+    def iter_dicts(self) -> Iterator[Dict[str, Any]]:
+        """Yield one JSON-ready dict per detection."""
+        for frame_index, obj in zip(self.frame_index, self):
+            yield {
+                "frame": int(frame_index),
+                "class": obj.class_name,
+                "confidence": obj.confidence,
+                "bbox": obj.bbox
+            }
+
+    def to_json(self, fp: TextIO) -> None:
+        """Stream detections to a file as a JSON array, one record at a time."""
+        fp.write("[")
+        for i, record in enumerate(self.iter_dicts()):
+            if i:
+                fp.write(",")
+            json.dump(record, fp)
+        fp.write("]")
@@ -0,0 +1,230 @@
+"""Bounded key frame selection and thumbnail storage for video analysis."""
+
+import io
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, FrozenSet, Iterable, List, Optional, Tuple, Union
+from PIL import Image
+
+DEFAULT_MAX_KEY_FRAMES = 20
+DEFAULT_THUMBNAIL_SIZE = (320, 180)
+DEFAULT_JPEG_QUALITY = 80
+DEFAULT_SCENE_CHANGE_THRESHOLD = 0.3
+HISTOGRAM_BINS = 32
+
+def remove_directories(directories: Iterable[Path]) -> None:
+    """Delete thumbnail directories and everything in them."""
+    for directory in directories:
+        shutil.rmtree(directory, ignore_errors=True)
+
+class KeyFrame:
+    """A downscaled, JPEG-compressed key frame.
+
+    The thumbnail is held either as compressed bytes or as a file on disk;
+    call ``load()`` to decode it into a PIL image when it is needed.
+    """
+
+    def __init__(
+        self,
+        frame_index: int,
+        timestamp: float,
+        score: float,
+        class_names: FrozenSet[str],
+        histogram: Any,
+        data: Optional[bytes] = None,
+        path: Optional[Path] = None
+    ):
+        self.frame_index = frame_index
+        self.timestamp = timestamp
+        self.score = score
+        self.class_names = class_names
+        self.histogram = histogram
+        self.data = data
+        self.path = path
+
+    @property
+    def size_bytes(self) -> int:
+        """Size of the compressed thumbnail."""
+        if self.data is not None:
+            return len(self.data)
+        return self.path.stat().st_size if self.path else 0
+
+    def load(self) -> Image.Image:
+        """Decode the thumbnail into a PIL image."""
+        source: Union[io.BytesIO, Path] = io.BytesIO(self.data) if self.data is not None else self.path
+        with Image.open(source) as image:
+            return image.convert("RGB")
+
+class KeyFrameStore:
+    """Keeps at most ``max_frames`` key frames chosen for novelty.
+
+    Each candidate is scored by how different its colour histogram is from
+    the frames already kept (scene change) plus how many of its detected
+    classes are not yet represented (detection diversity). Candidates that
+    are neither a scene change nor bring a new class are rejected; once the
+    store is full a better candidate replaces the lowest-scoring frame.
+    Memory use is bounded by ``max_frames`` thumbnails regardless of video
+    length. With ``directory`` set, thumbnails are written to disk and only
+    their paths are kept in memory; each store spools into its own new
+    subdirectory, so stores sharing ``directory`` never overwrite each
+    other's files. The store owns that subdirectory (listed in
+    ``directories``) and deletes it on ``close()``.
+    """
+
+    def __init__(
+        self,
+        max_frames: int = DEFAULT_MAX_KEY_FRAMES,
+        thumbnail_size: Tuple[int, int] = DEFAULT_THUMBNAIL_SIZE,
+        jpeg_quality: int = DEFAULT_JPEG_QUALITY,
+        scene_change_threshold: float = DEFAULT_SCENE_CHANGE_THRESHOLD,
+        directory: Optional[str] = None
+    ):
+        self.max_frames = max_frames
+        self.thumbnail_size = tuple(thumbnail_size)
+        self.jpeg_quality = jpeg_quality
+        self.scene_change_threshold = scene_change_threshold
+        self.directory = None
+        self.directories: List[Path] = []
+        if directory:
+            Path(directory).mkdir(parents=True, exist_ok=True)
+            self.directory = Path(tempfile.mkdtemp(prefix="key_frames_", dir=directory))
+            self.directories.append(self.directory)
+        self._frames: List[KeyFrame] = []
+
+    def close(self) -> None:
+        """Delete the thumbnail directories the store owns."""
+        remove_directories(self.directories)
+        self.directories = []
+
+    def __enter__(self) -> "KeyFrameStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def frames(self) -> List[KeyFrame]:
+        """Kept key frames in video order."""
+        return sorted(self._frames, key=lambda frame: frame.frame_index)
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def _histogram(self, frame: Any) -> Any:
+        """Normalised HSV hue/saturation histogram of a BGR frame."""
+        import cv2
+
+        small = cv2.resize(frame, (64, 36), interpolation=cv2.INTER_AREA)
+        hsv = cv2.cvtColor(small, cv2.COLOR_BGR2HSV)
+        histogram = cv2.calcHist(
+            [hsv], [0, 1], None, [HISTOGRAM_BINS, HISTOGRAM_BINS], [0, 180, 0, 256]
+        )
+        return cv2.normalize(histogram, histogram).flatten()
+
+    def _scene_change(self, histogram: Any) -> float:
+        """Distance in [0, 1] to the most similar kept frame."""
+        import cv2
+
+        if not self._frames:
+            return 1.0
+        return min(
+            cv2.compareHist(histogram, frame.histogram, cv2.HISTCMP_BHATTACHARYYA)
+            for frame in self._frames
+        )
+
+    def _new_classes(self, class_names: FrozenSet[str], exclude: Optional[KeyFrame] = None) -> int:
+        """Number of classes not represented by the kept frames."""
+        seen = set()
+        for frame in self._frames:
+            if frame is not exclude:
+                seen.update(frame.class_names)
+        return len(class_names - seen)
+
+    def _encode(self, frame: Any) -> bytes:
+        """Downscale a BGR frame and compress it to JPEG."""
+        import cv2
+
+        height, width = frame.shape[:2]
+        scale = min(self.thumbnail_size[0] / width, self.thumbnail_size[1] / height, 1.0)
+        if scale < 1.0:
+            frame = cv2.resize(
+                frame,
+                (max(1, int(width * scale)), max(1, int(height * scale))),
+                interpolation=cv2.INTER_AREA
+            )
+        ok, buffer = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality])
+        if not ok:
+            raise ValueError("Failed to encode key frame")
+        return buffer.tobytes()
+
+    def _admit(self, histogram: Any, class_names: FrozenSet[str]) -> Optional[float]:
+        """Score a candidate and make room for it.
+
+        Returns the candidate's score if it should be kept, evicting the
+        weakest frame when the store is full, or None if it is rejected.
+        """
+        if self.max_frames <= 0:
+            return None
+
+        scene_change = self._scene_change(histogram)
+        new_classes = self._new_classes(class_names)
+        if scene_change < self.scene_change_threshold and not new_classes:
+            return None
+
+        score = scene_change + new_classes
+        if len(self._frames) >= self.max_frames:
+            evicted = min(self._frames, key=lambda kept: kept.score)
+            # Never evict the only frame showing a class the candidate lacks.
+            if score <= evicted.score or self._new_classes(evicted.class_names - class_names, exclude=evicted):
+                return None
+            self._remove(evicted)
+        return score
+
+    def offer(
+        self,
+        frame: Any,
+        frame_index: int,
+        timestamp: float,
+        class_names: Iterable[str]
+    ) -> bool:
+        """Consider a BGR frame with detections as a key frame.
+
+        Returns True if the frame was kept.
+        """
+        class_names = frozenset(class_names)
+        histogram = self._histogram(frame)
+        score = self._admit(histogram, class_names)
+        if score is None:
+            return False
+
+        data = self._encode(frame)
+        key_frame = KeyFrame(frame_index, timestamp, score, class_names, histogram)
+        if self.directory:
+            key_frame.path = self.directory / f"frame_{frame_index:08d}.jpg"
+            key_frame.path.write_bytes(data)
+        else:
+            key_frame.data = data
+        self._frames.append(key_frame)
+        return True
+
+    def add(self, key_frame: KeyFrame) -> bool:
+        """Consider an already-encoded key frame, e.g. from another store.
+
+        The frame is re-scored against this store's contents. A rejected
+        frame's thumbnail file is deleted.
+        """
+        score = self._admit(key_frame.histogram, key_frame.class_names)
+        if score is None:
+            if key_frame.path:
+                key_frame.path.unlink(missing_ok=True)
+            return False
+        key_frame.score = score
+        self._frames.append(key_frame)
+        return True
+
+    def _remove(self, key_frame: KeyFrame) -> None:
+        """Drop a kept frame and its thumbnail file."""
+        self._frames.remove(key_frame)
+        if key_frame.path:
+            key_frame.path.unlink(missing_ok=True)
@@ -0,0 +1,112 @@
+"""Process-wide registry of loaded YOLO models."""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from ..utils.logger import Logger
+from ..utils.metrics import CACHE_REQUESTS
+
+DEFAULT_WARMUP_SIZE = 640
+
+ModelKey = Tuple[str, Optional[str]]
+
+def _load_yolo(model_path: str, device: Optional[str]) -> Any:
+    """Load YOLO weights, optionally moving them to a device."""
+    from ultralytics import YOLO
+
+    model = YOLO(model_path)
+    if device:
+        model.to(device)
+    return model
+
+class SharedModel:
+    """A loaded model shared between adapters.
+
+    Calls are serialised with a lock because ultralytics predictors keep
+    per-call state and are not safe to run concurrently on one instance.
+    """
+
+    def __init__(self, model: Any, model_path: str, device: Optional[str]):
+        self.model = model
+        self.model_path = model_path
+        self.device = device
+        self._lock = threading.Lock()
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            return self.model(*args, **kwargs)
+
+class ModelRegistry:
+    """Loads each (model path, device) once per process and shares it.
+
+    Models are warmed up with one inference at load time so the first real
+    request does not pay for lazy initialisation. Use ``evict`` or
+    ``clear`` to release memory.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            instance = super(ModelRegistry, cls).__new__(cls)
+            instance._models: Dict[ModelKey, SharedModel] = {}
+            instance._load_locks: Dict[ModelKey, threading.Lock] = {}
+            instance._lock = threading.Lock()
+            instance.logger = Logger()
+            cls._instance = instance
+        return cls._instance
+
+    def get(
+        self,
+        model_path: str,
+        device: Optional[str] = None,
+        warmup_size: Optional[int] = DEFAULT_WARMUP_SIZE
+    ) -> SharedModel:
+        """Return the shared model, loading and warming it up on first use.
+
+        Concurrent callers asking for the same model wait for one load.
+        Pass ``warmup_size=None`` to skip the warm-up inference.
+        """
+        key = (model_path, device)
+        model = self._models.get(key)
+        if model is not None:
+            CACHE_REQUESTS.inc(cache="model", result="hit")
+            return model
+
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+        with load_lock:
+            model = self._models.get(key)
+            if model is None:
+                CACHE_REQUESTS.inc(cache="model", result="miss")
+                started = time.perf_counter()
+                model = SharedModel(_load_yolo(model_path, device), model_path, device)
+                if warmup_size:
+                    self._warmup(model, warmup_size)
+                self._models[key] = model
+                self.logger.info(
+                    f"Loaded model {model_path} on {device or 'default device'} "
+                    f"in {time.perf_counter() - started:.2f}s"
+                )
+        return model
+
+    def _warmup(self, model: SharedModel, size: int) -> None:
+        """Run one inference on a blank frame."""
+        import numpy as np
+
+        model(np.zeros((size, size, 3), dtype=np.uint8), verbose=False)
+
+    def evict(self, model_path: str, device: Optional[str] = None) -> bool:
+        """Drop a model from the registry. Returns True if it was loaded."""
+        with self._lock:
+            self._load_locks.pop((model_path, device), None)
+            return self._models.pop((model_path, device), None) is not None
+
+    def clear(self) -> None:
+        """Drop every loaded model."""
+        with self._lock:
+            self._models.clear()
+            self._load_locks.clear()
+
+    def loaded(self) -> List[ModelKey]:
+        """Keys of the currently loaded models."""
+        return list(self._models)
@@ -1,9 +1,10 @@
 """OpenAI service module."""
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from .base_adapter import ExternalAPIAdapter
+from ..config.configuration_manager import ConfigSnapshot
 from ..utils.config import ConfigManager
 from ..utils.constants import (
     DEFAULT_OPENAI_MODEL,
@@ -16,10 +17,10 @@ logger = logging.getLogger(__name__)
 class OpenAIAdapter(ExternalAPIAdapter):
     """Service for interacting with OpenAI API."""
     
-    def __init__(self, config_path: str = 'config.yaml'):
+    def __init__(self, config_path: str = 'config.yaml', config: Optional[ConfigSnapshot] = None):
         """Initialize the OpenAI service."""
-        super().__init__('openai')
-        self.config = ConfigManager(config_path)
+        super().__init__('openai', config)
+        self.config = ConfigManager(config_path, config)
         self.api_key = self.config.get('openai', {}).get('api_key')
         if not self.api_key:
             raise ValueError("OpenAI API key not found in configuration")
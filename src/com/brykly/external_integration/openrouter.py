@@ -1,9 +1,10 @@
 """OpenRouter service module."""
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from .base_adapter import ExternalAPIAdapter
+from ..config.configuration_manager import ConfigSnapshot
 from ..utils.config import ConfigManager
 
 logger = logging.getLogger(__name__)
@@ -11,10 +12,10 @@ logger = logging.getLogger(__name__)
 class OpenRouterAdapter(ExternalAPIAdapter):
     """Service for interacting with OpenRouter API."""
     
-    def __init__(self, config_path: str = 'config.yaml'):
+    def __init__(self, config_path: str = 'config.yaml', config: Optional[ConfigSnapshot] = None):
         """Initialize the OpenRouter service."""
-        super().__init__('openrouter')
-        self.config = ConfigManager(config_path)
+        super().__init__('openrouter', config)
+        self.config = ConfigManager(config_path, config)
         self.api_key = self.config.get('openrouter', {}).get('api_key')
         if not self.api_key:
             raise ValueError("OpenRouter API key not found in configuration")
@@ -0,0 +1,325 @@
+"""Local speech-to-text for videos without captions.
+
+Audio is decoded to 16 kHz mono, split into chunks of about
+``chunk_seconds`` that end in the quietest moment near the target length
+(so words are not cut in half), and the chunks are transcribed in parallel
+by a process pool. The pool is shared by every transcription with the same
+settings and created on first use; its workers are spawned (not forked
+from a threaded parent) and each loads the model once. Segment times are
+shifted by their chunk's offset and merged in order.
+
+Backends are pluggable: ``speech.backend`` names a registered backend
+(``faster_whisper``, or ``tones``, a tiny deterministic backend used in
+tests) or a ``package.module:factory`` path. A factory takes the ``speech``
+config section and returns an object whose ``transcribe(audio, rate)``
+returns ``(segments, language)`` for a float32 mono array.
+"""
+
+import atexit
+import importlib
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import subprocess
+import threading
+import wave
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from ..config.configuration_manager import thaw
+from ..utils.exceptions import TranscriptError
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+DEFAULT_BACKEND = "faster_whisper"
+DEFAULT_CHUNK_SECONDS = 30.0
+DEFAULT_SEARCH_SECONDS = 5.0
+FRAME_SECONDS = 0.03
+
+@dataclass
+class Segment:
+    """Recognised text between two times, in seconds from the start."""
+    start: float
+    end: float
+    text: str
+
+@dataclass
+class SpeechTranscript:
+    """Merged result of transcribing every chunk."""
+    segments: List[Segment] = field(default_factory=list)
+    language: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        return " ".join(segment.text for segment in self.segments if segment.text)
+
+def _require(module: str) -> Any:
+    """Import a dependency of the ``speech`` extra, with a clear error if missing."""
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise TranscriptError(
+            f"{module} is required for speech recognition; install the 'speech' extra"
+        ) from e
+
+def load_audio(path: str, rate: int = SAMPLE_RATE) -> Any:
+    """Decode an audio or video file to a float32 mono array at ``rate``.
+
+    16-bit PCM WAV files at ``rate`` are read directly; anything else is
+    decoded with ffmpeg, which must be on the PATH.
+    """
+    np = _require("numpy")
+
+    if Path(path).suffix.lower() == ".wav":
+        with wave.open(path, "rb") as wav:
+            if wav.getsampwidth() == 2 and wav.getframerate() == rate:
+                samples = np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+                samples = samples.reshape(-1, wav.getnchannels()).mean(axis=1)
+                return (samples / 32768.0).astype(np.float32)
+
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise TranscriptError("ffmpeg is required to decode audio for speech recognition")
+    result = subprocess.run(
+        [ffmpeg, "-nostdin", "-v", "error", "-i", path, "-vn", "-ac", "1", "-ar", str(rate),
+         "-f", "s16le", "-"],
+        capture_output=True
+    )
+    if result.returncode != 0:
+        raise TranscriptError(f"ffmpeg could not decode {path}: {result.stderr.decode(errors='replace')}")
+    return (np.frombuffer(result.stdout, dtype=np.int16) / 32768.0).astype(np.float32)
+
+def frame_energy(audio: Any, rate: int, frame_seconds: float = FRAME_SECONDS) -> Any:
+    """RMS energy of consecutive frames of ``frame_seconds``."""
+    import numpy as np
+
+    frame = max(1, int(frame_seconds * rate))
+    frames = len(audio) // frame
+    if not frames:
+        return np.zeros(0)
+    blocks = audio[:frames * frame].reshape(frames, frame).astype(np.float64)
+    return np.sqrt(np.mean(blocks ** 2, axis=1))
+
+def silence_chunks(
+    audio: Any,
+    rate: int,
+    chunk_seconds: float = DEFAULT_CHUNK_SECONDS,
+    search_seconds: float = DEFAULT_SEARCH_SECONDS
+) -> List[Tuple[int, int]]:
+    """Split audio into (start, end) sample ranges of at most ``chunk_seconds``.
+
+    Each cut is placed in the quietest frame of the last ``search_seconds``
+    before the limit, i.e. in a pause between words where there is one.
+    """
+    import numpy as np
+
+    total = len(audio)
+    limit = int(chunk_seconds * rate)
+    if total <= limit:
+        return [(0, total)] if total else []
+    frame = max(1, int(FRAME_SECONDS * rate))
+    energy = frame_energy(audio, rate)
+    search = min(int(search_seconds * rate), limit - frame)
+
+    chunks = []
+    start = 0
+    while total - start > limit:
+        first = (start + limit - search) // frame + 1
+        last = (start + limit) // frame
+        if last > first:
+            quietest = first + int(np.argmin(energy[first:last]))
+            cut = quietest * frame + frame // 2
+        else:
+            cut = start + limit
+        chunks.append((start, cut))
+        start = cut
+    chunks.append((start, total))
+    return chunks
+
+class FasterWhisperBackend:
+    """Whisper on the CPU through faster-whisper (the ``speech`` extra)."""
+
+    def __init__(self, config: Dict[str, Any]):
+        WhisperModel = _require("faster_whisper").WhisperModel
+
+        self.language = config.get("language")
+        self.model = WhisperModel(
+            config.get("model", "tiny"),
+            device="cpu",
+            compute_type=config.get("compute_type", "int8"),
+            cpu_threads=config.get("threads_per_worker", 1)
+        )
+
+    def transcribe(self, audio: Any, rate: int) -> Tuple[List[Segment], Optional[str]]:
+        segments, info = self.model.transcribe(audio, language=self.language, beam_size=1)
+        return [Segment(s.start, s.end, s.text.strip()) for s in segments], info.language
+
+class ToneBackend:
+    """A tiny deterministic backend for tests.
+
+    Every stretch of sound becomes one segment whose text is its dominant
+    frequency, e.g. ``"440Hz"``.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        self.threshold = config.get("threshold", 0.01)
+
+    def transcribe(self, audio: Any, rate: int) -> Tuple[List[Segment], Optional[str]]:
+        import numpy as np
+
+        frame = max(1, int(FRAME_SECONDS * rate))
+        voiced = frame_energy(audio, rate) > self.threshold
+        segments = []
+        index = 0
+        while index < len(voiced):
+            if not voiced[index]:
+                index += 1
+                continue
+            end = index
+            while end < len(voiced) and voiced[end]:
+                end += 1
+            sound = audio[index * frame:end * frame]
+            spectrum = np.abs(np.fft.rfft(sound))
+            frequency = np.fft.rfftfreq(len(sound), 1 / rate)[int(np.argmax(spectrum))]
+            segments.append(Segment(index * frame / rate, end * frame / rate, f"{frequency:.0f}Hz"))
+            index = end
+        return segments, None
+
+BackendFactory = Callable[[Dict[str, Any]], Any]
+
+_BACKENDS: Dict[str, BackendFactory] = {
+    "faster_whisper": FasterWhisperBackend,
+    "tones": ToneBackend,
+}
+
+def register_backend(name: str, factory: BackendFactory) -> None:
+    """Register a backend by name.
+
+    Worker processes re-import this module, so register at import time of
+    a module they also import, or use a ``module:factory`` path instead.
+    """
+    _BACKENDS[name] = factory
+
+def create_backend(config: Dict[str, Any]) -> Any:
+    """Instantiate the backend named by ``config['backend']``."""
+    name = config.get("backend") or DEFAULT_BACKEND
+    if ":" in name:
+        module_name, attribute = name.split(":", 1)
+        factory = getattr(importlib.import_module(module_name), attribute)
+    elif name in _BACKENDS:
+        factory = _BACKENDS[name]
+    else:
+        raise ValueError(f"Unknown speech backend: {name}")
+    return factory(config)
+
+# The backend loaded by each pool worker.
+_worker_backend: Any = None
+
+# Pools and in-process backends, keyed by their settings.
+_pools: Dict[str, ProcessPoolExecutor] = {}
+_local_backends: Dict[str, Tuple[Any, threading.Lock]] = {}
+_shared_lock = threading.Lock()
+
+def _settings_key(config: Dict[str, Any]) -> str:
+    return json.dumps(config, sort_keys=True, default=str)
+
+def _shared_pool(config: Dict[str, Any], workers: int) -> ProcessPoolExecutor:
+    """The process pool for these settings, created on first use."""
+    key = _settings_key(config)
+    with _shared_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(config,)
+            )
+        return pool
+
+def _local_backend(config: Dict[str, Any]) -> Tuple[Any, threading.Lock]:
+    """The in-process backend for these settings and the lock guarding it."""
+    key = _settings_key(config)
+    with _shared_lock:
+        if key not in _local_backends:
+            _local_backends[key] = (create_backend(config), threading.Lock())
+        return _local_backends[key]
+
+def shutdown_pools() -> None:
+    """Stop the shared worker processes (also done at exit)."""
+    with _shared_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+        _local_backends.clear()
+    for pool in pools:
+        pool.shutdown(wait=True)
+
+atexit.register(shutdown_pools)
+
+def _init_worker(config: Dict[str, Any]) -> None:
+    global _worker_backend
+    _worker_backend = create_backend(config)
+
+def _transcribe_chunk(audio: Any, rate: int, offset: float) -> Tuple[List[Segment], Optional[str]]:
+    return _offset_segments(_worker_backend.transcribe(audio, rate), offset)
+
+def _offset_segments(
+    result: Tuple[List[Segment], Optional[str]],
+    offset: float
+) -> Tuple[List[Segment], Optional[str]]:
+    segments, language = result
+    return [Segment(s.start + offset, s.end + offset, s.text) for s in segments], language
+
+class SpeechTranscriber:
+    """Transcribes audio chunk by chunk across a process pool.
+
+    ``config`` is the ``speech`` section: ``backend``, ``chunk_seconds``,
+    ``workers`` (0 means one per CPU) plus backend options such as
+    ``model`` and ``language``. With one worker, chunks are transcribed in
+    this process. Transcribers with the same settings share one pool (or
+    backend), so concurrent jobs never start more than ``workers``
+    processes.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        self.config = thaw(dict(config or {}))
+        self.chunk_seconds = self.config.get("chunk_seconds", DEFAULT_CHUNK_SECONDS)
+        self.workers = self.config.get("workers") or os.cpu_count() or 1
+
+    def transcribe_file(self, path: str) -> SpeechTranscript:
+        """Transcribe an audio or video file."""
+        return self.transcribe(load_audio(path, SAMPLE_RATE), SAMPLE_RATE)
+
+    def transcribe(self, audio: Any, rate: int = SAMPLE_RATE) -> SpeechTranscript:
+        """Transcribe a float32 mono array."""
+        chunks = silence_chunks(audio, rate, self.chunk_seconds)
+        if self.workers <= 1:
+            backend, lock = _local_backend(self.config)
+            with lock:
+                results = [
+                    _offset_segments(backend.transcribe(audio[start:end], rate), start / rate)
+                    for start, end in chunks
+                ]
+        else:
+            results = list(_shared_pool(self.config, self.workers).map(
+                _transcribe_chunk,
+                [audio[start:end] for start, end in chunks],
+                [rate] * len(chunks),
+                [start / rate for start, _ in chunks]
+            ))
+
+        languages = Counter(language for _, language in results if language)
+        transcript = SpeechTranscript(
+            [segment for segments, _ in results for segment in segments],
+            languages.most_common(1)[0][0] if languages else None
+        )
+        logger.info(
+            f"Transcribed {len(audio) / rate:.0f}s of audio in {len(chunks)} chunks "
+            f"on {self.workers} workers"
+        )
+        return transcript
@@ -0,0 +1,444 @@
+"""Pipelined video analysis: a decode thread feeding an inference worker.
+
+Frame decoding (OpenCV) and model inference run concurrently, connected by
+a bounded queue of frame batches, so throughput is set by the slower stage
+instead of the sum of both. Long videos can additionally be split into
+time ranges analysed by separate processes. Those processes are spawned
+(not forked from the threaded parent) into a pool that is shared by every
+sharded video and shut down at exit.
+"""
+
+import atexit
+import multiprocessing
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .detections import Detections
+from .key_frames import (
+    DEFAULT_MAX_KEY_FRAMES,
+    DEFAULT_SCENE_CHANGE_THRESHOLD,
+    DEFAULT_THUMBNAIL_SIZE,
+    KeyFrame,
+    KeyFrameStore,
+    remove_directories
+)
+
+DEFAULT_SAMPLE_INTERVAL = 1.0  # seconds between analysed frames
+DEFAULT_BATCH_SIZE = 16
+DEFAULT_FPS = 30.0
+DEFAULT_QUEUE_SIZE = 4  # batches buffered between decode and inference
+DEFAULT_BACKPRESSURE = "block"
+DEFAULT_MIN_SHARD_SECONDS = 600.0
+BACKPRESSURE_POLICIES = ("block", "drop")
+# Beyond this stride a seek is cheaper than grabbing every skipped frame.
+SEEK_THRESHOLD_FRAMES = 150
+
+_END = object()
+
+class StageStats:
+    """Busy time and item count for one pipeline stage."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.busy_seconds = 0.0
+        self.wait_seconds = 0.0
+        self.items = 0
+
+    def to_dict(self, wall_seconds: float) -> Dict[str, Any]:
+        return {
+            "busy_seconds": round(self.busy_seconds, 4),
+            "wait_seconds": round(self.wait_seconds, 4),
+            "items": self.items,
+            "utilisation": round(self.busy_seconds / wall_seconds, 4) if wall_seconds else 0.0
+        }
+
+class PipelineStats:
+    """Per-stage utilisation of one pipeline run.
+
+    ``wait_seconds`` is time a stage spent blocked on the queue: the decode
+    stage waits when inference is the bottleneck, and vice versa.
+    """
+
+    def __init__(self) -> None:
+        self.decode = StageStats("decode")
+        self.inference = StageStats("inference")
+        self.wall_seconds = 0.0
+        self.dropped_frames = 0
+
+    def merge(self, other: "PipelineStats") -> None:
+        """Add another run's totals (used when combining shards).
+
+        Merged busy times are summed across processes, so utilisation can
+        exceed 1.0 for sharded runs.
+        """
+        for mine, theirs in ((self.decode, other.decode), (self.inference, other.inference)):
+            mine.busy_seconds += theirs.busy_seconds
+            mine.wait_seconds += theirs.wait_seconds
+            mine.items += theirs.items
+        self.dropped_frames += other.dropped_frames
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "wall_seconds": round(self.wall_seconds, 4),
+            "dropped_frames": self.dropped_frames,
+            "decode": self.decode.to_dict(self.wall_seconds),
+            "inference": self.inference.to_dict(self.wall_seconds)
+        }
+
+class PipelineResult:
+    """Output of analysing a whole video or one shard of it.
+
+    ``directories`` holds the key frames' thumbnail files, if they were
+    spooled to disk; ``close()`` deletes them once the frames are no longer
+    needed.
+    """
+
+    def __init__(
+        self,
+        detections: Detections,
+        key_frames: List[KeyFrame],
+        fps: float,
+        stats: PipelineStats,
+        directories: Optional[List[Path]] = None
+    ):
+        self.detections = detections
+        self.key_frames = key_frames
+        self.fps = fps
+        self.stats = stats
+        self.directories = directories or []
+
+    def close(self) -> None:
+        """Delete the key frames' thumbnail directories."""
+        remove_directories(self.directories)
+        self.directories = []
+
+def load_model(config: Dict[str, Any]) -> Any:
+    """Get the YOLO model named in the configuration from the model registry."""
+    from .model_registry import DEFAULT_WARMUP_SIZE, ModelRegistry
+
+    return ModelRegistry().get(
+        config.get("model", "yolov8n.pt"),
+        config.get("device"),
+        config.get("warmup_size", DEFAULT_WARMUP_SIZE) if config.get("warmup", True) else None
+    )
+
+def video_duration(video_path: str) -> float:
+    """Length of a video in seconds, from its container metadata."""
+    import cv2
+
+    cap = cv2.VideoCapture(video_path)
+    try:
+        fps = cap.get(cv2.CAP_PROP_FPS) or DEFAULT_FPS
+        return cap.get(cv2.CAP_PROP_FRAME_COUNT) / fps
+    finally:
+        cap.release()
+
+def detect_batch(
+    model: Any,
+    frames: Sequence[Any],
+    frame_indices: Optional[Sequence[int]] = None,
+    confidence: float = 0.5
+) -> List[Detections]:
+    """Run the model once over a batch of frames.
+
+    Frames may be PIL images (RGB) or NumPy arrays in OpenCV's BGR order.
+    Returns one Detections container per input frame.
+    """
+    results = model(list(frames), conf=confidence, verbose=False)
+    frame_indices = frame_indices or [0] * len(frames)
+    return [
+        Detections.from_result(result, frame_index)
+        for result, frame_index in zip(results, frame_indices)
+    ]
+
+def iter_sampled_frames(
+    cap: Any,
+    stride: int,
+    start_frame: int = 0,
+    end_frame: Optional[int] = None
+) -> Iterator[Tuple[int, Any]]:
+    """Yield (frame_index, BGR frame) for every stride-th frame.
+
+    Skipped frames are only grabbed, never retrieved, so they are not
+    converted to images. For long strides the capture seeks straight to
+    the next sampled frame instead.
+    """
+    import cv2
+
+    if start_frame and not cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame):
+        return
+    frame_index = start_frame
+    while end_frame is None or frame_index < end_frame:
+        ret, frame = cap.read()
+        if not ret:
+            return
+        yield frame_index, frame
+
+        next_index = frame_index + stride
+        if stride >= SEEK_THRESHOLD_FRAMES:
+            if not cap.set(cv2.CAP_PROP_POS_FRAMES, next_index):
+                return
+        else:
+            for _ in range(stride - 1):
+                if not cap.grab():
+                    return
+        frame_index = next_index
+
+def create_key_frame_store(config: Dict[str, Any]) -> KeyFrameStore:
+    """Create a key frame store from the YOLO configuration."""
+    return KeyFrameStore(
+        max_frames=config.get("max_key_frames", DEFAULT_MAX_KEY_FRAMES),
+        thumbnail_size=config.get("thumbnail_size", DEFAULT_THUMBNAIL_SIZE),
+        scene_change_threshold=config.get(
+            "scene_change_threshold", DEFAULT_SCENE_CHANGE_THRESHOLD
+        ),
+        directory=config.get("key_frame_dir")
+    )
+
+class VideoAnalysisPipeline:
+    """Decode frames on a background thread and run inference on the caller's.
+
+    Configuration keys (from ``api.yolo``): ``sample_interval``,
+    ``batch_size``, ``confidence_threshold``, ``queue_size`` and
+    ``backpressure``. With ``backpressure: block`` the decoder waits for
+    the inference stage when the queue is full; with ``drop`` it discards
+    the batch instead and counts the dropped frames, trading completeness
+    for bounded latency.
+    """
+
+    def __init__(self, model: Any, config: Dict[str, Any]):
+        self.model = model
+        self.config = config
+        self.sample_interval = config.get("sample_interval", DEFAULT_SAMPLE_INTERVAL)
+        self.batch_size = config.get("batch_size", DEFAULT_BATCH_SIZE)
+        self.queue_size = config.get("queue_size", DEFAULT_QUEUE_SIZE)
+        self.backpressure = config.get("backpressure", DEFAULT_BACKPRESSURE)
+        if self.backpressure not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"Unsupported backpressure policy: {self.backpressure}")
+
+    def stride(self, fps: float) -> int:
+        """Frames between samples for a video of the given frame rate."""
+        return max(1, round(fps * self.sample_interval))
+
+    def run(
+        self,
+        video_path: str,
+        start_frame: int = 0,
+        end_frame: Optional[int] = None
+    ) -> PipelineResult:
+        """Analyse frames [start_frame, end_frame) of a video."""
+        import cv2
+
+        cap = cv2.VideoCapture(video_path)
+        if not cap.isOpened():
+            raise ValueError(f"Could not open video file: {video_path}")
+
+        fps = cap.get(cv2.CAP_PROP_FPS) or DEFAULT_FPS
+        stats = PipelineStats()
+        batches: "queue.Queue[Any]" = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        errors: List[BaseException] = []
+
+        def put(item: Any, drop_allowed: bool) -> None:
+            started = time.perf_counter()
+            if drop_allowed and self.backpressure == "drop":
+                try:
+                    batches.put_nowait(item)
+                except queue.Full:
+                    stats.dropped_frames += len(item)
+            else:
+                while not stop.is_set():
+                    try:
+                        batches.put(item, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+            stats.decode.wait_seconds += time.perf_counter() - started
+
+        def decode() -> None:
+            try:
+                batch: List[Tuple[int, Any]] = []
+                frames = iter_sampled_frames(cap, self.stride(fps), start_frame, end_frame)
+                while not stop.is_set():
+                    started = time.perf_counter()
+                    item = next(frames, None)
+                    stats.decode.busy_seconds += time.perf_counter() - started
+                    if item is None:
+                        break
+                    stats.decode.items += 1
+                    batch.append(item)
+                    if len(batch) >= self.batch_size:
+                        put(batch, drop_allowed=True)
+                        batch = []
+                if batch:
+                    put(batch, drop_allowed=True)
+            except BaseException as e:  # surfaced on the inference thread
+                errors.append(e)
+            finally:
+                put(_END, drop_allowed=False)
+
+        key_frame_store = create_key_frame_store(self.config)
+        parts: List[Detections] = []
+        confidence = self.config.get("confidence_threshold", 0.5)
+        wall_start = time.perf_counter()
+        decoder = threading.Thread(target=decode, name="video-decode", daemon=True)
+        decoder.start()
+        try:
+            while True:
+                started = time.perf_counter()
+                batch = batches.get()
+                stats.inference.wait_seconds += time.perf_counter() - started
+                if batch is _END:
+                    break
+
+                started = time.perf_counter()
+                detections = detect_batch(
+                    self.model,
+                    [frame for _, frame in batch],
+                    [frame_index for frame_index, _ in batch],
+                    confidence
+                )
+                for (frame_index, frame), frame_detections in zip(batch, detections):
+                    if len(frame_detections):
+                        parts.append(frame_detections)
+                        key_frame_store.offer(
+                            frame,
+                            frame_index,
+                            frame_index / fps,
+                            frame_detections.class_names()
+                        )
+                stats.inference.busy_seconds += time.perf_counter() - started
+                stats.inference.items += len(batch)
+        except BaseException:
+            key_frame_store.close()
+            raise
+        finally:
+            stop.set()
+            decoder.join()
+            cap.release()
+        stats.wall_seconds = time.perf_counter() - wall_start
+
+        if errors:
+            key_frame_store.close()
+            raise errors[0]
+        return PipelineResult(
+            Detections.concat(parts), key_frame_store.frames, fps, stats, key_frame_store.directories
+        )
+
+def shard_ranges(frame_count: int, shards: int, stride: int) -> List[Tuple[int, int]]:
+    """Split [0, frame_count) into contiguous ranges aligned to the stride.
+
+    Aligning shard starts to multiples of the stride keeps the sampled
+    frames identical to an unsharded run.
+    """
+    samples = (frame_count + stride - 1) // stride
+    shards = max(1, min(shards, samples))
+    per_shard = (samples + shards - 1) // shards
+    ranges = []
+    for start_sample in range(0, samples, per_shard):
+        start = start_sample * stride
+        end = min(frame_count, (start_sample + per_shard) * stride)
+        ranges.append((start, end))
+    return ranges
+
+# Shard worker pools, keyed by their number of processes.
+_pools: Dict[int, ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+def _shard_pool(workers: int) -> ProcessPoolExecutor:
+    """The process pool for ``workers`` shards, created on first use."""
+    with _pools_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            pool = _pools[workers] = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return pool
+
+def shutdown_pools() -> None:
+    """Stop the shard worker processes (also done at exit)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=True)
+
+atexit.register(shutdown_pools)
+
+def _run_shard(
+    model_factory: Callable[[Dict[str, Any]], Any],
+    config: Dict[str, Any],
+    video_path: str,
+    start_frame: int,
+    end_frame: int
+) -> PipelineResult:
+    """Analyse one shard in a worker process with its own model."""
+    return VideoAnalysisPipeline(model_factory(config), config).run(video_path, start_frame, end_frame)
+
+def analyze_sharded(
+    model_factory: Callable[[Dict[str, Any]], Any],
+    config: Dict[str, Any],
+    video_path: str,
+    shards: int
+) -> PipelineResult:
+    """Analyse a video as ``shards`` time ranges in separate processes.
+
+    Each worker loads its own model through ``model_factory(config)``,
+    which must be importable by name from a spawned process. Workers stay
+    up for later videos, so a factory that caches its model per process
+    (as ``load_model`` does) loads it once per worker. Detections are
+    concatenated in time order and key frames are re-selected into a single
+    bounded store.
+    """
+    import cv2
+
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise ValueError(f"Could not open video file: {video_path}")
+    fps = cap.get(cv2.CAP_PROP_FPS) or DEFAULT_FPS
+    frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    cap.release()
+
+    stride = VideoAnalysisPipeline(None, config).stride(fps)
+    ranges = shard_ranges(frame_count, shards, stride)
+
+    wall_start = time.perf_counter()
+    executor = _shard_pool(shards)
+    futures = [
+        executor.submit(_run_shard, model_factory, config, video_path, start, end)
+        for start, end in ranges
+    ]
+    results: List[PipelineResult] = []
+    try:
+        for future in futures:
+            results.append(future.result())
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        for future in futures:
+            if not future.cancelled() and future.exception() is None:
+                future.result().close()
+        raise
+
+    stats = PipelineStats()
+    # Kept frames still live in their shard's directory, so the merged
+    # result takes over every shard's directories.
+    key_frame_store = create_key_frame_store(config)
+    for result in results:
+        stats.merge(result.stats)
+        for key_frame in result.key_frames:
+            key_frame_store.add(key_frame)
+    stats.wall_seconds = time.perf_counter() - wall_start
+
+    return PipelineResult(
+        Detections.concat([result.detections for result in results]),
+        key_frame_store.frames,
+        fps,
+        stats,
+        [directory for result in results for directory in result.directories] + key_frame_store.directories
+    )
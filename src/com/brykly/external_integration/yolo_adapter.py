@@ -1,22 +1,51 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Sequence
 from pathlib import Path
-from ultralytics import YOLO
 from PIL import Image
-import cv2
-import numpy as np
 from .base_adapter import ExternalAPIAdapter
+from .detections import DetectedObject, Detections
+from .key_frames import KeyFrame, remove_directories
+from .video_pipeline import (
+    DEFAULT_FPS,
+    DEFAULT_MIN_SHARD_SECONDS,
+    PipelineStats,
+    VideoAnalysisPipeline,
+    analyze_sharded,
+    detect_batch,
+    load_model,
+    video_duration
+)
 from ..utils.logger import Logger
 
-class DetectedObject:
-    def __init__(self, class_name: str, confidence: float, bbox: List[float]):
-        self.class_name = class_name
-        self.confidence = confidence
-        self.bbox = bbox
-
 class VisualInsights:
-    def __init__(self, objects: List[DetectedObject], key_frames: List[Image.Image]):
-        self.objects = objects
+    def __init__(
+        self,
+        detections: Detections,
+        key_frames: List[KeyFrame],
+        fps: float = DEFAULT_FPS,
+        stats: Optional[PipelineStats] = None,
+        directories: Optional[List[Path]] = None
+    ):
+        self.detections = detections
         self.key_frames = key_frames
+        self.fps = fps
+        self.stats = stats
+        self.directories = directories or []
+
+    def close(self) -> None:
+        """Delete the key frames' thumbnail directories, if spooled to disk."""
+        remove_directories(self.directories)
+        self.directories = []
+
+    def __enter__(self) -> "VisualInsights":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def objects(self) -> List[DetectedObject]:
+        """Detections as DetectedObject instances, materialised on access."""
+        return list(self.detections)
 
 class YOLOAdapter(ExternalAPIAdapter):
     """Adapter for YOLO-based object detection and video analysis."""
@@ -27,10 +56,14 @@ class YOLOAdapter(ExternalAPIAdapter):
         self.logger = Logger()
 
     def authenticate(self) -> bool:
-        """Initialize YOLO model."""
+        """Get the YOLO model from the process-wide registry.
+
+        The model is loaded only the first time its path and device are
+        requested, so re-authenticating after a configuration change is
+        cheap unless the model itself changed.
+        """
         try:
-            model_path = self.config.get("model", "yolov8n.pt")
-            self.model = YOLO(model_path)
+            self.model = load_model(self.config)
             self._set_authenticated(True)
             return True
         except Exception as e:
@@ -52,98 +85,96 @@ class YOLOAdapter(ExternalAPIAdapter):
             self.logger.error(f"Unsupported operation: {operation}")
             return {}
 
-    def detect_objects(self, frame: Image.Image) -> List[DetectedObject]:
+    def detect_objects(self, frame: Image.Image) -> Detections:
         """Detect objects in a single frame."""
         if not self.is_authenticated():
             if not self.authenticate():
-                return []
+                return Detections.empty()
 
         try:
-            results = self.model(frame, conf=self.config.get("confidence_threshold", 0.5))
-            detected_objects = []
-            
-            for result in results:
-                boxes = result.boxes
-                for box in boxes:
-                    class_id = int(box.cls[0])
-                    class_name = result.names[class_id]
-                    confidence = float(box.conf[0])
-                    bbox = box.xyxy[0].tolist()
-                    
-                    detected_objects.append(
-                        DetectedObject(class_name, confidence, bbox)
-                    )
-            
-            return detected_objects
+            return self._detect_batch([frame])[0]
         except Exception as e:
             self.handle_error(e, "object detection")
-            return []
+            return Detections.empty()
+
+    def _detect_batch(
+        self,
+        frames: Sequence[Any],
+        frame_indices: Optional[Sequence[int]] = None
+    ) -> List[Detections]:
+        """Run the model once over a batch of frames."""
+        return detect_batch(
+            self.model,
+            frames,
+            frame_indices,
+            self.config.get("confidence_threshold", 0.5)
+        )
 
     def analyze_video(self, video_path: str) -> VisualInsights:
-        """Analyze video and extract key frames with detected objects."""
+        """Analyze video and extract key frames with detected objects.
+
+        Frames are sampled every ``sample_interval`` seconds of video and
+        sent to the model ``batch_size`` frames at a time, with decoding
+        and inference pipelined (see ``VideoAnalysisPipeline``). At most
+        ``max_key_frames`` frames with detections are kept, as compressed
+        thumbnails. Videos longer than ``min_shard_seconds`` are split into
+        ``shards`` time ranges analysed by separate processes.
+        """
         if not self.is_authenticated():
             if not self.authenticate():
-                return VisualInsights([], [])
+                return VisualInsights(Detections.empty(), [])
 
         try:
-            cap = cv2.VideoCapture(video_path)
-            if not cap.isOpened():
-                raise ValueError(f"Could not open video file: {video_path}")
-
-            all_objects = []
-            key_frames = []
-            frame_count = 0
-            sample_rate = 30  # Sample every 30th frame
-
-            while cap.isOpened():
-                ret, frame = cap.read()
-                if not ret:
-                    break
-
-                if frame_count % sample_rate == 0:
-                    # Convert BGR to RGB
-                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    frame_pil = Image.fromarray(frame_rgb)
-                    
-                    # Detect objects in frame
-                    objects = self.detect_objects(frame_pil)
-                    if objects:
-                        all_objects.extend(objects)
-                        key_frames.append(frame_pil)
-
-                frame_count += 1
-
-            cap.release()
-            return VisualInsights(all_objects, key_frames)
+            shards = self.config.get("shards", 1)
+            min_shard_seconds = self.config.get("min_shard_seconds", DEFAULT_MIN_SHARD_SECONDS)
+            if shards > 1 and video_duration(video_path) >= min_shard_seconds:
+                result = analyze_sharded(load_model, dict(self.config), video_path, shards)
+            else:
+                result = VideoAnalysisPipeline(self.model, self.config).run(video_path)
+            self.logger.debug(f"Video analysis stats for {video_path}: {result.stats.to_dict()}")
+            return VisualInsights(
+                result.detections, result.key_frames, result.fps, result.stats, result.directories
+            )
         except Exception as e:
             self.handle_error(e, "video analysis")
-            return VisualInsights([], [])
+            return VisualInsights(Detections.empty(), [])
 
     def _detect_objects(self, image: Image.Image) -> Dict[str, Any]:
         """Internal method to detect objects in an image."""
-        objects = self.detect_objects(image)
+        detections = self.detect_objects(image)
         return {
             "objects": [
                 {
-                    "class": obj.class_name,
-                    "confidence": obj.confidence,
-                    "bbox": obj.bbox
+                    "class": record["class"],
+                    "confidence": record["confidence"],
+                    "bbox": record["bbox"]
                 }
-                for obj in objects
+                for record in detections.iter_dicts()
             ]
         }
 
     def _analyze_video(self, video_path: str) -> Dict[str, Any]:
-        """Internal method to analyze a video."""
+        """Internal method to analyze a video.
+
+        Per-detection records are not materialised here; use
+        ``result["detections"].iter_dicts()`` or ``.to_json(fp)`` to export.
+        Spooled key frame files are left for the caller, who should delete
+        the directories listed under ``key_frame_dirs`` when done.
+        """
         insights = self.analyze_video(video_path)
         return {
-            "objects": [
+            "detections": insights.detections,
+            "objects_count": len(insights.detections),
+            "class_counts": insights.detections.class_counts(),
+            "key_frames_count": len(insights.key_frames),
+            "key_frames": [
                 {
-                    "class": obj.class_name,
-                    "confidence": obj.confidence,
-                    "bbox": obj.bbox
+                    "frame_index": frame.frame_index,
+                    "timestamp": frame.timestamp,
+                    "classes": sorted(frame.class_names),
+                    "path": str(frame.path) if frame.path else None
                 }
-                for obj in insights.objects
+                for frame in insights.key_frames
             ],
-            "key_frames_count": len(insights.key_frames)
-        } 
\ No newline at end of file
+            "key_frame_dirs": [str(directory) for directory in insights.directories]
+        }
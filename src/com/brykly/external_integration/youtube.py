@@ -1,22 +1,90 @@
 """YouTube service module."""
 
+import asyncio
+import functools
 import logging
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 
 from .base_adapter import ExternalAPIAdapter
+from ..config.configuration_manager import ConfigSnapshot
 from ..utils.config import ConfigManager
 from ..utils.constants import DEFAULT_TEMP_DIR
+from ..utils.exceptions import VideoProcessingError
 
 logger = logging.getLogger(__name__)
 
+# Speech recognition needs no more than ~64 kbit/s; take the smallest
+# audio-only stream above that floor when there is one.
+AUDIO_FORMAT = "bestaudio[abr<=64]/worstaudio/worst"
+DEFAULT_MAX_HEIGHT = 360
+DEFAULT_MAX_FILESIZE_MB = 500
+
+def video_format(max_height: int) -> str:
+    """yt-dlp format for the vision stages: video only, at most ``max_height``."""
+    return f"bestvideo[height<={max_height}]/best[height<={max_height}]/worstvideo/worst"
+
+def download_limits(config: Dict[str, Any]) -> Tuple[int, Optional[int]]:
+    """(max_height, max_filesize in bytes) from the ``download`` config section."""
+    download_config = config.get('download', {}) or {}
+    max_filesize_mb = download_config.get('max_filesize_mb', DEFAULT_MAX_FILESIZE_MB)
+    return (
+        download_config.get('max_height', DEFAULT_MAX_HEIGHT),
+        int(max_filesize_mb * 1024 * 1024) if max_filesize_mb else None
+    )
+
+def download_media(
+    video_url: str,
+    directory: str,
+    output_path: Optional[str] = None,
+    audio_only: bool = True,
+    max_height: int = DEFAULT_MAX_HEIGHT,
+    max_filesize: Optional[int] = None
+) -> str:
+    """Download a video's audio, or a low-resolution video stream, with yt-dlp.
+
+    Files go to ``output_path`` or to ``directory`` as ``<id>.audio.<ext>``
+    / ``<id>.video<height>p.<ext>``. Names are stable, so an interrupted
+    download resumes from its ``.part`` file and a finished one is reused.
+    Streams larger than ``max_filesize`` bytes are not downloaded.
+
+    Raises:
+        VideoProcessingError: If nothing was downloaded (e.g. too large).
+    """
+    import yt_dlp
+
+    kind = 'audio' if audio_only else f'video{max_height}p'
+    if output_path:
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    ydl_opts = {
+        'quiet': True,
+        'no_warnings': True,
+        'noplaylist': True,
+        'format': AUDIO_FORMAT if audio_only else video_format(max_height),
+        'outtmpl': output_path or str(Path(directory) / f"%(id)s.{kind}.%(ext)s"),
+        'continuedl': True,  # resume .part files from an interrupted run
+        'overwrites': False,
+        'retries': 10,
+        'fragment_retries': 10,
+        'max_filesize': max_filesize
+    }
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        info = ydl.extract_info(video_url, download=True)
+        downloads = (info or {}).get('requested_downloads') or []
+        path = downloads[0].get('filepath') if downloads else None
+        if not path and info:
+            path = ydl.prepare_filename(info)
+    if not path or not Path(path).exists():
+        raise VideoProcessingError(f"Nothing was downloaded for {video_url}; is it larger than the size cap?")
+    return path
+
 class YouTubeAdapter(ExternalAPIAdapter):
     """Service for interacting with YouTube."""
     
-    def __init__(self, config_path: str = 'config.yaml'):
+    def __init__(self, config_path: str = 'config.yaml', config: Optional[ConfigSnapshot] = None):
         """Initialize the YouTube service."""
-        super().__init__('youtube')
-        self.config = ConfigManager(config_path)
+        super().__init__('youtube', config)
+        self.config = ConfigManager(config_path, config)
         self.temp_dir = Path(self.config.get('paths', {}).get('temp_dir', DEFAULT_TEMP_DIR))
         self.temp_dir.mkdir(parents=True, exist_ok=True)
     
@@ -38,14 +106,30 @@ class YouTubeAdapter(ExternalAPIAdapter):
             logger.error(f"Failed to get video info: {e}")
             raise
     
-    async def download_video(self, video_url: str, output_path: str) -> str:
-        """Download video from YouTube."""
+    async def download_video(
+        self,
+        video_url: str,
+        output_path: Optional[str] = None,
+        audio_only: bool = True
+    ) -> str:
+        """Download the audio (or a low-resolution video stream) of a video.
+        
+        By default only the audio is fetched, into the temp dir; pass
+        ``audio_only=False`` for the vision stages. Limits come from the
+        ``download`` config section. The download runs in an executor and
+        resumes if a previous attempt was interrupted.
+        """
+        max_height, max_filesize = download_limits(self.config)
         try:
-            # TODO: Implement actual video download
-            video_path = Path(output_path)
-            video_path.parent.mkdir(parents=True, exist_ok=True)
-            video_path.touch()  # Create an empty file for testing
-            return str(video_path)
+            return await asyncio.get_running_loop().run_in_executor(None, functools.partial(
+                download_media,
+                video_url,
+                str(self.temp_dir),
+                output_path,
+                audio_only,
+                max_height,
+                max_filesize
+            ))
         except Exception as e:
             logger.error(f"Failed to download video: {e}")
             raise
@@ -2,8 +2,9 @@
 
 import logging
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
+from ..config.configuration_manager import ConfigSnapshot
 from ..utils.config import ConfigManager
 from ..utils.constants import DEFAULT_OUTPUT_DIR, BLOG_POST_EXT
 
@@ -12,9 +13,9 @@ logger = logging.getLogger(__name__)
 class BlogManager:
     """Manager for handling blog posts."""
     
-    def __init__(self, config_path: str = 'config.yaml'):
+    def __init__(self, config_path: str = 'config.yaml', config: Optional[ConfigSnapshot] = None):
         """Initialize the blog manager."""
-        self.config = ConfigManager(config_path)
+        self.config = ConfigManager(config_path, config)
         self.output_dir = Path(self.config.get('paths', {}).get('output_dir', DEFAULT_OUTPUT_DIR))
         self.output_dir.mkdir(parents=True, exist_ok=True)
     
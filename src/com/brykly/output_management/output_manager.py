@@ -2,11 +2,7 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 import markdown
 from jinja2 import Environment, FileSystemLoader
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet
-from ..config.configuration_manager import ConfigurationManager
+from ..config.configuration_manager import ConfigSnapshot, ConfigurationManager
 from ..utils.logger import Logger
 
 class OutputManager:
@@ -23,6 +19,13 @@ class OutputManager:
         self.logger = Logger()
         self.output_config = self.config_manager.get_output_config()
         self._setup_templates()
+        self.config_manager.subscribe(self._on_config_change)
+
+    def _on_config_change(self, old: ConfigSnapshot, new: ConfigSnapshot) -> None:
+        """Apply new output settings and drop cached templates."""
+        if old.get("output") != new.get("output"):
+            self.output_config = self.config_manager.get_output_config()
+            self._setup_templates()
 
     def _setup_templates(self) -> None:
         """Setup Jinja2 templates."""
@@ -70,6 +73,10 @@ class OutputManager:
 
     def _format_pdf(self, blog_post: Dict[str, Any]) -> str:
         """Format content as PDF."""
+        from reportlab.lib.pagesizes import letter
+        from reportlab.lib.styles import getSampleStyleSheet
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+
         output_path = self._get_output_path(blog_post, "pdf")
         doc = SimpleDocTemplate(
             output_path,
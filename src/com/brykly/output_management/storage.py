@@ -2,8 +2,9 @@
 
 import logging
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
+from ..config.configuration_manager import ConfigSnapshot
 from ..utils.config import ConfigManager
 from ..utils.constants import DEFAULT_TEMP_DIR
 
@@ -12,9 +13,9 @@ logger = logging.getLogger(__name__)
 class StorageManager:
     """Manager for handling file storage."""
     
-    def __init__(self, config_path: str = 'config.yaml'):
+    def __init__(self, config_path: str = 'config.yaml', config: Optional[ConfigSnapshot] = None):
         """Initialize the storage manager."""
-        self.config = ConfigManager(config_path)
+        self.config = ConfigManager(config_path, config)
         self.temp_dir = Path(self.config.get('paths', {}).get('temp_dir', DEFAULT_TEMP_DIR))
         self.temp_dir.mkdir(parents=True, exist_ok=True)
     
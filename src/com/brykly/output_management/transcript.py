@@ -1,9 +1,12 @@
 """Transcript manager module."""
 
+import asyncio
 import logging
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
+from ..config.configuration_manager import ConfigSnapshot
+from ..external_integration.speech import SpeechTranscriber
 from ..utils.config import ConfigManager
 from ..utils.constants import DEFAULT_OUTPUT_DIR, TRANSCRIPT_EXT
 
@@ -12,16 +15,32 @@ logger = logging.getLogger(__name__)
 class TranscriptManager:
     """Manager for handling video transcripts."""
     
-    def __init__(self, config_path: str = 'config.yaml'):
+    def __init__(self, config_path: str = 'config.yaml', config: Optional[ConfigSnapshot] = None):
         """Initialize the transcript manager."""
-        self.config = ConfigManager(config_path)
+        self.config = ConfigManager(config_path, config)
         self.output_dir = Path(self.config.get('paths', {}).get('output_dir', DEFAULT_OUTPUT_DIR))
         self.output_dir.mkdir(parents=True, exist_ok=True)
     
     async def extract_transcript(self, video_path: str) -> str:
-        """Extract transcript from video file."""
-        # TODO: Implement actual transcript extraction
-        return "This is a test transcript."
+        """Extract transcript from a video or audio file by speech recognition.
+        
+        Uses the ``speech`` config section; transcription runs in an
+        executor and spreads its chunks across a process pool. Returns an
+        empty transcript unless ``speech.enabled`` is set.
+        
+        Raises:
+            TranscriptError: If the speech extra is not installed or the
+                audio cannot be decoded.
+        """
+        speech_config = self.config.get('speech', {}) or {}
+        if not speech_config.get('enabled'):
+            logger.info("Speech recognition is disabled (speech.enabled); no transcript extracted")
+            return ""
+        transcriber = SpeechTranscriber(speech_config)
+        transcript = await asyncio.get_running_loop().run_in_executor(
+            None, transcriber.transcribe_file, video_path
+        )
+        return transcript.text
     
     async def save_transcript(
         self,
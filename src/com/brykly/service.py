@@ -0,0 +1,270 @@
+"""Long-running HTTP service for submitting and following content jobs.
+
+Usage:
+    python -m com.brykly.service [--config config.yaml] [--host 127.0.0.1] [--port 8000]
+
+Endpoints:
+    POST /jobs               submit {"url", "mode", "formats"}; 202 with the job's status
+    GET  /jobs/{id}          status report (see ``BaseWorkflow.get_status_report``)
+    GET  /jobs/{id}/events   server-sent events: one ``status`` event per change
+    GET  /health             liveness and queue depth
+    GET  /metrics            Prometheus metrics
+
+The ``App`` is built once at startup and shared by every job. Jobs wait in
+a bounded queue and run on ``service.workers`` concurrent workers; when the
+queue is full, submissions get 503 so clients can back off.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Optional
+
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from pydantic import BaseModel
+
+from .config.configuration_manager import DEFAULT_CONFIG_PATH, load_config
+from .core.video_processor import extract_video_id
+from .utils.logger import Logger
+from .utils.metrics import CONTENT_TYPE, registry
+from .workflow import stages
+from .workflow.content import ContentWorkflow
+
+DEFAULT_WORKERS = 4
+DEFAULT_QUEUE_SIZE = 1000
+DEFAULT_RETAINED_JOBS = 10000
+KEEPALIVE_SECONDS = 15.0
+FINISHED_STATUSES = ("completed", "failed", "cancelled")
+
+class JobRequest(BaseModel):
+    """Body of ``POST /jobs``."""
+    url: str
+    mode: Literal['quick', 'detailed'] = 'quick'
+    formats: Optional[List[Literal['markdown', 'html', 'pdf']]] = None
+
+class Job:
+    """A submitted video and the workflow that processes it.
+
+    The job ID is the workflow's run ID, so it also appears on every log
+    record the job produces.
+    """
+
+    def __init__(self, workflow: ContentWorkflow, request: JobRequest):
+        self.workflow = workflow
+        self.request = request
+        self.id = workflow.run_id
+        self.created_at = datetime.now()
+        self._subscribers: List["asyncio.Queue[Dict[str, Any]]"] = []
+        workflow.add_listener(self._publish)
+
+    @property
+    def finished(self) -> bool:
+        return self.workflow.status.value in FINISHED_STATUSES
+
+    def report(self, workflow_report: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """The workflow's status report plus the job's request."""
+        report = dict(workflow_report or self.workflow.get_status_report())
+        report.update({
+            'job_id': self.id,
+            'created_at': self.created_at.isoformat(),
+            'url': self.request.url,
+            'mode': self.request.mode,
+            'formats': self.request.formats,
+        })
+        return report
+
+    def _publish(self, workflow_report: Dict[str, Any]) -> None:
+        report = self.report(workflow_report)
+        for queue in self._subscribers:
+            queue.put_nowait(report)
+
+    @contextmanager
+    def subscribe(self) -> Iterator["asyncio.Queue[Dict[str, Any]]"]:
+        """A queue that receives every status report while the block runs."""
+        queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+        self._subscribers.append(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers.remove(queue)
+
+class JobManager:
+    """Bounded queue of jobs consumed by a fixed number of async workers."""
+
+    def __init__(
+        self,
+        config_path: str,
+        workers: int = DEFAULT_WORKERS,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        retained_jobs: int = DEFAULT_RETAINED_JOBS
+    ):
+        self.config_path = config_path
+        self.workers = workers
+        self.queue_size = queue_size
+        self.retained_jobs = retained_jobs
+        self.logger = Logger()
+        self.jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._queue: Optional["asyncio.Queue[Job]"] = None
+        self._tasks: List["asyncio.Task[None]"] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def start(self) -> None:
+        """Start the workers; the shared App is built before the first job."""
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="job")
+        await asyncio.get_running_loop().run_in_executor(self._executor, stages.get_app, self.config_path)
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+        self.logger.info(f"Job service started with {self.workers} workers")
+
+    async def stop(self) -> None:
+        """Stop the workers, waiting for running stages to return."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    @property
+    def queued(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def submit(self, request: JobRequest) -> Job:
+        """Queue a job.
+
+        Raises:
+            asyncio.QueueFull: If ``queue_size`` jobs are already waiting.
+        """
+        job = Job(ContentWorkflow(self.config_path, executor=self._executor), request)
+        self._queue.put_nowait(job)
+        self.jobs[job.id] = job
+        self._forget_finished()
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self.jobs.get(job_id)
+
+    def _forget_finished(self) -> None:
+        """Drop the oldest finished jobs beyond ``retained_jobs``."""
+        excess = len(self.jobs) - self.retained_jobs
+        for job_id in [job_id for job_id, job in self.jobs.items() if job.finished][:max(excess, 0)]:
+            del self.jobs[job_id]
+
+    async def _work(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await job.workflow.execute(job.request.url, job.request.mode, job.request.formats)
+            except Exception:
+                pass  # recorded in the job's status report
+            finally:
+                self._queue.task_done()
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+def create_app(config_path: Optional[str] = None) -> FastAPI:
+    """Build the FastAPI application for a configuration file."""
+    config_path = str(config_path or DEFAULT_CONFIG_PATH)
+    service_config = load_config(config_path).get('service') or {}
+    manager = JobManager(
+        config_path,
+        service_config.get('workers', DEFAULT_WORKERS),
+        service_config.get('queue_size', DEFAULT_QUEUE_SIZE),
+        service_config.get('retained_jobs', DEFAULT_RETAINED_JOBS)
+    )
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        await manager.start()
+        try:
+            yield
+        finally:
+            await manager.stop()
+
+    app = FastAPI(title="YouTube Content Generator", lifespan=lifespan)
+    app.state.jobs = manager
+
+    def find_job(job_id: str) -> Job:
+        job = manager.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+        return job
+
+    @app.post("/jobs", status_code=202)
+    async def submit_job(request: JobRequest, response: Response) -> Dict[str, Any]:
+        if not extract_video_id(request.url):
+            raise HTTPException(status_code=422, detail="Not a YouTube video URL")
+        try:
+            job = manager.submit(request)
+        except asyncio.QueueFull:
+            raise HTTPException(
+                status_code=503, detail="Job queue is full", headers={"Retry-After": "5"}
+            )
+        response.headers["Location"] = f"/jobs/{job.id}"
+        return job.report()
+
+    @app.get("/jobs/{job_id}")
+    async def job_status(job_id: str) -> Dict[str, Any]:
+        return find_job(job_id).report()
+
+    @app.get("/jobs/{job_id}/events")
+    async def job_events(job_id: str) -> StreamingResponse:
+        job = find_job(job_id)
+
+        async def stream() -> AsyncIterator[str]:
+            # The current status, then every change until the job finishes
+            with job.subscribe() as updates:
+                report = job.report()
+                yield _sse("status", report)
+                while report['status'] not in FINISHED_STATUSES:
+                    try:
+                        report = await asyncio.wait_for(updates.get(), KEEPALIVE_SECONDS)
+                    except asyncio.TimeoutError:
+                        yield ": keep-alive\n\n"
+                        continue
+                    yield _sse("status", report)
+                yield _sse("end", {'job_id': job.id})
+
+        return StreamingResponse(
+            stream(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"}
+        )
+
+    @app.get("/health")
+    async def health() -> Dict[str, Any]:
+        return {'status': 'ok', 'queued': manager.queued, 'workers': manager.workers}
+
+    @app.get("/metrics")
+    async def metrics() -> PlainTextResponse:
+        return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
+
+    return app
+
+def main() -> Optional[int]:
+    """Run the service with uvicorn."""
+    parser = argparse.ArgumentParser(description='YouTube Content Generator service')
+    parser.add_argument('--config', help='Path to configuration file')
+    parser.add_argument('--host', help='Interface to bind (default: service.host)')
+    parser.add_argument('--port', type=int, help='Port to listen on (default: service.port)')
+    args = parser.parse_args()
+
+    import uvicorn
+
+    config_path = str(args.config or DEFAULT_CONFIG_PATH)
+    service_config = load_config(config_path).get('service') or {}
+    uvicorn.run(
+        create_app(config_path),
+        host=args.host or service_config.get('host', '127.0.0.1'),
+        port=args.port or service_config.get('port', 8000)
+    )
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
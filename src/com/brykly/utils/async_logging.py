@@ -0,0 +1,104 @@
+"""Bounded, queue-backed delivery of loguru records to their sinks."""
+
+import queue
+import threading
+from typing import Any, Dict, Optional
+from loguru import logger
+
+OVERFLOW_POLICIES = ("block", "drop")
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_OVERFLOW = "block"
+# Set on records replayed by the writer so the real sinks accept them and
+# the queue sink does not capture them a second time.
+REPLAYED_KEY = "_replayed"
+
+_STOP = object()
+
+def is_replayed(record: Dict[str, Any]) -> bool:
+    """Filter for the real sinks: only records delivered by the writer."""
+    return record["extra"].get(REPLAYED_KEY, False)
+
+def is_not_replayed(record: Dict[str, Any]) -> bool:
+    """Filter for the queue sink: only records from log calls."""
+    return not record["extra"].get(REPLAYED_KEY, False)
+
+class AsyncLogQueue:
+    """Moves sink I/O off the calling thread.
+
+    Registered as a loguru sink, it puts each record on a bounded queue and
+    returns immediately. A daemon writer thread replays the records, in
+    order, to the real sinks (console, file), which therefore keep their own
+    formats, levels, rotation and retention. When the queue is full the
+    ``block`` policy waits for space and ``drop`` discards the record; the
+    writer reports the number dropped.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_QUEUE_SIZE, overflow: str = DEFAULT_OVERFLOW):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unsupported log overflow policy: {overflow}")
+        self.overflow = overflow
+        self.dropped = 0
+        self._reported_dropped = 0
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=maxsize)
+        self._thread: Optional[threading.Thread] = None
+        # Only the writer thread replays, so one patched logger can read the
+        # record being replayed from an attribute.
+        self._current: Dict[str, Any] = {}
+        self._replayer = logger.patch(lambda r: r.update(self._current))
+
+    def start(self) -> "AsyncLogQueue":
+        """Start the writer thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+            self._thread.start()
+        return self
+
+    def sink(self, message: Any) -> None:
+        """loguru sink: enqueue the record behind a formatted message."""
+        record = message.record
+        if self.overflow == "block":
+            self._queue.put(record)
+            return
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self) -> None:
+        while True:
+            record = self._queue.get()
+            try:
+                if record is _STOP:
+                    return
+                self._report_dropped()
+                self._replay(record)
+            except Exception:
+                pass  # a failing sink must not kill the writer
+            finally:
+                self._queue.task_done()
+
+    def _replay(self, record: Dict[str, Any]) -> None:
+        """Send a captured record to the real sinks, unchanged."""
+        self._current = dict(record, extra={**record["extra"], REPLAYED_KEY: True})
+        self._replayer.log(record["level"].name, record["message"])
+
+    def _report_dropped(self) -> None:
+        dropped = self.dropped
+        if dropped != self._reported_dropped:
+            logger.bind(**{REPLAYED_KEY: True}).warning(
+                f"Log queue full: dropped {dropped - self._reported_dropped} records"
+            )
+            self._reported_dropped = dropped
+
+    def flush(self) -> None:
+        """Wait until every queued record has been written."""
+        if self._thread is not None:
+            self._queue.join()
+            self._report_dropped()
+
+    def stop(self) -> None:
+        """Flush and stop the writer thread."""
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,184 @@
+"""Record and replay of external calls for deterministic offline runs.
+
+With ``cassettes.mode: record`` the responses of yt-dlp, the transcript API
+and the LLM endpoint are stored, with how long each call took, in a gzipped
+JSON cassette. With ``mode: replay`` the same calls are answered from the
+cassette without touching the network, optionally sleeping for the
+recorded time (``replay_latency: true``) so timings stay realistic.
+
+Calls are matched by service and a key built from the request (URL, video
+ID and languages, or the full LLM payload). Identical requests recorded
+several times are replayed in the order they were recorded.
+
+Recordings are kept in memory and written in one go by ``flush()`` or
+``close()``, and at interpreter exit, so recording stays cheap however many
+calls a run makes. A process that is killed outright loses what it
+recorded since the last flush.
+"""
+
+import atexit
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from loguru import logger
+from .exceptions import CassetteMiss
+
+CASSETTE_MODES = ("off", "record", "replay")
+DEFAULT_CASSETTE_PATH = "cassettes/default.json.gz"
+CASSETTE_VERSION = 1
+
+def request_key(*parts: Any) -> str:
+    """A stable key for a request; long or structured parts are hashed."""
+    text = json.dumps(parts, sort_keys=True, default=str)
+    if len(text) <= 200:
+        return text
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+class Cassette:
+    """A store of recorded responses backed by one ``.json.gz`` file.
+
+    New recordings are written to the file, atomically, on ``flush()``,
+    ``close()`` or exit; use the cassette as a context manager to close it
+    when done. Safe to share between threads.
+    """
+
+    def __init__(self, path: str, mode: str = "replay", replay_latency: bool = False):
+        if mode not in CASSETTE_MODES or mode == "off":
+            raise ValueError(f"Unsupported cassette mode: {mode}")
+        self.path = Path(path)
+        self.mode = mode
+        self.replay_latency = replay_latency
+        self._lock = threading.Lock()
+        self._interactions: Dict[str, List[Dict[str, Any]]] = self._load()
+        self._replayed: Dict[str, int] = {}
+        self._dirty = False
+        self._flush_lock = threading.Lock()
+        if mode == "record":
+            _recorders.add(self)
+
+    def _load(self) -> Dict[str, List[Dict[str, Any]]]:
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            if self.mode == "replay":
+                raise CassetteMiss(f"Cassette not found: {self.path}")
+            return {}
+        if data.get("version") != CASSETTE_VERSION:
+            raise CassetteMiss(f"Unsupported cassette version in {self.path}: {data.get('version')}")
+        return data.get("interactions", {})
+
+    def flush(self) -> None:
+        """Write the recordings to the file if there are new ones."""
+        with self._flush_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                text = json.dumps(
+                    {"version": CASSETTE_VERSION, "interactions": self._interactions}, separators=(",", ":")
+                )
+                self._dirty = False
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, self.path)
+
+    def close(self) -> None:
+        """Write any new recordings; the cassette can still be used after."""
+        self.flush()
+
+    def __enter__(self) -> "Cassette":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return sum(len(recorded) for recorded in self._interactions.values())
+
+    def call(self, service: str, key: str, fetch: Callable[[], Any]) -> Any:
+        """Return the response for a request, recording or replaying it.
+
+        ``fetch`` performs the real call; its result must be JSON
+        serialisable. Failed calls are not recorded.
+
+        Raises:
+            CassetteMiss: In replay mode, if the request was never recorded.
+        """
+        full_key = f"{service}:{key}"
+        if self.mode == "replay":
+            return self._replay(full_key)
+
+        started = time.perf_counter()
+        response = fetch()
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._interactions.setdefault(full_key, []).append(
+                {"response": response, "elapsed": round(elapsed, 6)}
+            )
+            self._dirty = True
+        return response
+
+    def _replay(self, full_key: str) -> Any:
+        with self._lock:
+            recorded = self._interactions.get(full_key)
+            if not recorded:
+                raise CassetteMiss(f"No recorded response for {full_key} in {self.path}")
+            index = self._replayed.get(full_key, 0)
+            self._replayed[full_key] = index + 1
+        # Past the last recording, keep answering with it.
+        interaction = recorded[min(index, len(recorded) - 1)]
+        if self.replay_latency:
+            time.sleep(interaction["elapsed"])
+        return interaction["response"]
+
+_cassettes: Dict[Tuple[Path, str], Cassette] = {}
+_cassettes_lock = threading.Lock()
+# Recording cassettes still alive, flushed at exit.
+_recorders: "weakref.WeakSet[Cassette]" = weakref.WeakSet()
+
+def flush_cassettes() -> None:
+    """Write the new recordings of every recording cassette."""
+    for cassette in list(_recorders):
+        try:
+            cassette.flush()
+        except Exception as e:
+            logger.error(f"Failed to write cassette {cassette.path}: {e}")
+
+atexit.register(flush_cassettes)
+
+def get_cassette(config: Dict[str, Any]) -> Optional[Cassette]:
+    """The cassette configured under ``cassettes``, or None when off.
+
+    Components built from the same settings share one instance, so all of
+    a run's calls go to one file.
+    """
+    cassette_config = config.get("cassettes") or {}
+    mode = cassette_config.get("mode") or "off"
+    if mode == "off":
+        return None
+    path = Path(cassette_config.get("path") or DEFAULT_CASSETTE_PATH).resolve()
+    with _cassettes_lock:
+        cassette = _cassettes.get((path, mode))
+        if cassette is None:
+            cassette = _cassettes[(path, mode)] = Cassette(
+                str(path), mode, cassette_config.get("replay_latency", False)
+            )
+            logger.info(f"Cassette {mode} mode: {path}")
+        cassette.replay_latency = cassette_config.get("replay_latency", False)
+        return cassette
+
+def clear_cassettes() -> None:
+    """Write and forget the shared cassettes (they are re-read on next use)."""
+    with _cassettes_lock:
+        cassettes = list(_cassettes.values())
+        _cassettes.clear()
+    for cassette in cassettes:
+        cassette.close()
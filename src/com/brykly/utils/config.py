@@ -1,31 +1,52 @@
 """Configuration management module."""
 
-import os
 import yaml
 from typing import Dict, Any, Optional
+# Module import: configuration_manager itself imports from this package.
+from ..config import configuration_manager
 
 class ConfigManager:
-    """Configuration manager class."""
-    
-    def __init__(self, config_path: str = 'config.yaml'):
+    """Configuration manager class.
+
+    A thin view over the shared, validated configuration; the file is
+    parsed once per process by ``load_config``. Pass ``config`` to reuse a
+    snapshot the caller already holds.
+    """
+
+    def __init__(
+        self,
+        config_path: str = 'config.yaml',
+        config: Optional['configuration_manager.ConfigSnapshot'] = None
+    ):
         """Initialize the configuration manager."""
         self.config_path = config_path
-        self.config = self._load_config()
-    
-    def _load_config(self) -> Dict[str, Any]:
+        self.snapshot = config if config is not None else self._load_config()
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Read-only configuration data."""
+        return self.snapshot.data
+
+    def _load_config(self) -> 'configuration_manager.ConfigSnapshot':
         """Load configuration from YAML file."""
         try:
-            with open(self.config_path, 'r') as f:
-                return yaml.safe_load(f)
+            return configuration_manager.load_config(self.config_path)
         except Exception as e:
             raise RuntimeError(f"Failed to load configuration: {str(e)}")
-    
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value."""
         return self.config.get(key, default)
-    
+
     def set(self, key: str, value: Any) -> None:
-        """Set a configuration value and save to file."""
-        self.config[key] = value
+        """Set a configuration value and save to file.
+
+        The file is re-read as written, so environment overrides such as
+        API keys are never saved into it.
+        """
+        config = configuration_manager.read_config_file(self.config_path)
+        config[key] = value
         with open(self.config_path, 'w') as f:
-            yaml.dump(self.config, f) 
\ No newline at end of file
+            yaml.dump(config, f)
+        configuration_manager.clear_config_cache(self.config_path)
+        self.snapshot = self._load_config()
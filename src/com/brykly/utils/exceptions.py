@@ -32,4 +32,8 @@ class StorageError(AgenticError):
 
 class ValidationError(AgenticError):
     """Exception raised for validation errors."""
-    pass 
\ No newline at end of file
+    pass
+
+class CassetteMiss(AgenticError):
+    """Exception raised when a replayed request has no recorded response."""
+    pass
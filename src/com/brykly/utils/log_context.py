@@ -0,0 +1,112 @@
+"""Correlation IDs and structured (JSON) output for log records.
+
+A run ID and a video ID are kept in context variables, so they follow the
+code across threads started with a copied context and across asyncio
+tasks, and a loguru patcher stamps them onto every record. Records from the
+standard ``logging`` module are routed into loguru by ``InterceptHandler``,
+so both logging stacks produce the same structured output.
+"""
+
+import inspect
+import json
+import logging
+import time
+import traceback
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+from loguru import logger
+from .metrics import STAGE_SECONDS
+
+run_id_var: ContextVar[Optional[str]] = ContextVar("run_id", default=None)
+video_id_var: ContextVar[Optional[str]] = ContextVar("video_id", default=None)
+
+# Extra keys used internally by the logging setup, never written out.
+_INTERNAL_EXTRA = ("_json", "_replayed")
+
+def new_run_id() -> str:
+    """A short random identifier for one run or batch."""
+    return uuid.uuid4().hex[:12]
+
+@contextmanager
+def log_context(run_id: Optional[str] = None, video_id: Optional[str] = None) -> Iterator[None]:
+    """Bind a run and/or video ID to every record logged inside the block."""
+    tokens = []
+    if run_id is not None:
+        tokens.append((run_id_var, run_id_var.set(run_id)))
+    if video_id is not None:
+        tokens.append((video_id_var, video_id_var.set(video_id)))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+def add_context(record: Dict[str, Any]) -> None:
+    """loguru patcher: copy the current IDs into the record's extra."""
+    extra = record["extra"]
+    extra.setdefault("run_id", run_id_var.get())
+    extra.setdefault("video_id", video_id_var.get())
+
+@contextmanager
+def timed_stage(stage: str, **fields: Any) -> Iterator[None]:
+    """Log a ``stage`` event with its duration when the block exits.
+
+    The record carries ``stage``, ``duration_ms`` and ``status`` in its
+    extra fields, so per-video latency can be aggregated from JSON logs.
+    The duration is also observed in the stage latency histogram.
+    """
+    started = time.perf_counter()
+    status = "ok"
+    try:
+        yield
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        elapsed = time.perf_counter() - started
+        STAGE_SECONDS.observe(elapsed, stage=stage, status=status)
+        duration_ms = round(elapsed * 1000, 3)
+        logger.bind(event="stage", stage=stage, duration_ms=duration_ms, status=status, **fields).info(
+            f"Stage {stage} finished in {duration_ms:.1f} ms ({status})"
+        )
+
+def json_format(record: Dict[str, Any]) -> str:
+    """loguru format function rendering a record as one JSON line."""
+    payload = {
+        "time": record["time"].isoformat(),
+        "level": record["level"].name,
+        "message": record["message"],
+        "logger": record["name"],
+        "function": record["function"],
+        "line": record["line"],
+    }
+    payload.update(
+        (key, value) for key, value in record["extra"].items() if key not in _INTERNAL_EXTRA
+    )
+    if record["exception"] is not None:
+        payload["exception"] = "".join(traceback.format_exception(*record["exception"]))
+    record["extra"]["_json"] = json.dumps(payload, default=str)
+    return "{extra[_json]}\n"
+
+class InterceptHandler(logging.Handler):
+    """Forward standard-library log records to loguru."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            level: Any = logger.level(record.levelname).name
+        except ValueError:
+            level = record.levelno
+
+        # Find the caller outside the logging module so loguru reports it.
+        frame, depth = inspect.currentframe(), 0
+        while frame and (depth == 0 or frame.f_code.co_filename == logging.__file__):
+            frame = frame.f_back
+            depth += 1
+
+        logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
+
+def intercept_stdlib_logging(level: int = logging.NOTSET) -> None:
+    """Route records reaching the root stdlib logger into loguru."""
+    logging.basicConfig(handlers=[InterceptHandler()], level=level, force=True)
@@ -1,11 +1,26 @@
+import atexit
+import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 from loguru import logger
 from ..config.configuration_manager import ConfigurationManager
+from .async_logging import (
+    DEFAULT_OVERFLOW,
+    DEFAULT_QUEUE_SIZE,
+    AsyncLogQueue,
+    is_not_replayed,
+    is_replayed
+)
+from .log_context import add_context, intercept_stdlib_logging, json_format
+
+def _write_stdout(message: str) -> None:
+    """Console sink; looks up sys.stdout per call so redirection is honoured."""
+    sys.stdout.write(message)
 
 class Logger:
     _instance = None
     _initialized = False
+    _queue: Optional[AsyncLogQueue] = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -16,21 +31,57 @@ class Logger:
         if not self._initialized:
             self._setup_logger()
             self._initialized = True
+            atexit.register(self._stop_queue)
 
     def _setup_logger(self) -> None:
         """Configure logger with settings from configuration."""
         config_manager = ConfigurationManager()
-        log_config = config_manager.get_logging_config()
+        self.configure(config_manager.get_logging_config())
+
+    def configure(self, log_config: Dict[str, Any]) -> None:
+        """(Re)configure the sinks from a logging config section.
+
+        ``console_level`` and ``file_level`` override ``level`` per sink.
+        With ``async: true`` log calls only enqueue the record; a writer
+        thread performs the console and file I/O (see ``AsyncLogQueue``).
+        With ``json: true`` every sink writes one JSON object per line,
+        including the run and video IDs bound with ``log_context``.
+        Standard-library logging is routed here unless
+        ``intercept_stdlib`` is false.
+        """
+        log_format = log_config.get("format", "{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}")
+        if log_config.get("json", False):
+            log_format = json_format
+        level = log_config.get("level", "INFO")
+        console_level = log_config.get("console_level", level)
+        file_level = log_config.get("file_level", level)
+
+        levels = [console_level] + ([file_level] if log_config.get("file") else [])
+        min_level = min(logger.level(name).no for name in levels)
 
         # Remove default logger
         logger.remove()
+        self._stop_queue()
+        logger.configure(patcher=add_context)
+        if log_config.get("intercept_stdlib", True):
+            intercept_stdlib_logging(min_level)
+
+        sink_filter = None
+        if log_config.get("async", False):
+            self._queue = AsyncLogQueue(
+                log_config.get("queue_size", DEFAULT_QUEUE_SIZE),
+                log_config.get("overflow", DEFAULT_OVERFLOW)
+            ).start()
+            sink_filter = is_replayed
+            logger.add(self._queue.sink, format="{message}", level=min_level, filter=is_not_replayed)
 
         # Add console logger
         logger.add(
-            lambda msg: print(msg),
-            format=log_config.get("format", "{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}"),
-            level=log_config.get("level", "INFO"),
-            colorize=True
+            _write_stdout,
+            format=log_format,
+            level=console_level,
+            colorize=not log_config.get("json", False),
+            filter=sink_filter
         )
 
         # Add file logger if file path is specified
@@ -40,12 +91,24 @@ class Logger:
             
             logger.add(
                 log_path,
-                format=log_config.get("format", "{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}"),
-                level=log_config.get("level", "INFO"),
+                format=log_format,
+                level=file_level,
                 rotation=log_config.get("rotation", "1 day"),
-                retention=log_config.get("retention", "7 days")
+                retention=log_config.get("retention", "7 days"),
+                filter=sink_filter
             )
 
+    def _stop_queue(self) -> None:
+        """Drain and stop the async writer, if any."""
+        log_queue, self._queue = self._queue, None
+        if log_queue is not None:
+            log_queue.stop()
+
+    def flush(self) -> None:
+        """Wait until queued records have been written (async mode)."""
+        if self._queue is not None:
+            self._queue.flush()
+
     def debug(self, message: str) -> None:
         """Log debug message."""
         logger.debug(message)
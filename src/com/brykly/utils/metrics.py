@@ -0,0 +1,336 @@
+"""In-process metrics with Prometheus text exposition.
+
+Counters and histograms are kept in a process-wide ``MetricsRegistry`` and
+rendered in the Prometheus text format, either from a small HTTP endpoint
+(``serve``) or to a file (``dump``). Updating a metric is a dict lookup and
+an addition under a per-metric lock, so instrumentation stays on in
+production.
+"""
+
+import bisect
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+NAMESPACE = "ytblog"
+
+# Seconds; covers fast file writes up to multi-minute LLM and analysis stages.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+LabelValues = Tuple[str, ...]
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+class _Metric:
+    """Shared label handling for counters and histograms."""
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        try:
+            return tuple(str(labels[name]) for name in self.labelnames)
+        except KeyError:
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}") from None
+
+    def _header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+class Counter(_Metric):
+    """A monotonically increasing total, e.g. requests or bytes written."""
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        """Add ``amount`` (non-negative) to the series for ``labels``."""
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: Any) -> float:
+        """Current total for ``labels``."""
+        return self._values.get(self._key(labels), 0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = self._header()
+        lines.extend(
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in values
+        )
+        return lines
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+class Histogram(_Metric):
+    """Distribution of observed values (e.g. latencies) over fixed buckets."""
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        if "le" in labelnames:
+            raise ValueError("'le' is reserved for histogram buckets")
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per series: per-bucket counts (last one is +Inf), sum.
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Record one observation for ``labels``."""
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        """Observe the duration of the block, in seconds."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels: Any) -> int:
+        """Number of observations for ``labels``."""
+        series = self._series.get(self._key(labels))
+        return sum(series[0]) if series else 0
+
+    def sum(self, **labels: Any) -> float:
+        """Sum of the observations for ``labels``."""
+        series = self._series.get(self._key(labels))
+        return series[1][0] if series else 0.0
+
+    def render(self) -> List[str]:
+        with self._lock:
+            series = sorted((key, (list(counts), total[0])) for key, (counts, total) in self._series.items())
+        lines = self._header()
+        bucket_names = self.labelnames + ("le",)
+        for key, (counts, total) in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                labels = _format_labels(bucket_names, key + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+class MetricsRegistry:
+    """Process-wide collection of metrics.
+
+    ``counter`` and ``histogram`` return the existing metric when called
+    again with the same name, so modules can declare what they use at
+    import time.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            instance = super(MetricsRegistry, cls).__new__(cls)
+            instance._metrics: Dict[str, _Metric] = {}
+            instance._lock = threading.Lock()
+            instance._server: Optional[ThreadingHTTPServer] = None
+            cls._instance = instance
+        return cls._instance
+
+    def _register(self, metric_type: type, name: str, *args: Any) -> Any:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = metric_type(name, *args)
+            elif not isinstance(metric, metric_type):
+                raise ValueError(f"Metric {name} is already registered as a {metric.type_name}")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._register(Counter, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._register(Histogram, name, documentation, labelnames, buckets)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        """The metric registered under ``name``, if any."""
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = sorted(self._metrics.items())
+        lines: List[str] = []
+        for _, metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: Union[str, Path]) -> Path:
+        """Write ``render()`` to a file atomically (for textfile collectors)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(self.render(), encoding="utf-8")
+        os.replace(tmp_path, path)
+        return path
+
+    def reset(self) -> None:
+        """Clear every recorded value, keeping the metrics registered."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """Serve ``/metrics`` over HTTP from a daemon thread.
+
+        Only one server runs per process; later calls return it. Pass
+        ``port=0`` to bind any free port (see ``server.server_address``).
+        """
+        with self._lock:
+            if self._server is None:
+                self._server = ThreadingHTTPServer((host, port), _MetricsHandler)
+                self._server.daemon_threads = True
+                threading.Thread(
+                    target=self._server.serve_forever, name="metrics-server", daemon=True
+                ).start()
+            return self._server
+
+    def stop_serving(self) -> None:
+        """Shut down the server started by ``serve``."""
+        with self._lock:
+            server, self._server = self._server, None
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = MetricsRegistry().render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass  # scrapes are too frequent to log
+
+registry = MetricsRegistry()
+
+# Metrics shared across the package.
+STAGE_SECONDS = registry.histogram(
+    f"{NAMESPACE}_stage_duration_seconds",
+    "Time spent in each pipeline stage.",
+    ("stage", "status"),
+)
+JOBS = registry.counter(
+    f"{NAMESPACE}_jobs_total",
+    "Videos processed by the workflow, by outcome.",
+    ("status",),
+)
+CACHE_REQUESTS = registry.counter(
+    f"{NAMESPACE}_cache_requests_total",
+    "Cache lookups, by cache and result (hit or miss).",
+    ("cache", "result"),
+)
+RETRIES = registry.counter(
+    f"{NAMESPACE}_retries_total",
+    "Retried operations.",
+    ("operation",),
+)
+LLM_REQUEST_SECONDS = registry.histogram(
+    f"{NAMESPACE}_llm_request_duration_seconds",
+    "Latency of content-generation API calls.",
+    ("model", "status"),
+)
+LLM_TOKENS = registry.counter(
+    f"{NAMESPACE}_llm_tokens_total",
+    "Tokens reported by the content-generation API.",
+    ("model", "kind"),
+)
+OUTPUT_SAVE_SECONDS = registry.histogram(
+    f"{NAMESPACE}_output_save_duration_seconds",
+    "Time to render and write each output format.",
+    ("format",),
+)
+OUTPUT_BYTES = registry.counter(
+    f"{NAMESPACE}_output_bytes_written_total",
+    "Bytes written to output files, by format.",
+    ("format",),
+)
+QUEUE_EVENTS = registry.counter(
+    f"{NAMESPACE}_queue_jobs_total",
+    "Job queue transitions (enqueued, leased, acked, retried, dead).",
+    ("event",),
+)
+SINGLE_FLIGHT_CALLS = registry.counter(
+    f"{NAMESPACE}_single_flight_calls_total",
+    "Deduplicated calls by stage: 'leader' ran the call, 'shared' reused its result.",
+    ("stage", "role"),
+)
@@ -0,0 +1,297 @@
+"""Opt-in profiling of pipeline runs.
+
+``Profiler`` wraps a block of code and writes two files: ``<name>.pstats``
+(readable with ``pstats``, snakeviz, etc.) and ``<name>.collapsed``, one
+``frame;frame;frame weight`` line per stack, which ``flamegraph.pl`` or
+speedscope turn into a flame graph.
+
+Two modes are available:
+
+- ``cprofile`` traces every call in the calling thread. It is exact but
+  slows the code down, and does not see work done in other threads. Only
+  one cProfile can be active per process (Python 3.12+ enforces this), so
+  concurrent cprofile Profilers run one at a time.
+- ``sampling`` records stacks every ``interval`` seconds (wall-clock time,
+  so time spent waiting on I/O shows up). Its overhead is low enough for
+  batch runs, where it can sample every thread at once.
+
+Per-video profiling is requested with ``profile_videos`` or the
+``profiling`` config section and applied by ``video_profiler``.
+"""
+
+import cProfile
+import marshal
+import sys
+import threading
+from collections import Counter, defaultdict
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from pathlib import Path
+from types import FrameType
+from typing import Any, ContextManager, Dict, Iterator, List, Optional, Tuple, Union
+from loguru import logger
+
+PROFILE_MODES = ("cprofile", "sampling")
+DEFAULT_PROFILE_MODE = "cprofile"
+DEFAULT_OUTPUT_DIR = "profiles"
+DEFAULT_INTERVAL = 0.005
+# Limits for turning a cProfile call graph into stacks.
+MAX_STACK_DEPTH = 64
+MIN_WEIGHT_US = 1
+
+# pstats function key: (filename, first line, function name).
+FuncKey = Tuple[str, int, str]
+Stack = Tuple[FuncKey, ...]
+
+# Mode requested for videos processed in this context (see profile_videos).
+_requested_mode: ContextVar[Optional[str]] = ContextVar("profile_mode", default=None)
+# Set while a Profiler is running, so nested ones are skipped.
+_active: ContextVar[bool] = ContextVar("profile_active", default=False)
+# Held by the running cprofile Profiler; others wait for it.
+_cprofile_lock = threading.Lock()
+
+def frame_label(func: FuncKey) -> str:
+    """A flame graph frame name, e.g. ``save_pdf (output_manager.py:120)``."""
+    filename, line, name = func
+    if filename == "~":  # built-in functions
+        return name
+    return f"{name} ({Path(filename).name}:{line})"
+
+def _write_collapsed(path: Path, stacks: Dict[Tuple[str, ...], float]) -> None:
+    """Write ``frame;frame;frame weight`` lines, dropping zero weights."""
+    with open(path, "w", encoding="utf-8") as f:
+        for frames, weight in sorted(stacks.items()):
+            weight = int(round(weight))
+            if weight >= 1:
+                f.write(";".join(frames) + f" {weight}\n")
+
+def collapse_call_graph(stats: Dict[FuncKey, Any]) -> Dict[Stack, float]:
+    """Approximate per-stack self time (in microseconds) from cProfile stats.
+
+    cProfile keeps caller/callee edges, not whole stacks, so each callee's
+    time is split between its callers in proportion to the time spent
+    along each edge (the approach used by flameprof and gprof2dot).
+    """
+    callees: Dict[FuncKey, Dict[FuncKey, float]] = defaultdict(dict)
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, edge in callers.items():
+            callees[caller][func] = edge[3]
+
+    stacks: Dict[Stack, float] = Counter()
+
+    def walk(func: FuncKey, path: Stack, scale: float) -> None:
+        path = path + (func,)
+        _, _, self_time, total_time, _ = stats[func]
+        stacks[path] += self_time * scale * 1e6
+        if len(path) >= MAX_STACK_DEPTH:
+            return
+        for callee, edge_time in callees.get(func, {}).items():
+            callee_total = stats[callee][3]
+            if callee in path or callee_total <= 0:
+                continue
+            callee_scale = scale * min(1.0, edge_time / callee_total)
+            if callee_total * callee_scale * 1e6 >= MIN_WEIGHT_US:
+                walk(callee, path, callee_scale)
+
+    for func, (_, _, _, _, callers) in stats.items():
+        if not callers:
+            walk(func, (), 1.0)
+    return stacks
+
+@contextmanager
+def profile_videos(mode: str) -> Iterator[None]:
+    """Profile every video processed inside the block with ``mode``."""
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"Unsupported profile mode: {mode}")
+    token = _requested_mode.set(mode)
+    try:
+        yield
+    finally:
+        _requested_mode.reset(token)
+
+def video_profiler(config: Dict[str, Any], name: str, video_id: Optional[str] = None) -> ContextManager[Any]:
+    """A Profiler for one video, or a no-op context if it is not profiled.
+
+    A video is profiled if ``profile_videos`` is active, or if
+    ``profiling.enabled`` is set and ``profiling.videos`` is empty or lists
+    its ID. Nothing is done inside a block that is already being profiled.
+    """
+    profiling_config = config.get('profiling') or {}
+    mode = _requested_mode.get()
+    if mode is None and profiling_config.get('enabled'):
+        videos = profiling_config.get('videos') or ()
+        if not videos or video_id in videos:
+            mode = profiling_config.get('mode', DEFAULT_PROFILE_MODE)
+    if mode is None or _active.get():
+        return nullcontext()
+    return Profiler.from_config(name, mode, profiling_config)
+
+class Profiler:
+    """Context manager that profiles its block and writes the results.
+
+    Files are named ``<output_dir>/<name>.pstats`` and ``.collapsed``; the
+    paths are available as ``pstats_path`` and ``collapsed_path``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        mode: str = DEFAULT_PROFILE_MODE,
+        output_dir: Union[str, Path] = DEFAULT_OUTPUT_DIR,
+        interval: float = DEFAULT_INTERVAL,
+        all_threads: bool = False
+    ):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unsupported profile mode: {mode}")
+        if all_threads and mode != "sampling":
+            raise ValueError("Only the sampling profiler can profile all threads")
+        self.name = name
+        self.mode = mode
+        self.output_dir = Path(output_dir)
+        self.interval = interval
+        self.all_threads = all_threads
+        self.pstats_path = self.output_dir / f"{name}.pstats"
+        self.collapsed_path = self.output_dir / f"{name}.collapsed"
+        self._profile: Optional[cProfile.Profile] = None
+        self._sampler: Optional["_Sampler"] = None
+        self._token: Any = None
+
+    @classmethod
+    def from_config(
+        cls,
+        name: str,
+        mode: str,
+        profiling_config: Dict[str, Any],
+        all_threads: bool = False
+    ) -> "Profiler":
+        """A Profiler using ``output_dir`` and ``interval_ms`` from config."""
+        return cls(
+            name,
+            mode,
+            profiling_config.get('output_dir') or DEFAULT_OUTPUT_DIR,
+            profiling_config.get('interval_ms', DEFAULT_INTERVAL * 1000) / 1000,
+            all_threads
+        )
+
+    def __enter__(self) -> "Profiler":
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._token = _active.set(True)
+        if self.mode == "cprofile":
+            _cprofile_lock.acquire()
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            thread_id = None if self.all_threads else threading.get_ident()
+            self._sampler = _Sampler(self.interval, thread_id).start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        _active.reset(self._token)
+        try:
+            self._write()
+        finally:
+            if self.mode == "cprofile":
+                _cprofile_lock.release()
+        logger.info(f"Wrote {self.mode} profile to {self.pstats_path} and {self.collapsed_path}")
+
+    def _write(self) -> None:
+        if self._profile is not None:
+            self._profile.disable()
+            self._profile.create_stats()
+            self._profile.dump_stats(str(self.pstats_path))
+            stacks = collapse_call_graph(self._profile.stats)
+            _write_collapsed(
+                self.collapsed_path,
+                {tuple(frame_label(func) for func in stack): weight for stack, weight in stacks.items()}
+            )
+            self._profile = None
+        elif self._sampler is not None:
+            self._sampler.stop()
+            self._sampler.write(self.pstats_path, self.collapsed_path)
+            self._sampler = None
+
+class _Sampler:
+    """Samples thread stacks from a daemon thread.
+
+    Only ``thread_id`` is sampled if given, otherwise every other thread.
+    """
+
+    def __init__(self, interval: float, thread_id: Optional[int] = None):
+        self.interval = interval
+        self.thread_id = thread_id
+        self.samples: Dict[Tuple[str, Stack], int] = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "_Sampler":
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            frames = sys._current_frames()
+            if self.thread_id is not None:
+                frames = {self.thread_id: frames[self.thread_id]} if self.thread_id in frames else {}
+            for thread_id, frame in frames.items():
+                if thread_id != own_id:
+                    self.samples[(names.get(thread_id, str(thread_id)), self._stack(frame))] += 1
+
+    @staticmethod
+    def _stack(frame: Optional[FrameType]) -> Stack:
+        stack: List[FuncKey] = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+            frame = frame.f_back
+        return tuple(reversed(stack))
+
+    def _stats(self) -> Dict[FuncKey, Any]:
+        """Samples converted to the marshalled dict ``pstats`` loads.
+
+        Call counts are sample counts and times are samples x interval.
+        """
+        self_samples: Dict[FuncKey, int] = Counter()
+        total_samples: Dict[FuncKey, int] = Counter()
+        edges: Dict[FuncKey, Dict[FuncKey, List[int]]] = defaultdict(lambda: defaultdict(lambda: [0, 0]))
+        for (_, stack), count in self.samples.items():
+            if not stack:
+                continue
+            self_samples[stack[-1]] += count
+            for func in set(stack):
+                total_samples[func] += count
+            seen = set()
+            for caller, callee in zip(stack, stack[1:]):
+                if (caller, callee) in seen:
+                    continue
+                seen.add((caller, callee))
+                edge = edges[callee][caller]
+                edge[1] += count
+                if callee == stack[-1]:
+                    edge[0] += count
+
+        interval = self.interval
+        stats = {}
+        for func, total in total_samples.items():
+            callers = {
+                caller: (n, n, self_n * interval, n * interval)
+                for caller, (self_n, n) in edges[func].items()
+            }
+            stats[func] = (total, total, self_samples[func] * interval, total * interval, callers)
+        return stats
+
+    def write(self, pstats_path: Path, collapsed_path: Path) -> None:
+        with open(pstats_path, "wb") as f:
+            marshal.dump(self._stats(), f)
+        _write_collapsed(collapsed_path, {
+            (thread_name,) + tuple(frame_label(func) for func in stack): count
+            for (thread_name, stack), count in self.samples.items()
+        })
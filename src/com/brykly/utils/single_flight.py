@@ -0,0 +1,63 @@
+"""Single-flight execution of identical concurrent calls.
+
+When several threads ask for the same thing at once (two jobs for one
+popular video), only the first runs the call; the others wait for it and
+share its result, or its exception. Nothing is cached: once the call
+returns, the next caller runs it again.
+
+Keys are ``(video_id, stage, params)`` tuples. The shared result is the
+same object for every caller, so callers must not modify it.
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+from .metrics import SINGLE_FLIGHT_CALLS
+
+T = TypeVar("T")
+
+class SingleFlight:
+    """Collapses concurrent calls that share a key into one."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, "Future[Any]"] = {}
+
+    def do(self, video_id: Optional[str], stage: str, params: Tuple[Any, ...], func: Callable[[], T]) -> T:
+        """Return ``func()``, or the result of an identical call in flight.
+
+        Without a ``video_id`` calls cannot be matched and always run.
+        """
+        if video_id is None:
+            return func()
+        key = (video_id, stage, params)
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = Future()
+        if not leader:
+            SINGLE_FLIGHT_CALLS.inc(stage=stage, role="shared")
+            return call.result()
+
+        SINGLE_FLIGHT_CALLS.inc(stage=stage, role="leader")
+        try:
+            result = func()
+        except BaseException as e:
+            call.set_exception(e)
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def in_flight(self) -> int:
+        """Number of calls currently running."""
+        with self._lock:
+            return len(self._calls)
+
+# Shared by every component in the process, so that jobs using different
+# App instances or config versions still meet.
+flights = SingleFlight()
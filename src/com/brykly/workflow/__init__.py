@@ -3,11 +3,13 @@
 from .base import BaseWorkflow, WorkflowStatus, WorkflowStep
 from .video import VideoProcessingWorkflow
 from .blog import BlogGenerationWorkflow
+from .content import ContentWorkflow
 
 __all__ = [
     'BaseWorkflow',
     'WorkflowStatus',
     'WorkflowStep',
     'VideoProcessingWorkflow',
-    'BlogGenerationWorkflow'
+    'BlogGenerationWorkflow',
+    'ContentWorkflow'
 ] 
\ No newline at end of file
@@ -1,9 +1,14 @@
 """Base workflow module with status tracking capabilities."""
 
 import asyncio
+from contextvars import Token
 from datetime import datetime
 from enum import Enum
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
+from loguru import logger
+from ..config.configuration_manager import ConfigSnapshot, load_config
+from ..utils.log_context import new_run_id, run_id_var
+from ..utils.metrics import STAGE_SECONDS
 
 class WorkflowStatus(Enum):
     """Enumeration of possible workflow statuses."""
@@ -14,9 +19,12 @@ class WorkflowStatus(Enum):
     CANCELLED = "cancelled"
 
 class WorkflowStep:
-    """Class to represent a workflow step with status tracking."""
+    """Class to represent a workflow step with status tracking.
     
-    def __init__(self, name: str, description: str):
+    ``on_change`` is called after every status change.
+    """
+    
+    def __init__(self, name: str, description: str, on_change: Optional[Callable[[], None]] = None):
         self.name = name
         self.description = description
         self.status = WorkflowStatus.PENDING
@@ -25,11 +33,17 @@ class WorkflowStep:
         self.duration: Optional[float] = None
         self.result: Optional[Dict[str, Any]] = None
         self.error: Optional[Exception] = None
+        self.on_change = on_change
+    
+    def _changed(self) -> None:
+        if self.on_change is not None:
+            self.on_change()
     
     def start(self) -> None:
         """Start the step execution."""
         self.status = WorkflowStatus.RUNNING
         self.start_time = datetime.now()
+        self._changed()
     
     def complete(self, result: Optional[Dict[str, Any]] = None) -> None:
         """Complete the step execution successfully."""
@@ -37,6 +51,8 @@ class WorkflowStep:
         self.end_time = datetime.now()
         self.duration = (self.end_time - self.start_time).total_seconds()
         self.result = result
+        self._log_finished()
+        self._changed()
     
     def fail(self, error: Exception) -> None:
         """Mark the step as failed."""
@@ -44,6 +60,19 @@ class WorkflowStep:
         self.end_time = datetime.now()
         self.duration = (self.end_time - self.start_time).total_seconds()
         self.error = error
+        self._log_finished()
+        self._changed()
+    
+    def _log_finished(self) -> None:
+        """Log a stage event with the step's duration and record it as a metric."""
+        STAGE_SECONDS.observe(
+            self.duration, stage=self.name,
+            status="ok" if self.status == WorkflowStatus.COMPLETED else "error"
+        )
+        duration_ms = round(self.duration * 1000, 3)
+        logger.bind(
+            event="stage", stage=self.name, duration_ms=duration_ms, status=self.status.value
+        ).info(f"Step {self.name} {self.status.value} in {duration_ms:.1f} ms")
     
     def cancel(self) -> None:
         """Cancel the step execution."""
@@ -51,35 +80,76 @@ class WorkflowStep:
         if self.start_time:
             self.end_time = datetime.now()
             self.duration = (self.end_time - self.start_time).total_seconds()
+        self._changed()
+
+StatusListener = Callable[[Dict[str, Any]], None]
 
 class BaseWorkflow:
-    """Base class for all workflows with status tracking."""
+    """Base class for all workflows with status tracking.
+    
+    The configuration is loaded once here; subclasses pass ``self.config``
+    to the adapters and managers they create. Listeners added with
+    ``add_listener`` receive the status report after every change to the
+    workflow or one of its steps.
+    """
     
-    def __init__(self, config_path: str = 'config.yaml'):
+    def __init__(self, config_path: str = 'config.yaml', config: Optional[ConfigSnapshot] = None):
         self.config_path = config_path
+        self.config = config if config is not None else load_config(config_path)
+        self.run_id = new_run_id()
         self.steps: List[WorkflowStep] = []
         self.status = WorkflowStatus.PENDING
         self.start_time: Optional[datetime] = None
         self.end_time: Optional[datetime] = None
         self.duration: Optional[float] = None
         self.error: Optional[Exception] = None
+        self._listeners: List[StatusListener] = []
+        self._run_id_token: Optional[Token] = None
+    
+    def add_listener(self, listener: StatusListener) -> None:
+        """Call ``listener(status_report)`` after every status change."""
+        self._listeners.append(listener)
+    
+    def remove_listener(self, listener: StatusListener) -> None:
+        """Stop calling a listener added with ``add_listener``."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+    
+    def _notify(self) -> None:
+        if not self._listeners:
+            return
+        report = self.get_status_report()
+        for listener in list(self._listeners):
+            try:
+                listener(report)
+            except Exception as e:
+                logger.error(f"Workflow status listener failed: {e}")
     
     def add_step(self, name: str, description: str) -> WorkflowStep:
         """Add a new step to the workflow."""
-        step = WorkflowStep(name, description)
+        step = WorkflowStep(name, description, on_change=self._notify)
         self.steps.append(step)
         return step
     
     async def start(self) -> None:
-        """Start the workflow execution."""
+        """Start the workflow execution.
+        
+        Binds the workflow's run ID to log records until the workflow
+        completes, fails or is cancelled, unless the caller already set one.
+        """
+        if run_id_var.get() is None:
+            self._run_id_token = run_id_var.set(self.run_id)
         self.status = WorkflowStatus.RUNNING
         self.start_time = datetime.now()
+        self._notify()
     
     async def complete(self) -> None:
         """Complete the workflow execution successfully."""
         self.status = WorkflowStatus.COMPLETED
         self.end_time = datetime.now()
         self.duration = (self.end_time - self.start_time).total_seconds()
+        self._release_run_id()
+        self._notify()
     
     async def fail(self, error: Exception) -> None:
         """Mark the workflow as failed."""
@@ -87,6 +157,8 @@ class BaseWorkflow:
         self.end_time = datetime.now()
         self.duration = (self.end_time - self.start_time).total_seconds()
         self.error = error
+        self._release_run_id()
+        self._notify()
     
     async def cancel(self) -> None:
         """Cancel the workflow execution."""
@@ -94,10 +166,24 @@ class BaseWorkflow:
         if self.start_time:
             self.end_time = datetime.now()
             self.duration = (self.end_time - self.start_time).total_seconds()
+        self._release_run_id()
+        self._notify()
+    
+    def _release_run_id(self) -> None:
+        """Restore the run ID that was current before ``start``."""
+        token, self._run_id_token = self._run_id_token, None
+        if token is not None:
+            try:
+                run_id_var.reset(token)
+            except ValueError:
+                # Finished from another context (e.g. cancelled by a different
+                # task); the binding ends with the task that started it.
+                pass
     
     def get_status_report(self) -> Dict[str, Any]:
         """Generate a status report for the workflow."""
         return {
+            'run_id': self.run_id,
             'status': self.status.value,
             'start_time': self.start_time.isoformat() if self.start_time else None,
             'end_time': self.end_time.isoformat() if self.end_time else None,
@@ -2,12 +2,13 @@
 
 import logging
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from ..external_integration.openai import OpenAIAdapter
 from ..external_integration.openrouter import OpenRouterAdapter
 from ..output_management.blog import BlogManager
 from ..output_management.storage import StorageManager
+from ..config.configuration_manager import ConfigSnapshot
 from .base import BaseWorkflow
 
 logger = logging.getLogger(__name__)
@@ -15,12 +16,12 @@ logger = logging.getLogger(__name__)
 class BlogGenerationWorkflow(BaseWorkflow):
     """Workflow for generating blog posts from transcripts."""
     
-    def __init__(self, config_path: str = 'config.yaml'):
-        super().__init__(config_path)
-        self.openai_service = OpenAIAdapter(config_path)
-        self.openrouter_service = OpenRouterAdapter(config_path)
-        self.blog_manager = BlogManager(config_path)
-        self.storage_manager = StorageManager(config_path)
+    def __init__(self, config_path: str = 'config.yaml', config: Optional[ConfigSnapshot] = None):
+        super().__init__(config_path, config)
+        self.openai_service = OpenAIAdapter(config_path, self.config)
+        self.openrouter_service = OpenRouterAdapter(config_path, self.config)
+        self.blog_manager = BlogManager(config_path, self.config)
+        self.storage_manager = StorageManager(config_path, self.config)
     
     async def execute(
         self,
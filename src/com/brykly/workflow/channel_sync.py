@@ -0,0 +1,168 @@
+"""Incremental sync of followed channels into the job queue.
+
+Each channel has a watermark: the ID and upload date of the newest video
+seen by the last sync, plus the IDs of the few videos before it. A sync
+lists the channel's uploads newest first with a flat extraction and stops
+at the watermark, so it costs one or two listing pages plus the new
+videos, however large the channel is.
+
+Watermarks are stored in the job queue's database and updated in the same
+transaction that queues the new videos, so a crash can neither lose new
+uploads nor queue them twice.
+"""
+
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from loguru import logger
+from ..core.video_processor import WATCH_URL, VideoProcessor
+from .job_queue import JobQueue
+
+DEFAULT_BACKFILL = 10
+# Seen IDs kept per channel; flat listings rarely carry dates, so these
+# bound the walk when the watermark video itself is deleted or made private.
+RECENT_IDS = 20
+
+_CHANNEL_PATTERN = re.compile(
+    r'^(https?://(?:www\.|m\.)?youtube\.com/(?:@[^/?#]+|channel/[^/?#]+|c/[^/?#]+|user/[^/?#]+))'
+    r'(?:/(?:videos|featured)?)?/?(?:[?#].*)?$'
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS watermarks (
+    channel TEXT PRIMARY KEY,
+    video_id TEXT NOT NULL,
+    upload_date TEXT,
+    synced_at REAL NOT NULL,
+    recent_ids TEXT NOT NULL DEFAULT '[]'
+)
+"""
+
+_COLUMNS = "channel, video_id, upload_date, synced_at, recent_ids"
+
+def channel_uploads_url(url: str) -> Optional[str]:
+    """The URL of a channel's Videos tab (newest first), or None if ``url``
+    is not a channel."""
+    match = _CHANNEL_PATTERN.match(url)
+    return f"{match.group(1)}/videos" if match else None
+
+def entry_upload_date(entry: Dict[str, Any]) -> Optional[str]:
+    """An entry's upload date as YYYYMMDD, if the listing included one."""
+    if entry.get('upload_date'):
+        return str(entry['upload_date'])
+    if entry.get('timestamp'):
+        return datetime.fromtimestamp(entry['timestamp'], timezone.utc).strftime('%Y%m%d')
+    return None
+
+@dataclass
+class Watermark:
+    """The newest video seen by a channel's last sync."""
+    channel: str
+    video_id: str
+    upload_date: Optional[str]
+    synced_at: float
+    recent_ids: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_row(cls, row: Any) -> 'Watermark':
+        channel, video_id, upload_date, synced_at, recent_ids = row
+        return cls(channel, video_id, upload_date, synced_at, json.loads(recent_ids or '[]'))
+
+    def covers(self, entry: Dict[str, Any]) -> bool:
+        """Whether a listing entry was already seen by a previous sync."""
+        if entry['id'] == self.video_id or entry['id'] in self.recent_ids:
+            return True
+        # The recent videos may all be gone; stop at older uploads.
+        upload_date = entry_upload_date(entry)
+        return bool(upload_date and self.upload_date and upload_date < self.upload_date)
+
+@dataclass
+class SyncResult:
+    """Outcome of syncing one channel."""
+    channel: str
+    job_ids: List[int]
+    watermark: Optional[Watermark]
+
+class ChannelSync:
+    """Queues the uploads each channel has published since its last sync.
+
+    On a channel's first sync only the ``backfill`` newest videos are
+    queued (all of them if 0); later syncs queue everything newer than the
+    watermark.
+    """
+
+    def __init__(self, queue: JobQueue, video_processor: VideoProcessor, backfill: int = DEFAULT_BACKFILL):
+        self.queue = queue
+        self.video_processor = video_processor
+        self.backfill = backfill
+        with queue.transaction() as db:
+            db.execute(_SCHEMA)
+            columns = [row[1] for row in db.execute("PRAGMA table_info(watermarks)")]
+            if 'recent_ids' not in columns:
+                db.execute("ALTER TABLE watermarks ADD COLUMN recent_ids TEXT NOT NULL DEFAULT '[]'")
+
+    def watermark(self, channel: str) -> Optional[Watermark]:
+        """The stored watermark for a channel's uploads URL."""
+        row = self.queue.connection().execute(
+            f"SELECT {_COLUMNS} FROM watermarks WHERE channel = ?", (channel,)
+        ).fetchone()
+        return Watermark.from_row(row) if row else None
+
+    def watermarks(self) -> List[Watermark]:
+        """Every stored watermark."""
+        rows = self.queue.connection().execute(
+            f"SELECT {_COLUMNS} FROM watermarks ORDER BY channel"
+        ).fetchall()
+        return [Watermark.from_row(row) for row in rows]
+
+    def sync(self, url: str, mode: str = 'quick') -> SyncResult:
+        """Queue a channel's uploads newer than its watermark.
+
+        Raises:
+            ValueError: If ``url`` is not a channel URL.
+        """
+        channel = channel_uploads_url(url)
+        if channel is None:
+            raise ValueError(f"Not a channel URL: {url}")
+        watermark = self.watermark(channel)
+
+        new_entries = []
+        for entry in self.video_processor.iter_entries(channel):
+            if watermark is not None and watermark.covers(entry):
+                break
+            new_entries.append(entry)
+            if watermark is None and self.backfill and len(new_entries) >= self.backfill:
+                break
+
+        now = time.time()
+        with self.queue.transaction() as db:
+            if self.watermark(channel) != watermark:
+                logger.info(f"{channel} was synced concurrently; skipping")
+                return SyncResult(channel, [], self.watermark(channel))
+            # Oldest first, so uploads are processed in publication order.
+            job_ids = self.queue.insert_jobs(
+                db, [WATCH_URL.format(entry['id']) for entry in reversed(new_entries)], mode
+            )
+            if new_entries:
+                newest = new_entries[0]
+                # Flat listings may omit dates; the old one still bounds the new.
+                upload_date = entry_upload_date(newest) or (watermark.upload_date if watermark else None)
+                seen = [entry['id'] for entry in new_entries]
+                if watermark is not None:
+                    seen += [watermark.video_id] + watermark.recent_ids
+                recent_ids = list(dict.fromkeys(seen[1:]))[:RECENT_IDS]
+                watermark = Watermark(channel, newest['id'], upload_date, now, recent_ids)
+                db.execute(
+                    f"INSERT OR REPLACE INTO watermarks ({_COLUMNS}) VALUES (?, ?, ?, ?, ?)",
+                    (watermark.channel, watermark.video_id, watermark.upload_date, watermark.synced_at,
+                     json.dumps(watermark.recent_ids))
+                )
+            elif watermark is not None:
+                db.execute("UPDATE watermarks SET synced_at = ? WHERE channel = ?", (now, channel))
+                watermark.synced_at = now
+
+        logger.info(f"Synced {channel}: {len(job_ids)} new videos queued")
+        return SyncResult(channel, job_ids, watermark)
@@ -0,0 +1,94 @@
+"""Content generation workflow module."""
+
+import asyncio
+import contextvars
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, List, Optional
+
+from ..config.configuration_manager import ConfigSnapshot
+from ..core.video_processor import extract_video_id
+from ..utils.log_context import log_context
+from ..utils.logger import Logger
+from .base import BaseWorkflow
+from . import stages
+
+class ContentWorkflow(BaseWorkflow):
+    """Workflow running the App pipeline for one video, with step tracking.
+
+    The blocking stages run on ``executor`` (the loop's default executor
+    if None) using the shared, warm ``App`` for the config file, so status
+    changes happen on the event loop and can be streamed to clients.
+    """
+
+    def __init__(
+        self,
+        config_path: str = 'config.yaml',
+        config: Optional[ConfigSnapshot] = None,
+        executor: Optional[Executor] = None
+    ):
+        super().__init__(config_path, config)
+        self.executor = executor
+        self.logger = Logger()
+        self.url: Optional[str] = None
+        self.mode: Optional[str] = None
+        self.outputs: Optional[Dict[str, str]] = None
+
+    async def _run_step(self, name: str, description: str, func: Callable[..., Any], *args: Any) -> Any:
+        """Run one blocking stage off the event loop as a tracked step."""
+        step = self.add_step(name, description)
+        step.start()
+        try:
+            context = contextvars.copy_context()
+            result = await asyncio.get_running_loop().run_in_executor(
+                self.executor, context.run, func, *args
+            )
+        except Exception as e:
+            step.fail(e)
+            raise
+        step.complete()
+        return result
+
+    async def execute(
+        self,
+        url: str,
+        mode: str = 'quick',
+        formats: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Execute the content workflow; ``formats`` overrides the configured ones."""
+        self.url = url
+        self.mode = mode
+        with log_context(run_id=self.run_id, video_id=extract_video_id(url)):
+            try:
+                await self.start()
+                stages.validate_input({'url': url, 'mode': mode})
+                app = stages.get_app(self.config_path).components
+
+                metadata = await self._run_step(
+                    "extract_metadata",
+                    "Extracting video metadata",
+                    app.video_processor.extract_metadata, url, app.include_transcript(mode)
+                )
+                blog_post = await self._run_step(
+                    "generate_content",
+                    f"Generating {mode} blog content",
+                    app.generate_content, metadata, mode
+                )
+                self.outputs = await self._run_step(
+                    "save_output",
+                    "Saving blog post files",
+                    app.output_manager.save_all_formats, blog_post, formats
+                )
+
+                await self.complete()
+                return self.get_status_report()
+
+            except Exception as e:
+                self.logger.error(f"Error in content workflow: {str(e)}")
+                await self.fail(e)
+                raise
+
+    def get_status_report(self) -> Dict[str, Any]:
+        """Status report including the video, mode and saved files."""
+        report = super().get_status_report()
+        report.update({'url': self.url, 'mode': self.mode, 'outputs': self.outputs})
+        return report
@@ -0,0 +1,345 @@
+"""Durable job queue backed by SQLite.
+
+Jobs survive crashes: a consumer *leases* a job, which hides it from other
+consumers for ``visibility_timeout`` seconds, and deletes it with ``ack``
+once the outputs are saved. A consumer that dies simply lets its lease
+expire and the job becomes available again. ``nack`` puts a failed job back
+with exponential backoff; after ``max_attempts`` it is moved to the
+``dead_letters`` table for inspection and ``requeue_dead``.
+
+Lower priority values are leased first; by default quick jobs go ahead of
+detailed and visual ones. The database runs in WAL mode and every lease
+is taken in an immediate transaction, so any number of threads and
+processes on one machine can consume the same file.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from loguru import logger
+from ..utils.metrics import QUEUE_EVENTS, RETRIES
+
+DEFAULT_QUEUE_PATH = "jobs.db"
+DEFAULT_VISIBILITY_TIMEOUT = 300.0
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_DELAY = 30.0
+DEFAULT_PRIORITIES = {'quick': 0, 'detailed': 10, 'visual': 20}
+DEFAULT_PAGE_SIZE = 50
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    input TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL,
+    lease TEXT,
+    last_error TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (priority, available_at, id);
+CREATE TABLE IF NOT EXISTS dead_letters (
+    id INTEGER PRIMARY KEY,
+    input TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    attempts INTEGER NOT NULL,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    failed_at REAL NOT NULL
+);
+"""
+
+@dataclass
+class QueuedJob:
+    """A leased job; pass it back to ``ack``, ``nack`` or ``extend``."""
+    id: int
+    input: Dict[str, Any]
+    priority: int
+    attempts: int
+    lease: str
+    lease_expires: float
+    last_error: Optional[str] = None
+
+    @property
+    def url(self) -> str:
+        return self.input['url']
+
+    @property
+    def mode(self) -> str:
+        return self.input.get('mode', 'quick')
+
+class JobQueue:
+    """A priority job queue with leases, retries and dead-lettering."""
+
+    def __init__(
+        self,
+        path: str = DEFAULT_QUEUE_PATH,
+        visibility_timeout: float = DEFAULT_VISIBILITY_TIMEOUT,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+        priorities: Optional[Dict[str, int]] = None
+    ):
+        self.path = Path(path)
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.priorities = {**DEFAULT_PRIORITIES, **(priorities or {})}
+        self._local = threading.local()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection().executescript(_SCHEMA)
+
+    @classmethod
+    def from_config(cls, queue_config: Dict[str, Any]) -> "JobQueue":
+        """Create the queue described by the ``queue`` config section."""
+        return cls(
+            queue_config.get('path') or DEFAULT_QUEUE_PATH,
+            queue_config.get('visibility_timeout', DEFAULT_VISIBILITY_TIMEOUT),
+            queue_config.get('max_attempts', DEFAULT_MAX_ATTEMPTS),
+            queue_config.get('retry_delay', DEFAULT_RETRY_DELAY),
+            queue_config.get('priorities')
+        )
+
+    def connection(self) -> sqlite3.Connection:
+        """This thread's connection; connections are not shared across forks."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(str(self.path), timeout=30.0, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """A write transaction holding the database's write lock throughout.
+        
+        Other modules may keep their own tables in the queue's database and
+        update them atomically with ``insert_jobs``.
+        """
+        connection = self.connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def priority_for(self, mode: str) -> int:
+        return self.priorities.get(mode, max(self.priorities.values(), default=0))
+
+    def enqueue(self, url: str, mode: str = 'quick', priority: Optional[int] = None, **extra: Any) -> int:
+        """Add a job and return its ID; ``extra`` is stored with the input."""
+        return self.enqueue_many([url], mode, priority, **extra)[0]
+
+    def enqueue_many(
+        self,
+        urls: Iterable[str],
+        mode: str = 'quick',
+        priority: Optional[int] = None,
+        **extra: Any
+    ) -> List[int]:
+        """Add one job per URL in a single transaction and return their IDs."""
+        with self.transaction() as db:
+            return self.insert_jobs(db, urls, mode, priority, **extra)
+
+    def insert_jobs(
+        self,
+        db: sqlite3.Connection,
+        urls: Iterable[str],
+        mode: str = 'quick',
+        priority: Optional[int] = None,
+        **extra: Any
+    ) -> List[int]:
+        """Add jobs inside a ``transaction`` and return their IDs."""
+        priority = self.priority_for(mode) if priority is None else priority
+        now = time.time()
+        ids = []
+        for url in urls:
+            input_data = json.dumps({'url': url, 'mode': mode, **extra})
+            cursor = db.execute(
+                "INSERT INTO jobs (input, priority, available_at, created_at) VALUES (?, ?, ?, ?)",
+                (input_data, priority, now, now)
+            )
+            ids.append(cursor.lastrowid)
+        QUEUE_EVENTS.inc(len(ids), event="enqueued")
+        return ids
+
+    def enqueue_stream(
+        self,
+        urls: Iterable[str],
+        mode: str = 'quick',
+        page_size: int = DEFAULT_PAGE_SIZE,
+        **extra: Any
+    ) -> int:
+        """Add jobs from a lazy iterable, committing every ``page_size`` URLs.
+
+        Workers can start on the first page while later ones are still
+        being produced (e.g. listed from a channel). Returns the count.
+        """
+        count = 0
+        iterator = iter(urls)
+        while True:
+            page = list(islice(iterator, page_size))
+            if not page:
+                return count
+            count += len(self.enqueue_many(page, mode, **extra))
+
+    def lease(self, limit: int = 1) -> List[QueuedJob]:
+        """Lease up to ``limit`` available jobs, highest priority first.
+
+        Jobs whose previous lease expired after ``max_attempts`` attempts
+        (their consumer kept dying) are dead-lettered instead.
+        """
+        now = time.time()
+        expires = now + self.visibility_timeout
+        jobs = []
+        with self.transaction() as db:
+            abandoned = db.execute(
+                "SELECT id FROM jobs WHERE available_at <= ? AND attempts >= ?",
+                (now, self.max_attempts)
+            ).fetchall()
+            for (job_id,) in abandoned:
+                self._dead_letter(db, job_id, "Lease expired", now)
+            rows = db.execute(
+                "SELECT id, input, priority, attempts, last_error FROM jobs"
+                " WHERE available_at <= ? ORDER BY priority, id LIMIT ?",
+                (now, limit)
+            ).fetchall()
+            for job_id, input_data, priority, attempts, last_error in rows:
+                lease = uuid.uuid4().hex
+                db.execute(
+                    "UPDATE jobs SET lease = ?, available_at = ?, attempts = attempts + 1 WHERE id = ?",
+                    (lease, expires, job_id)
+                )
+                jobs.append(QueuedJob(
+                    job_id, json.loads(input_data), priority, attempts + 1, lease, expires, last_error
+                ))
+        if jobs:
+            QUEUE_EVENTS.inc(len(jobs), event="leased")
+        return jobs
+
+    def extend(self, job: QueuedJob, seconds: Optional[float] = None) -> bool:
+        """Renew a lease; False if it was lost (expired and re-leased)."""
+        expires = time.time() + (self.visibility_timeout if seconds is None else seconds)
+        with self.transaction() as db:
+            cursor = db.execute(
+                "UPDATE jobs SET available_at = ? WHERE id = ? AND lease = ?",
+                (expires, job.id, job.lease)
+            )
+        if cursor.rowcount:
+            job.lease_expires = expires
+        return cursor.rowcount == 1
+
+    def ack(self, job: QueuedJob) -> bool:
+        """Delete a finished job; False if its lease was lost."""
+        with self.transaction() as db:
+            cursor = db.execute("DELETE FROM jobs WHERE id = ? AND lease = ?", (job.id, job.lease))
+        if cursor.rowcount:
+            QUEUE_EVENTS.inc(event="acked")
+        else:
+            logger.warning(f"Lease on job {job.id} was lost before it was acknowledged")
+        return cursor.rowcount == 1
+
+    def nack(self, job: QueuedJob, error: str, retry: bool = True) -> bool:
+        """Return a failed job for a later retry, or dead-letter it.
+
+        The job is dead-lettered when ``retry`` is False or it has used
+        ``max_attempts``; otherwise it becomes available again after
+        ``retry_delay`` seconds, doubling with each attempt. Returns False
+        if the lease was lost.
+        """
+        now = time.time()
+        with self.transaction() as db:
+            owned = db.execute(
+                "SELECT 1 FROM jobs WHERE id = ? AND lease = ?", (job.id, job.lease)
+            ).fetchone()
+            if not owned:
+                logger.warning(f"Lease on job {job.id} was lost before it failed")
+                return False
+            if not retry or job.attempts >= self.max_attempts:
+                self._dead_letter(db, job.id, error, now)
+                return True
+            delay = self.retry_delay * 2 ** (job.attempts - 1)
+            db.execute(
+                "UPDATE jobs SET lease = NULL, available_at = ?, last_error = ? WHERE id = ?",
+                (now + delay, error, job.id)
+            )
+        RETRIES.inc(operation="queue_job")
+        QUEUE_EVENTS.inc(event="retried")
+        return True
+
+    def _dead_letter(self, db: sqlite3.Connection, job_id: int, error: str, now: float) -> None:
+        db.execute(
+            "INSERT OR REPLACE INTO dead_letters"
+            " (id, input, priority, attempts, last_error, created_at, failed_at)"
+            " SELECT id, input, priority, attempts, ?, created_at, ? FROM jobs WHERE id = ?",
+            (error, now, job_id)
+        )
+        db.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+        QUEUE_EVENTS.inc(event="dead")
+        logger.warning(f"Job {job_id} moved to dead letters: {error}")
+
+    def dead_letters(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """The most recently dead-lettered jobs."""
+        rows = self.connection().execute(
+            "SELECT id, input, attempts, last_error, failed_at FROM dead_letters"
+            " ORDER BY failed_at DESC LIMIT ?",
+            (limit,)
+        ).fetchall()
+        return [
+            {'id': job_id, 'input': json.loads(input_data), 'attempts': attempts,
+             'error': error, 'failed_at': failed_at}
+            for job_id, input_data, attempts, error, failed_at in rows
+        ]
+
+    def requeue_dead(self, ids: Optional[Iterable[int]] = None) -> int:
+        """Move dead-lettered jobs (all, or ``ids``) back to the queue."""
+        now = time.time()
+        with self.transaction() as db:
+            if ids is None:
+                ids = [row[0] for row in db.execute("SELECT id FROM dead_letters").fetchall()]
+            ids = list(ids)
+            for job_id in ids:
+                db.execute(
+                    "INSERT INTO jobs (id, input, priority, available_at, created_at)"
+                    " SELECT id, input, priority, ?, created_at FROM dead_letters WHERE id = ?",
+                    (now, job_id)
+                )
+                db.execute("DELETE FROM dead_letters WHERE id = ?", (job_id,))
+        return len(ids)
+
+    def stats(self) -> Dict[str, int]:
+        """Job counts: ready, leased, delayed (waiting to retry) and dead."""
+        now = time.time()
+        db = self.connection()
+        ready, leased, delayed = db.execute(
+            "SELECT"
+            " COALESCE(SUM(available_at <= ?), 0),"
+            " COALESCE(SUM(available_at > ? AND lease IS NOT NULL), 0),"
+            " COALESCE(SUM(available_at > ? AND lease IS NULL), 0)"
+            " FROM jobs",
+            (now, now, now)
+        ).fetchone()
+        dead = db.execute("SELECT COUNT(*) FROM dead_letters").fetchone()[0]
+        return {'ready': ready, 'leased': leased, 'delayed': delayed, 'dead': dead}
+
+    def __len__(self) -> int:
+        """Jobs not yet acknowledged or dead-lettered."""
+        return self.connection().execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
@@ -1,108 +1,337 @@
-from typing import Any, Dict, Optional
-from prefect import flow, task, get_run_logger
-from prefect.context import get_run_context
-from prefect.tasks import task_input_hash
-from datetime import timedelta
-from ..config.configuration_manager import ConfigurationManager
+"""Workflow orchestration with pluggable execution backends."""
+
+import asyncio
+import contextvars
+from contextlib import nullcontext
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from pathlib import Path
+from ..config.config_watcher import ConfigWatcher
+from ..config.configuration_manager import ConfigSnapshot, ConfigurationManager
+from ..core.video_processor import extract_video_id, is_collection_url
+from ..utils.log_context import log_context, new_run_id, run_id_var, timed_stage
 from ..utils.logger import Logger
+from ..utils.metrics import JOBS, registry
+from ..utils.profiling import Profiler, profile_videos, video_profiler
+from . import stages
+from .job_queue import DEFAULT_PAGE_SIZE, JobQueue, QueuedJob
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_POLL_INTERVAL = 1.0
+BACKENDS = ('asyncio', 'prefect')
 
 class WorkflowOrchestrator:
-    """Manages workflow execution using Prefect."""
+    """Manages workflow execution.
+
+    The default ``asyncio`` backend runs the pipeline in-process and never
+    imports Prefect. Set ``workflow.backend: prefect`` (or pass ``backend``)
+    to run the same stages as Prefect flows with result caching.
+
+    With ``workflow.config_reload_interval`` set, batches watch the config
+    file and apply changes between jobs without a restart.
+
+    ``run_queue`` consumes the durable job queue (see ``job_queue``)
+    instead of a list of URLs, so queued work survives a crash.
 
-    def __init__(self):
-        self.config_manager = ConfigurationManager()
+    Stage latencies and job counts are recorded in the metrics registry.
+    ``metrics.port`` serves them at ``/metrics`` and ``metrics.file`` is
+    rewritten at the end of every run.
+    """
+
+    def __init__(self, config_path: Optional[str] = None, backend: Optional[str] = None):
+        self.config_manager = ConfigurationManager(config_path)
         self.logger = Logger()
         self.workflow_config = self.config_manager.get_workflow_config()
+        self.config_path = str(config_path or self.config_manager._config_path)
+        self.backend = backend or self.workflow_config.get("backend", "asyncio")
+        if self.backend not in BACKENDS:
+            raise ValueError(f"Unsupported workflow backend: {self.backend}")
+        self.max_workers = self.workflow_config.get("max_workers", DEFAULT_MAX_WORKERS)
+        self.metrics_config = self.config_manager.get_metrics_config()
+        if self.metrics_config.get("port"):
+            registry.serve(self.metrics_config["port"], self.metrics_config.get("host", "127.0.0.1"))
+        self.config_manager.subscribe(self._on_config_change)
+
+    def _on_config_change(self, old: ConfigSnapshot, new: ConfigSnapshot) -> None:
+        """Pick up a new worker limit and metrics file for the next batch."""
+        self.workflow_config = new.get("workflow", {})
+        self.max_workers = self.workflow_config.get("max_workers", DEFAULT_MAX_WORKERS)
+        self.metrics_config = new.get("metrics", {})
+
+    def reload_config(self) -> None:
+        """Reload the shared configuration and the pipeline's App."""
+        if self.config_manager._config_path and Path(self.config_path) == Path(self.config_manager._config_path):
+            self.config_manager.reload()
+        stages.get_app(self.config_path).reload_config()
+
+    def watch_config(self) -> Any:
+        """A watcher that reloads on config file changes, if enabled.
+
+        Returns a ConfigWatcher to use as a context manager, or a no-op
+        context when ``workflow.config_reload_interval`` is not set.
+        """
+        interval = self.workflow_config.get("config_reload_interval")
+        if not interval:
+            return nullcontext()
+        return ConfigWatcher(self.config_path, self.reload_config, interval)
+
+    def dump_metrics(self) -> Optional[Path]:
+        """Write the metrics to ``metrics.file``, if configured."""
+        path = self.metrics_config.get("file")
+        if not path:
+            return None
+        try:
+            return registry.dump(path)
+        except OSError as e:
+            self.logger.error(f"Failed to write metrics to {path}: {str(e)}")
+            return None
+
+    def run_workflow(self, input_data: Dict[str, Any]) -> Dict[str, str]:
+        """Run the content pipeline for a single video."""
+        with log_context(run_id=new_run_id()):
+            try:
+                if self.backend == 'prefect':
+                    from .prefect_flows import content_flow
+                    result = content_flow(input_data, self.config_path)
+                else:
+                    result = self._run_pipeline(input_data)
+                JOBS.inc(status="ok")
+                return result
+            except Exception as e:
+                JOBS.inc(status="failed")
+                self.logger.error(f"Workflow failed: {str(e)}")
+                raise
+            finally:
+                self.dump_metrics()
+
+    def _batch_profiler(self, profile: Optional[str], run_id: str) -> Any:
+        """Profiling for a whole batch run.
+
+        ``sampling`` samples every worker thread into one profile. cProfile
+        only sees its own thread, so ``cprofile`` profiles each video
+        separately in the thread that runs it; as only one cProfile can be
+        active per process, profiled videos then run one at a time.
+        """
+        if profile is None:
+            return nullcontext()
+        if profile == 'sampling':
+            profiling_config = self.config_manager.get("profiling") or {}
+            return Profiler.from_config(f"{run_id}_batch", profile, profiling_config, all_threads=True)
+        return profile_videos(profile)
+
+    def expand_urls(self, urls: Iterable[str]) -> Iterator[str]:
+        """Video URLs, with playlists and channels expanded lazily.
+
+        Listing pages are fetched as the iterator is consumed, capped at
+        ``playlists.max_videos`` videos per playlist or channel.
+        """
+        max_videos = (self.config_manager.get("playlists") or {}).get("max_videos") or None
+        for url in urls:
+            if is_collection_url(url):
+                self.logger.info(f"Expanding {url}")
+                video_processor = stages.get_app(self.config_path).components.video_processor
+                yield from islice(video_processor.iter_video_urls(url), max_videos)
+            else:
+                yield url
+
+    def run_batch(
+        self,
+        urls: Iterable[str],
+        mode: str = 'quick',
+        profile: Optional[str] = None
+    ) -> Dict[str, Optional[Dict[str, str]]]:
+        """Run the content pipeline for many videos concurrently.
 
-    @task(cache_key_fn=task_input_hash, cache_expiration=timedelta(hours=1))
-    def validate_input(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate workflow input data."""
-        logger = get_run_logger()
-        logger.info("Validating input data")
-        
-        required_fields = ["url", "mode"]
-        missing_fields = [field for field in required_fields if field not in input_data]
-        
-        if missing_fields:
-            raise ValueError(f"Missing required fields: {missing_fields}")
-        
-        return input_data
-
-    @task
-    def process_video(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Process video and extract metadata."""
-        logger = get_run_logger()
-        logger.info(f"Processing video: {input_data['url']}")
-        
-        # TODO: Implement video processing logic
-        return {
-            "metadata": {
-                "title": "Sample Title",
-                "description": "Sample Description",
-                "duration": "10:00"
-            }
-        }
-
-    @task
-    def generate_content(self, video_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate content based on video data."""
-        logger = get_run_logger()
-        logger.info("Generating content")
-        
-        # TODO: Implement content generation logic
-        return {
-            "content": "Sample generated content",
-            "seo_tags": ["tag1", "tag2"]
-        }
-
-    @task
-    def format_output(self, content_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Format content for output."""
-        logger = get_run_logger()
-        logger.info("Formatting output")
-        
-        # TODO: Implement output formatting logic
-        return {
-            "formatted_content": "Formatted content",
-            "output_path": "output/sample.md"
-        }
-
-    @flow(name="YouTube Content Generation")
-    def run_workflow(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Main workflow execution."""
+        Playlist and channel URLs are expanded while the batch runs, so the
+        first videos are processed while the rest are still being listed.
+        The Prefect backend runs one flow per ``playlists.page_size`` videos
+        and lists the next page when the previous one has finished. A
+        playlist or channel whose listing fails maps to None, like a failed
+        video, after the videos listed before the failure have run.
+        Pass ``profile`` ('cprofile' or 'sampling') to profile the run.
+        Returns a mapping of URL to saved output files, or None for videos
+        that failed.
+        """
+        inputs: List[Dict[str, Any]] = []
+        unlisted: List[str] = []
+
+        def stream_inputs() -> Iterator[Dict[str, Any]]:
+            for url in urls:
+                try:
+                    for video_url in self.expand_urls([url]):
+                        inputs.append({"url": video_url, "mode": mode})
+                        yield inputs[-1]
+                except Exception as e:
+                    self.logger.error(f"Failed to list {url}: {str(e)}")
+                    unlisted.append(url)
+
+        run_id = new_run_id()
         try:
-            # Validate input
-            validated_input = self.validate_input(input_data)
-            
-            # Process video
-            video_data = self.process_video(validated_input)
-            
-            # Generate content
-            content_data = self.generate_content(video_data)
-            
-            # Format output
-            output_data = self.format_output(content_data)
-            
-            return output_data
-            
+            with log_context(run_id=run_id), self.watch_config(), self._batch_profiler(profile, run_id):
+                if self.backend == 'prefect':
+                    from .prefect_flows import batch_content_flow, task_runner
+                    batch_flow = batch_content_flow.with_options(
+                        task_runner=task_runner(self.max_workers)
+                    )
+                    page_size = (self.config_manager.get("playlists") or {}).get("page_size") or DEFAULT_PAGE_SIZE
+                    stream = stream_inputs()
+                    results = []
+                    for page in iter(lambda: list(islice(stream, page_size)), []):
+                        results.extend(batch_flow(page, self.config_path))
+                else:
+                    results = asyncio.run(self.run_batch_async(stream_inputs()))
+            for result in results:
+                JOBS.inc(status="failed" if result is None else "ok")
         except Exception as e:
-            self.logger.error(f"Workflow failed: {str(e)}")
+            self.logger.error(f"Batch workflow failed: {str(e)}")
             raise
+        finally:
+            self.dump_metrics()
+        outputs = {input_data["url"]: result for input_data, result in zip(inputs, results)}
+        outputs.update((url, None) for url in unlisted)
+        return outputs
+
+    async def run_batch_async(
+        self,
+        inputs: Iterable[Dict[str, Any]]
+    ) -> List[Optional[Dict[str, str]]]:
+        """Run the in-process pipeline over many inputs, max_workers at a time.
+
+        ``inputs`` is consumed in a worker thread as jobs are started, so a
+        slow generator (e.g. a channel listing) overlaps with processing.
+        Each job runs in a copy of the caller's context, so log records keep
+        the batch's run ID. Results are in input order. If ``inputs``
+        raises, the jobs already started finish and the error is re-raised.
+        """
+        loop = asyncio.get_running_loop()
+        pending: "asyncio.Queue[Optional[Tuple[int, Dict[str, Any]]]]" = asyncio.Queue(self.max_workers)
+        results: List[Optional[Dict[str, str]]] = []
+        context = contextvars.copy_context()
+        listing_errors: List[Exception] = []
+
+        async def produce() -> None:
+            iterator = iter(inputs)
+            try:
+                while True:
+                    input_data = await loop.run_in_executor(None, context.run, next, iterator, None)
+                    if input_data is None:
+                        break
+                    results.append(None)
+                    await pending.put((len(results) - 1, input_data))
+            except Exception as e:
+                # Videos already listed still run before the error is raised
+                listing_errors.append(e)
+            finally:
+                for _ in range(self.max_workers):
+                    await pending.put(None)
+
+        async def consume() -> None:
+            while True:
+                job = await pending.get()
+                if job is None:
+                    return
+                index, input_data = job
+                try:
+                    job_context = contextvars.copy_context()
+                    results[index] = await loop.run_in_executor(
+                        None, job_context.run, self._run_pipeline, input_data
+                    )
+                except Exception as e:
+                    self.logger.error(f"Failed to process {input_data.get('url')}: {str(e)}")
+
+        await asyncio.gather(produce(), *(consume() for _ in range(self.max_workers)))
+        if listing_errors:
+            raise listing_errors[0]
+        return results
+
+    def job_queue(self) -> JobQueue:
+        """The durable job queue configured under ``queue``."""
+        return JobQueue.from_config(self.config_manager.get("queue") or {})
+
+    def run_queue(self, queue: Optional[JobQueue] = None, drain: bool = False) -> int:
+        """Consume a job queue, max_workers jobs at a time.
 
-    def get_intermediate_results(self) -> Dict[str, Any]:
-        """Get intermediate results from the current workflow run."""
+        Runs until interrupted or, with ``drain``, until the queue has no
+        jobs left. Several processes can consume the same queue. Returns
+        the number of jobs that completed.
+        """
+        queue = queue or self.job_queue()
         try:
-            context = get_run_context()
-            if not context:
-                return {}
-            
-            # TODO: Implement intermediate results retrieval
-            return {
-                "workflow_id": context.flow_run.id,
-                "status": context.flow_run.status,
-                "start_time": context.flow_run.start_time,
-                "end_time": context.flow_run.end_time
-            }
+            with log_context(run_id=new_run_id()), self.watch_config():
+                return asyncio.run(self.run_queue_async(queue, drain))
+        finally:
+            self.dump_metrics()
+
+    async def run_queue_async(self, queue: JobQueue, drain: bool = False) -> int:
+        """Lease jobs as workers free up and acknowledge them when done.
+
+        A failed lease is logged and tried again on the next poll.
+        """
+        loop = asyncio.get_running_loop()
+        poll_interval = (self.config_manager.get("queue") or {}).get("poll_interval", DEFAULT_POLL_INTERVAL)
+        running: Set["asyncio.Future[bool]"] = set()
+        completed = 0
+        while True:
+            free = self.max_workers - len(running)
+            jobs: List[QueuedJob] = []
+            if free > 0:
+                try:
+                    jobs = await loop.run_in_executor(None, queue.lease, free)
+                except Exception as e:
+                    self.logger.error(f"Failed to lease jobs: {str(e)}")
+            running.update(asyncio.ensure_future(self._run_queued(queue, job)) for job in jobs)
+            if not running and drain and not await loop.run_in_executor(None, len, queue):
+                return completed
+            if jobs and len(running) < self.max_workers:
+                continue
+            if running:
+                done, running = await asyncio.wait(
+                    running, timeout=poll_interval, return_when=asyncio.FIRST_COMPLETED
+                )
+                completed += sum(1 for future in done if future.result())
+            else:
+                await asyncio.sleep(poll_interval)
+
+    async def _run_queued(self, queue: JobQueue, job: QueuedJob) -> bool:
+        """Run one leased job, renewing its lease until the pipeline returns.
+
+        Failed queue updates (e.g. a locked database) are logged and leave
+        the job to be leased again by some worker once its lease expires.
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        pipeline = loop.run_in_executor(None, context.run, self._run_pipeline, job.input)
+        while not (await asyncio.wait({pipeline}, timeout=queue.visibility_timeout / 3))[0]:
+            await self._update_queue(queue.extend, job)
+        try:
+            pipeline.result()
         except Exception as e:
-            self.logger.error(f"Failed to get intermediate results: {str(e)}")
-            return {} 
\ No newline at end of file
+            JOBS.inc(status="failed")
+            self.logger.error(f"Failed to process {job.url} (attempt {job.attempts}): {str(e)}")
+            await self._update_queue(queue.nack, job, str(e))
+            return False
+        JOBS.inc(status="ok")
+        await self._update_queue(queue.ack, job)
+        return True
+
+    async def _update_queue(self, update: Any, job: QueuedJob, *args: Any) -> None:
+        """Call a queue method for a job in a thread, logging any failure."""
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, update, job, *args)
+        except Exception as e:
+            self.logger.error(f"Job queue {update.__name__} failed for {job.url}: {str(e)}")
+
+    def _run_pipeline(self, input_data: Dict[str, Any]) -> Dict[str, str]:
+        """Run every stage for one video in the calling thread."""
+        app = stages.get_app(self.config_path).components
+        video_id = extract_video_id(input_data.get('url', ''))
+        run_id = run_id_var.get() or new_run_id()
+        with log_context(run_id=run_id, video_id=video_id), \
+                video_profiler(app.config, f"{run_id}_{video_id or 'video'}", video_id):
+            validated_input = stages.validate_input(input_data)
+            with timed_stage("process_video"):
+                metadata = stages.process_video(app, validated_input)
+            with timed_stage("generate_content", mode=validated_input['mode']):
+                blog_post = stages.generate_content(app, validated_input, metadata)
+            with timed_stage("format_output"):
+                return stages.format_output(app, blog_post)
@@ -0,0 +1,117 @@
+"""Prefect backend for the workflow orchestrator.
+
+This module imports Prefect at import time and is only loaded when
+``workflow.backend`` is set to ``prefect``.
+"""
+
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
+from prefect import flow, task, get_run_logger, unmapped
+from ..core.content_generator import BlogPost
+from ..core.video_processor import VideoMetadata, extract_video_id
+from . import stages
+
+try:
+    from prefect.task_runners import ThreadPoolTaskRunner
+except ImportError:  # Prefect 2.x
+    from prefect.task_runners import ConcurrentTaskRunner as ThreadPoolTaskRunner
+
+CACHE_EXPIRATION = timedelta(hours=1)
+
+def _video_cache_key(context: Any, parameters: Dict[str, Any]) -> Optional[str]:
+    """Cache key built from task name, video ID, mode and local video file.
+
+    Returns None (no caching) when the URL carries no recognisable video ID.
+    """
+    input_data = parameters['input_data']
+    video_id = extract_video_id(input_data['url'])
+    if not video_id:
+        return None
+    key = f"{context.task.name}:{video_id}:{input_data['mode']}"
+    if input_data.get('video_path'):
+        key += f":{input_data['video_path']}"
+    return key
+
+def task_runner(max_workers: int) -> Any:
+    """Create a thread pool task runner bounded to max_workers."""
+    try:
+        return ThreadPoolTaskRunner(max_workers=max_workers)
+    except TypeError:  # Prefect 2.x runner does not take a worker limit
+        return ThreadPoolTaskRunner()
+
+@task
+def validate_input(input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate workflow input data."""
+    logger = get_run_logger()
+    logger.info("Validating input data")
+    return stages.validate_input(input_data)
+
+@task(cache_key_fn=_video_cache_key, cache_expiration=CACHE_EXPIRATION, persist_result=True)
+def process_video(input_data: Dict[str, Any], components_key: str) -> VideoMetadata:
+    """Process video and extract metadata."""
+    logger = get_run_logger()
+    logger.info(f"Processing video: {input_data['url']}")
+    metadata = stages.process_video(stages.pinned_components(components_key), input_data)
+    # Persist the transcript with the result, so cache hits need no refetch
+    return metadata.load_transcript()
+
+@task(cache_key_fn=_video_cache_key, cache_expiration=CACHE_EXPIRATION, persist_result=True)
+def generate_content(
+    input_data: Dict[str, Any],
+    metadata: VideoMetadata,
+    components_key: str
+) -> BlogPost:
+    """Generate content based on video metadata."""
+    logger = get_run_logger()
+    logger.info(f"Generating {input_data['mode']} content for: {metadata.title}")
+    return stages.generate_content(stages.pinned_components(components_key), input_data, metadata)
+
+@task
+def format_output(blog_post: BlogPost, components_key: str) -> Dict[str, str]:
+    """Save the blog post in all configured formats."""
+    logger = get_run_logger()
+    logger.info(f"Formatting output for: {blog_post.title}")
+    return stages.format_output(stages.pinned_components(components_key), blog_post)
+
+@flow(name="YouTube Content Generation")
+def content_flow(input_data: Dict[str, Any], config_path: str) -> Dict[str, str]:
+    """Run the pipeline for a single video.
+
+    Every task uses the components current when the flow started.
+    """
+    with stages.pin_components(config_path) as components_key:
+        validated_input = validate_input(input_data)
+        metadata = process_video(validated_input, components_key)
+        blog_post = generate_content(validated_input, metadata, components_key)
+        return format_output(blog_post, components_key)
+
+@flow(name="YouTube Batch Content Generation")
+def batch_content_flow(
+    inputs: List[Dict[str, Any]],
+    config_path: str
+) -> List[Optional[Dict[str, str]]]:
+    """Fan the pipeline out over many videos.
+
+    Each stage is mapped over all inputs so independent videos run
+    concurrently on the flow's task runner. A failed video yields None
+    instead of failing the whole batch. Every task uses the components
+    current when the flow started.
+    """
+    logger = get_run_logger()
+
+    with stages.pin_components(config_path) as components_key:
+        validated = validate_input.map(inputs)
+        metadata = process_video.map(validated, unmapped(components_key))
+        blog_posts = generate_content.map(validated, metadata, unmapped(components_key))
+        outputs = format_output.map(blog_posts, unmapped(components_key))
+
+        results: List[Optional[Dict[str, str]]] = []
+        for input_data, future in zip(inputs, outputs):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                # Downstream of a failed task the run never leaves PENDING, so
+                # this also covers videos that failed in an earlier stage.
+                logger.error(f"Failed to process {input_data.get('url')}: {str(e)}")
+                results.append(None)
+        return results
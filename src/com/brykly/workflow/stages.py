@@ -0,0 +1,75 @@
+"""Pipeline stages shared by the orchestrator backends.
+
+Stages take the ``AppComponents`` a job started with, so a configuration
+reload does not change settings part-way through a job.
+"""
+
+import threading
+import uuid
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Iterator
+
+from ..core.app import App, AppComponents
+from ..core.content_generator import BlogPost
+from ..core.video_processor import VideoMetadata
+
+@lru_cache(maxsize=None)
+def get_app(config_path: str) -> App:
+    """Return the App instance shared by all runs using the same config."""
+    return App(config_path=config_path)
+
+_pinned: Dict[str, AppComponents] = {}
+_pinned_lock = threading.Lock()
+
+@contextmanager
+def pin_components(config_path: str) -> Iterator[str]:
+    """Pin the App's current components for one run.
+
+    Yields a key for ``pinned_components``, so stages that look the
+    components up separately (e.g. Prefect tasks) all use the ones the run
+    started with, even if the configuration is reloaded part-way through.
+    """
+    key = uuid.uuid4().hex
+    with _pinned_lock:
+        _pinned[key] = get_app(config_path).components
+    try:
+        yield key
+    finally:
+        with _pinned_lock:
+            _pinned.pop(key, None)
+
+def pinned_components(key: str) -> AppComponents:
+    """The components pinned under ``key`` by ``pin_components``."""
+    with _pinned_lock:
+        return _pinned[key]
+
+def validate_input(input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate workflow input data."""
+    required_fields = ["url", "mode"]
+    missing_fields = [field for field in required_fields if field not in input_data]
+
+    if missing_fields:
+        raise ValueError(f"Missing required fields: {missing_fields}")
+    if input_data["mode"] == "visual" and not input_data.get("video_path"):
+        raise ValueError("Visual mode requires a video_path")
+
+    return input_data
+
+def process_video(app: AppComponents, input_data: Dict[str, Any]) -> VideoMetadata:
+    """Process video and extract metadata (the transcript only if the mode uses it)."""
+    return app.video_processor.extract_metadata(
+        input_data['url'], app.include_transcript(input_data['mode'])
+    )
+
+def generate_content(
+    app: AppComponents,
+    input_data: Dict[str, Any],
+    metadata: VideoMetadata
+) -> BlogPost:
+    """Generate content based on video metadata."""
+    return app.generate_content(metadata, input_data['mode'], input_data.get('video_path'))
+
+def format_output(app: AppComponents, blog_post: BlogPost) -> Dict[str, str]:
+    """Save the blog post in all configured formats."""
+    return app.output_manager.save_all_formats(blog_post)
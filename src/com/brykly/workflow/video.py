@@ -2,11 +2,12 @@
 
 import logging
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from ..external_integration.youtube import YouTubeAdapter
 from ..output_management.transcript import TranscriptManager
 from ..output_management.storage import StorageManager
+from ..config.configuration_manager import ConfigSnapshot
 from .base import BaseWorkflow
 
 logger = logging.getLogger(__name__)
@@ -14,11 +15,11 @@ logger = logging.getLogger(__name__)
 class VideoProcessingWorkflow(BaseWorkflow):
     """Workflow for processing YouTube videos and generating transcripts."""
     
-    def __init__(self, config_path: str = 'config.yaml'):
-        super().__init__(config_path)
-        self.youtube_service = YouTubeAdapter(config_path)
-        self.transcript_manager = TranscriptManager(config_path)
-        self.storage_manager = StorageManager(config_path)
+    def __init__(self, config_path: str = 'config.yaml', config: Optional[ConfigSnapshot] = None):
+        super().__init__(config_path, config)
+        self.youtube_service = YouTubeAdapter(config_path, self.config)
+        self.transcript_manager = TranscriptManager(config_path, self.config)
+        self.storage_manager = StorageManager(config_path, self.config)
     
     async def execute(self, video_url: str) -> Dict[str, Any]:
         """Execute the video processing workflow."""
@@ -37,7 +38,7 @@ class VideoProcessingWorkflow(BaseWorkflow):
             # Step 2: Download video
             download_step = self.add_step(
                 "download_video",
-                "Downloading video from YouTube"
+                "Downloading audio from YouTube"
             )
             download_step.start()
             video_path = await self.youtube_service.download_video(video_url)
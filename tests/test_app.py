@@ -0,0 +1,64 @@
+"""Tests for the core application module."""
+import yaml
+import pytest
+from com.brykly.core.app import App
+from com.brykly.core.content_generator import ContentGenerator
+from com.brykly.core.video_processor import VideoProcessor
+
+def _app_config(tmp_path, model):
+    return {
+        'api': {'openai': {'api_key': 'test_key', 'api_url': 'http://test', 'model': model}},
+        'output': {
+            'directory': str(tmp_path / 'output'),
+            'templates': {'markdown': 'templates/blog_post.md.j2'}
+        }
+    }
+
+@pytest.fixture
+def app_config_file(tmp_path):
+    """Write an App configuration file."""
+    config_file = tmp_path / 'app.yaml'
+    config_file.write_text(yaml.dump(_app_config(tmp_path, 'model-a')))
+    return config_file
+
+def test_reload_config_keeps_in_flight_components(config_manager, app_config_file, tmp_path):
+    """Test that reload swaps components while held ones keep their config."""
+    app = App(config_path=str(app_config_file))
+    in_flight = app.components
+
+    app_config_file.write_text(yaml.dump(_app_config(tmp_path, 'model-b')))
+    assert app.reload_config()
+
+    assert app.components is not in_flight
+    assert app.config['api']['openai']['model'] == 'model-b'
+    assert in_flight.config['api']['openai']['model'] == 'model-a'
+
+def test_reload_config_rejects_invalid_file(config_manager, app_config_file):
+    """Test that a broken file leaves the current components in place."""
+    app = App(config_path=str(app_config_file))
+    components = app.components
+
+    app_config_file.write_text(yaml.dump({'api': {'openai': {}}}))
+    assert not app.reload_config()
+    assert app.components is components
+
+@pytest.mark.parametrize("mode,profiles,fetched", [
+    ("quick", {}, False),
+    ("detailed", {}, True),
+    ("quick", {'quick_summary': {'include_transcript': True}}, False),
+    ("detailed", {'detailed_review': {'include_transcript': False}}, False),
+])
+def test_transcript_fetched_only_when_used(config_manager, tmp_path, monkeypatch, mode, profiles, fetched):
+    """Test that the mode profile decides whether a transcript is fetched."""
+    config_file = tmp_path / 'app.yaml'
+    config_file.write_text(yaml.dump(dict(_app_config(tmp_path, 'model-a'), modes=profiles)))
+    calls = []
+    monkeypatch.setattr(VideoProcessor, "_fetch_info", lambda self, url: {"id": "dQw4w9WgXcQ", "title": "Video"})
+    monkeypatch.setattr(VideoProcessor, "_fetch_transcript", lambda self, video_id: calls.append(video_id))
+    monkeypatch.setattr(ContentGenerator, "_make_api_request", lambda self, prompt: "[Title]\nPost")
+    app = App(config_path=str(config_file))
+    monkeypatch.setattr(app.components.output_manager, "save_all_formats", lambda post: {})
+
+    app.process_video("https://youtu.be/dQw4w9WgXcQ", mode)
+
+    assert bool(calls) is fetched
@@ -0,0 +1,83 @@
+"""Tests for recording and replaying external calls."""
+import time
+import pytest
+from com.brykly.core.content_generator import ContentGenerator
+from com.brykly.core.video_processor import VideoProcessor
+from com.brykly.utils.cassette import Cassette, clear_cassettes
+from com.brykly.utils.exceptions import CassetteMiss
+
+URL = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+
+@pytest.fixture
+def cassette_config(tmp_path):
+    """Build configs for recording to and replaying from one cassette."""
+    clear_cassettes()
+
+    def config(mode, **extra):
+        return {
+            "cassettes": {"mode": mode, "path": str(tmp_path / "run.json.gz"), **extra},
+            "api": {"openai": {
+                "api_key": "test_key",
+                "api_url": "http://llm.invalid/v1/chat/completions",
+                "model": "test-model",
+                "temperature": 0.7,
+                "max_tokens": 100,
+            }},
+        }
+
+    yield config
+    clear_cassettes()
+
+def test_cassette_replays_in_recorded_order(tmp_path):
+    """Test that repeated requests replay in order and misses raise."""
+    path = str(tmp_path / "calls.json.gz")
+    responses = iter([{"n": 1}, {"n": 2}])
+    with Cassette(path, "record") as recorder:
+        recorder.call("llm", "same", lambda: next(responses))
+        recorder.call("llm", "same", lambda: next(responses))
+        assert not (tmp_path / "calls.json.gz").exists()  # written once, on close
+
+    player = Cassette(path, "replay")
+    assert len(player) == 2
+    assert [player.call("llm", "same", pytest.fail)["n"] for _ in range(3)] == [1, 2, 2]
+    with pytest.raises(CassetteMiss):
+        player.call("llm", "other", pytest.fail)
+
+def test_cassette_replays_recorded_latency(tmp_path):
+    """Test that replay_latency sleeps for the recorded duration."""
+    path = str(tmp_path / "slow.json.gz")
+    with Cassette(path, "record") as recorder:
+        recorder.call("yt_dlp", "url", lambda: time.sleep(0.05) or {"id": "x"})
+
+    started = time.perf_counter()
+    Cassette(path, "replay", replay_latency=True).call("yt_dlp", "url", pytest.fail)
+    assert time.perf_counter() - started >= 0.05
+
+def test_pipeline_calls_replay_offline(cassette_config, monkeypatch):
+    """Test metadata, transcript and LLM responses round-trip through a cassette."""
+    info = {"id": "dQw4w9WgXcQ", "title": "Title", "description": "About", "duration": 60,
+            "upload_date": "20240101", "channel": "Channel", "formats": [{"url": "big"}]}
+    completion = {"choices": [{"message": {"content": "A post"}}], "usage": {"prompt_tokens": 5}}
+    monkeypatch.setattr(VideoProcessor, "_extract_info", lambda self, url: info)
+    monkeypatch.setattr(VideoProcessor, "_get_transcript", lambda self, video_id: ("words", "en", True))
+    monkeypatch.setattr(ContentGenerator, "_post", lambda self, payload: completion)
+
+    recorded = VideoProcessor(cassette_config("record")).extract_metadata(URL)
+    assert recorded.transcript == "words"  # transcripts are fetched on first use
+    recorded_post = ContentGenerator(cassette_config("record"))._make_api_request("prompt")
+    clear_cassettes()
+
+    def offline(*args):
+        raise AssertionError("network call during replay")
+
+    monkeypatch.setattr(VideoProcessor, "_extract_info", offline)
+    monkeypatch.setattr(VideoProcessor, "_get_transcript", offline)
+    monkeypatch.setattr(ContentGenerator, "_post", offline)
+    replayed = VideoProcessor(cassette_config("replay")).extract_metadata(URL)
+    generator = ContentGenerator(cassette_config("replay"))
+
+    assert replayed == recorded
+    assert replayed.transcript == "words" and replayed.is_auto_generated
+    assert generator._make_api_request("prompt") == recorded_post == "A post"
+    with pytest.raises(CassetteMiss):
+        generator._make_api_request("a prompt that was never recorded")
@@ -0,0 +1,124 @@
+"""Tests for incremental channel sync."""
+from types import SimpleNamespace
+import pytest
+from com.brykly.workflow.channel_sync import ChannelSync, channel_uploads_url
+from com.brykly.workflow.job_queue import JobQueue
+
+CHANNEL = "https://www.youtube.com/@somechannel"
+
+class FakeChannel:
+    """A channel listing, newest first, that counts the entries read."""
+
+    def __init__(self, count, dated=True):
+        self.uploads = [
+            {"id": f"video{i:06d}", "upload_date": f"2024{1 + i // 28:02d}{1 + i % 28:02d}"}
+            for i in range(count)
+        ]
+        if not dated:
+            for entry in self.uploads:
+                del entry["upload_date"]
+        self.published = count
+        self.read = 0
+
+    def publish(self, count):
+        self.uploads += [
+            {"id": f"video{i:06d}", "upload_date": "20251231"}
+            for i in range(self.published, self.published + count)
+        ]
+        self.published += count
+
+    def iter_entries(self, url):
+        assert url == f"{CHANNEL}/videos"
+        for entry in reversed(self.uploads):
+            self.read += 1
+            yield entry
+
+@pytest.fixture
+def queue(tmp_path):
+    return JobQueue(str(tmp_path / "jobs.db"))
+
+def queued_urls(queue):
+    return [job.url for job in queue.lease(limit=1000)]
+
+@pytest.mark.parametrize("url,expected", [
+    ("https://www.youtube.com/@somechannel", f"{CHANNEL}/videos"),
+    ("https://www.youtube.com/@somechannel/videos", f"{CHANNEL}/videos"),
+    ("https://youtube.com/channel/UC123/", "https://youtube.com/channel/UC123/videos"),
+    ("https://www.youtube.com/playlist?list=PL123", None),
+    ("https://youtu.be/dQw4w9WgXcQ", None),
+])
+def test_channel_uploads_url(url, expected):
+    """Test that channel URLs map to their Videos tab."""
+    assert channel_uploads_url(url) == expected
+
+def test_first_sync_backfills(queue):
+    """Test that a first sync queues only the newest videos, oldest first."""
+    channel = FakeChannel(500)
+    result = ChannelSync(queue, channel, backfill=3).sync(CHANNEL, "detailed")
+
+    assert len(result.job_ids) == 3
+    assert channel.read == 3
+    assert result.watermark.video_id == "video000499"
+    assert queued_urls(queue) == [
+        f"https://www.youtube.com/watch?v=video{i:06d}" for i in (497, 498, 499)
+    ]
+
+def test_later_syncs_stop_at_watermark(queue):
+    """Test that only uploads newer than the watermark are listed and queued."""
+    channel = FakeChannel(500)
+    channel_sync = ChannelSync(queue, channel, backfill=1)
+    channel_sync.sync(CHANNEL)
+    queued_urls(queue)
+
+    channel.publish(2)
+    channel.read = 0
+    result = channel_sync.sync(CHANNEL)
+
+    assert channel.read == 3
+    assert queued_urls(queue) == [
+        "https://www.youtube.com/watch?v=video000500",
+        "https://www.youtube.com/watch?v=video000501",
+    ]
+    assert result.watermark.video_id == "video000501"
+    assert result.watermark.upload_date == "20251231"
+
+    assert channel_sync.sync(CHANNEL).job_ids == []
+    assert [mark.video_id for mark in channel_sync.watermarks()] == ["video000501"]
+
+def test_deleted_watermark_video(queue):
+    """Test that the upload date bounds the listing if the watermark video is gone."""
+    channel = FakeChannel(100)
+    channel_sync = ChannelSync(queue, channel, backfill=1)
+    channel_sync.sync(CHANNEL)
+    queued_urls(queue)
+
+    del channel.uploads[-1]
+    channel.publish(1)
+    channel.read = 0
+    result = channel_sync.sync(CHANNEL)
+
+    assert len(result.job_ids) == 1
+    assert channel.read == 2
+
+def test_deleted_watermark_video_undated_listing(queue):
+    """Test that earlier seen IDs bound the listing when it carries no dates."""
+    channel = FakeChannel(100, dated=False)
+    channel_sync = ChannelSync(queue, channel, backfill=5)
+    channel_sync.sync(CHANNEL)
+    queued_urls(queue)
+
+    del channel.uploads[-2:]
+    channel.publish(1)
+    channel.uploads[-1].pop("upload_date")
+    channel.read = 0
+    result = channel_sync.sync(CHANNEL)
+
+    assert queued_urls(queue) == ["https://www.youtube.com/watch?v=video000100"]
+    assert channel.read == 2
+    assert result.watermark.video_id == "video000100"
+    assert result.watermark.recent_ids == [f"video{i:06d}" for i in (99, 98, 97, 96, 95)]
+
+def test_rejects_non_channel_urls(queue):
+    """Test that playlists and videos cannot be synced."""
+    with pytest.raises(ValueError):
+        ChannelSync(queue, SimpleNamespace()).sync("https://www.youtube.com/playlist?list=PL123")
@@ -0,0 +1,200 @@
+"""Tests for the configuration manager module."""
+import pickle
+import threading
+import time
+import pytest
+import yaml
+from com.brykly.config.config_watcher import ConfigWatcher
+from com.brykly.config.configuration_manager import (
+    ConfigSnapshot,
+    ConfigurationManager,
+    clear_config_cache,
+    load_config,
+    validate_config
+)
+from com.brykly.external_integration.yolo_adapter import YOLOAdapter
+from com.brykly.utils.config import ConfigManager
+from com.brykly.utils.exceptions import ConfigurationError
+from com.brykly.workflow.video import VideoProcessingWorkflow
+
+def test_snapshot_dotted_lookup():
+    """Test lookups of leaves, sections and missing keys."""
+    snapshot = ConfigSnapshot({"api": {"yolo": {"model": "yolov8n.pt"}}, "formats": ["md"]})
+
+    assert snapshot.get("api.yolo.model") == "yolov8n.pt"
+    assert snapshot.get("api.yolo") == {"model": "yolov8n.pt"}
+    assert snapshot.get("formats") == ("md",)
+    assert snapshot.get("api.yolo.model.name", "default") == "default"
+    assert snapshot.get("missing") is None
+
+def test_snapshot_is_read_only():
+    """Test that snapshots reject mutation and copy on write."""
+    snapshot = ConfigSnapshot({"api": {"yolo": {"model": "yolov8n.pt"}}})
+
+    with pytest.raises(TypeError):
+        snapshot.get("api.yolo")["model"] = "other.pt"
+    with pytest.raises(TypeError):
+        snapshot.data["api"].update({})
+
+    updated = snapshot.with_value("api.yolo.model", "yolov8s.pt")
+    assert updated.get("api.yolo.model") == "yolov8s.pt"
+    assert updated.version == snapshot.version + 1
+    assert snapshot.get("api.yolo.model") == "yolov8n.pt"
+
+def test_snapshot_pickles():
+    """Test that snapshots survive pickling and stay read-only."""
+    snapshot = ConfigSnapshot({"api": {"yolo": {"model": "yolov8n.pt"}}, "formats": ["md"]}, version=3)
+
+    restored = pickle.loads(pickle.dumps(snapshot))
+
+    assert restored.data == snapshot.data and restored.version == 3
+    assert restored.get("api.yolo.model") == "yolov8n.pt"
+    with pytest.raises(TypeError):
+        restored.get("api.yolo")["model"] = "other.pt"
+    assert pickle.loads(pickle.dumps(snapshot.get("api"))) == {"yolo": {"model": "yolov8n.pt"}}
+
+def test_section_getters_return_copies(config_manager):
+    """Test that callers cannot change the shared configuration."""
+    output_config = config_manager.get_output_config()
+    output_config["directory"] = "/elsewhere"
+
+    assert config_manager.get("output.directory") == "/tmp/test/output"
+
+def test_adapter_configuration_is_private(config_manager):
+    """Test that set_configuration does not leak into other adapters."""
+    adapter = YOLOAdapter()
+    adapter.set_configuration({"model": "custom.pt"})
+
+    assert adapter.config["model"] == "custom.pt"
+    assert config_manager.get("api.yolo.model") != "custom.pt"
+    assert YOLOAdapter().config.get("model") != "custom.pt"
+
+def test_concurrent_set_publishes_whole_snapshots(config_manager):
+    """Test that readers never see a partially applied change."""
+    original = config_manager.snapshot()
+    torn = []
+
+    def write():
+        for i in range(200):
+            config_manager.set("workflow", {"max_workers": i, "timeout": i})
+
+    def read():
+        for _ in range(2000):
+            workflow = config_manager.snapshot().get("workflow") or {}
+            if workflow.get("max_workers") != workflow.get("timeout"):
+                torn.append(workflow)
+
+    try:
+        config_manager.set("workflow", {"max_workers": 0, "timeout": 0})
+        threads = [threading.Thread(target=write)] + [threading.Thread(target=read) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not torn
+        assert config_manager.get("workflow.max_workers") == 199
+    finally:
+        ConfigurationManager()._snapshot = original
+
+def test_reload_validates_swaps_and_notifies(config_manager, test_config, tmp_path):
+    """Test that reload publishes valid files to subscribers and keeps old snapshots intact."""
+    original_path = config_manager._config_path
+    original = config_manager.snapshot()
+    changes = []
+
+    def listener(old, new):
+        changes.append((old.version, new.version, new.get("workflow.max_workers")))
+
+    config_file = tmp_path / "reload.yaml"
+    config_file.write_text(yaml.dump({**test_config, "workflow": {"max_workers": 8}}))
+    try:
+        config_manager._config_path = config_file
+        config_manager.subscribe(listener)
+
+        assert config_manager.reload()
+        assert config_manager.get("workflow.max_workers") == 8
+        assert original.get("workflow.max_workers") is None
+        assert changes == [(original.version, original.version + 1, 8)]
+
+        assert not config_manager.reload()
+        assert config_manager.snapshot().version == original.version + 1
+        assert len(changes) == 1
+
+        config_file.write_text("workflow: [not, a, mapping]")
+        assert not config_manager.reload()
+        assert config_manager.get("workflow.max_workers") == 8
+        assert len(changes) == 1
+    finally:
+        config_manager.unsubscribe(listener)
+        config_manager._config_path = original_path
+        ConfigurationManager()._snapshot = original
+
+def test_config_watcher_detects_changes(tmp_path):
+    """Test that the watcher fires once per file change."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("a: 1")
+    calls = []
+    watcher = ConfigWatcher(str(config_file), lambda: calls.append(1), interval=0.01)
+
+    assert not watcher.check()
+    config_file.write_text("a: 22")
+    assert watcher.check()
+    assert not watcher.check()
+
+    with watcher:
+        config_file.write_text("a: 333")
+        deadline = time.monotonic() + 2
+        while len(calls) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    assert len(calls) == 2
+
+def test_validate_config_reports_type_errors():
+    """Test schema validation of known keys."""
+    validate_config({"api": {"yolo": {"device": None, "batch_size": 8}}, "custom": [1]})
+
+    with pytest.raises(ConfigurationError) as error:
+        validate_config({"workflow": {"max_workers": "4", "config_reload_interval": True}})
+    assert "'workflow.max_workers' must be int, got str" in str(error.value)
+    assert "'workflow.config_reload_interval'" in str(error.value)
+
+    with pytest.raises(ConfigurationError):
+        validate_config(["not", "a", "mapping"])
+
+def test_load_config_parses_once_per_file_version(test_config_file, monkeypatch):
+    """Test that repeated loads share one snapshot until the file changes."""
+    parses = []
+    original = yaml.load
+    monkeypatch.setattr(yaml, "load", lambda *args, **kwargs: parses.append(1) or original(*args, **kwargs))
+    clear_config_cache()
+
+    first = load_config(test_config_file)
+    assert load_config(test_config_file) is first
+    assert len(parses) == 1
+
+    with open(test_config_file, "a") as f:
+        f.write("extra: true\n")
+    assert load_config(test_config_file).get("extra") is True
+    assert len(parses) == 2
+
+def test_config_manager_set_keeps_secrets_out_of_file(test_config_file, tmp_path, monkeypatch):
+    """Test that saving a value writes the file as it was, without env overrides."""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-secret")
+    other_file = tmp_path / "other.yaml"
+    other_file.write_text(open(test_config_file).read())
+    other = load_config(other_file)
+    manager = ConfigManager(test_config_file)
+
+    manager.set("foo", 1)
+
+    assert manager.get("foo") == 1
+    assert manager.config["api"]["openai"]["api_key"] == "sk-secret"
+    assert "sk-secret" not in open(test_config_file).read()
+    assert load_config(other_file) is other
+
+def test_workflows_share_injected_config(config_manager, test_config_file):
+    """Test that a workflow's adapters and managers use its snapshot."""
+    workflow = VideoProcessingWorkflow(test_config_file)
+
+    assert workflow.youtube_service.config.snapshot is workflow.config
+    assert workflow.transcript_manager.config.snapshot is workflow.config
+    assert workflow.storage_manager.config.snapshot is workflow.config
@@ -0,0 +1,64 @@
+"""Tests for the columnar detections module."""
+import io
+import json
+from types import SimpleNamespace
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from com.brykly.external_integration.detections import Detections
+
+NAMES = {0: "person", 1: "car", 2: "dog"}
+
+def _result(class_ids, confidences):
+    boxes = SimpleNamespace(
+        cls=np.array(class_ids, dtype=np.float32),
+        conf=np.array(confidences, dtype=np.float32),
+        xyxy=np.array([[i, i, i + 10, i + 10] for i in range(len(class_ids))], dtype=np.float32)
+    )
+    return SimpleNamespace(boxes=boxes, names=NAMES)
+
+@pytest.fixture
+def detections():
+    """Detections spread over three frames at 30 fps."""
+    return Detections.concat([
+        Detections.from_result(_result([0, 1], [0.9, 0.8]), frame_index=0),
+        Detections.from_result(_result([0], [0.7]), frame_index=30),
+        Detections.from_result(_result([0, 0, 2], [0.6, 0.5, 0.4]), frame_index=90),
+    ])
+
+def test_from_result_and_concat(detections):
+    """Test that results are stored as flat arrays."""
+    assert len(detections) == 6
+    assert detections.frame_index.tolist() == [0, 0, 30, 90, 90, 90]
+    assert detections.class_id.dtype == np.int32
+    assert detections.boxes.shape == (6, 4)
+
+def test_class_counts(detections):
+    """Test per-class counts."""
+    assert detections.class_counts() == {"person": 4, "car": 1, "dog": 1}
+    assert Detections.empty().class_counts() == {}
+
+def test_timeline(detections):
+    """Test per-class counts in time bins."""
+    timeline = detections.timeline(fps=30, bin_seconds=1.0)
+    assert timeline["person"].tolist() == [1, 1, 0, 2]
+    assert timeline["dog"].tolist() == [0, 0, 0, 1]
+
+def test_iteration_yields_detected_objects(detections):
+    """Test lazy DetectedObject iteration."""
+    first = next(iter(detections))
+    assert first.class_name == "person"
+    assert first.confidence == pytest.approx(0.9)
+    assert first.bbox == [0.0, 0.0, 10.0, 10.0]
+
+def test_to_json_streams_records(detections):
+    """Test JSON export."""
+    buffer = io.StringIO()
+    detections.to_json(buffer)
+    records = json.loads(buffer.getvalue())
+    assert len(records) == 6
+    assert records[-1] == {"frame": 90, "class": "dog", "confidence": pytest.approx(0.4), "bbox": [2.0, 2.0, 12.0, 12.0]}
+    buffer = io.StringIO()
+    Detections.empty().to_json(buffer)
+    assert buffer.getvalue() == "[]"
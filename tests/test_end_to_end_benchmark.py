@@ -0,0 +1,32 @@
+"""Smoke test for the offline end-to-end benchmark."""
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+BENCHMARK = Path(__file__).resolve().parent.parent / "benchmarks" / "end_to_end.py"
+
+def test_benchmark_writes_results_and_flags_regressions(tmp_path):
+    """Test a tiny offline run against a baseline it cannot meet."""
+    results_file = tmp_path / "results.json"
+    baseline_file = tmp_path / "baseline.json"
+    baseline_file.write_text(json.dumps({
+        "single": {"p50_ms": 1e6, "p95_ms": 1e6},
+        "batch": {"2": {"videos_per_s": 1e6}},
+    }))
+
+    proc = subprocess.run(
+        [sys.executable, str(BENCHMARK), "--runs", "2", "--videos", "2", "--concurrency", "1,2",
+         "--latency-ms", "0", "--formats", "markdown", "--output", str(results_file),
+         "--baseline", str(baseline_file)],
+        capture_output=True,
+        text=True,
+        timeout=120
+    )
+
+    results = json.loads(results_file.read_text())
+    assert set(results["batch"]) == {"1", "2"}
+    assert results["single"]["runs"] == 2
+    assert results["single"]["stages_ms"]["generate_content"] > 0
+    assert proc.returncode == 1
+    assert "batch.2.videos_per_s" in proc.stdout and "REGRESSION" in proc.stdout
@@ -0,0 +1,45 @@
+"""Startup-time checks for the package and CLI imports."""
+import subprocess
+import sys
+import pytest
+
+HEAVY_MODULES = ["prefect", "ultralytics", "cv2", "reportlab", "yt_dlp"]
+IMPORT_BUDGET_SECONDS = 1.0
+
+def _imported_modules(module):
+    """Import a module in a fresh interpreter and return its sys.modules keys."""
+    code = f"import sys, {module}; print('\\n'.join(sys.modules))"
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return set(proc.stdout.split())
+
+@pytest.mark.parametrize("module", ["com.brykly", "com.brykly.cli"])
+def test_no_heavy_backends_imported(module):
+    """Test that importing the package leaves heavy backends unloaded."""
+    imported = _imported_modules(module)
+    assert not [name for name in HEAVY_MODULES if name in imported]
+
+def test_cli_import_time_budget():
+    """Test that the CLI imports within the startup budget."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import com.brykly.cli"],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    last_line = proc.stderr.strip().splitlines()[-1]
+    cumulative_us = int(last_line.split("|")[1])
+    assert cumulative_us / 1_000_000 < IMPORT_BUDGET_SECONDS
+
+def test_lazy_package_attributes():
+    """Test that public names still resolve from the package root."""
+    import com.brykly
+    from com.brykly.workflow.orchestrator import WorkflowOrchestrator
+
+    assert com.brykly.WorkflowOrchestrator is WorkflowOrchestrator
+    with pytest.raises(AttributeError):
+        com.brykly.DoesNotExist
@@ -0,0 +1,141 @@
+"""Tests for the durable job queue."""
+import multiprocessing
+import time
+import pytest
+from com.brykly.workflow.job_queue import JobQueue
+
+@pytest.fixture
+def queue(tmp_path):
+    return JobQueue(str(tmp_path / "jobs.db"), visibility_timeout=60, max_attempts=2, retry_delay=0)
+
+def test_priorities_and_order(queue):
+    """Test that quick jobs are leased before detailed ones, oldest first."""
+    queue.enqueue("https://youtu.be/detailed001", "detailed")
+    queue.enqueue_many(["https://youtu.be/quick000001", "https://youtu.be/quick000002"], "quick")
+    queue.enqueue("https://youtu.be/urgent00001", "detailed", priority=-1)
+
+    urls = [job.url for job in queue.lease(limit=10)]
+
+    assert urls == [
+        "https://youtu.be/urgent00001",
+        "https://youtu.be/quick000001",
+        "https://youtu.be/quick000002",
+        "https://youtu.be/detailed001",
+    ]
+    assert queue.lease() == []
+    assert queue.stats() == {'ready': 0, 'leased': 4, 'delayed': 0, 'dead': 0}
+
+def test_ack_removes_job(queue):
+    """Test that acknowledged jobs are gone for good."""
+    queue.enqueue("https://youtu.be/dQw4w9WgXcQ", "quick", video_path="video.mp4")
+    [job] = queue.lease()
+
+    assert job.input == {'url': "https://youtu.be/dQw4w9WgXcQ", 'mode': 'quick', 'video_path': "video.mp4"}
+    assert job.attempts == 1
+    assert queue.ack(job)
+    assert len(queue) == 0
+
+def test_expired_lease_is_released(queue):
+    """Test that a job whose consumer died is leased again, and the old lease is void."""
+    queue.visibility_timeout = 0.05
+    queue.enqueue("https://youtu.be/dQw4w9WgXcQ")
+    [first] = queue.lease()
+    time.sleep(0.1)
+
+    [second] = queue.lease()
+
+    assert second.id == first.id
+    assert second.attempts == 2
+    assert not queue.ack(first)
+    assert not queue.extend(first)
+    assert queue.ack(second)
+
+def test_extend_keeps_job_hidden(queue):
+    """Test that renewing a lease stops the job from being re-leased."""
+    queue.visibility_timeout = 0.05
+    queue.enqueue("https://youtu.be/dQw4w9WgXcQ")
+    [job] = queue.lease()
+
+    assert queue.extend(job, seconds=60)
+    time.sleep(0.1)
+    assert queue.lease() == []
+
+def test_retries_then_dead_letters(queue):
+    """Test bounded retries, the dead-letter table and requeueing."""
+    queue.enqueue("https://youtu.be/dQw4w9WgXcQ")
+
+    [job] = queue.lease()
+    assert queue.nack(job, "first failure")
+    [job] = queue.lease()
+    assert job.last_error == "first failure"
+    assert queue.nack(job, "second failure")
+
+    assert len(queue) == 0
+    [dead] = queue.dead_letters()
+    assert dead['error'] == "second failure"
+    assert dead['attempts'] == 2
+
+    assert queue.requeue_dead() == 1
+    [job] = queue.lease()
+    assert job.attempts == 1
+    assert queue.stats()['dead'] == 0
+
+def test_retry_backoff(queue):
+    """Test that a failed job waits retry_delay before it is leased again."""
+    queue.retry_delay = 60
+    queue.enqueue("https://youtu.be/dQw4w9WgXcQ")
+    [job] = queue.lease()
+    queue.nack(job, "boom")
+
+    assert queue.lease() == []
+    assert queue.stats()['delayed'] == 1
+
+def test_abandoned_job_is_dead_lettered(queue):
+    """Test that a job that keeps killing its consumer stops being retried."""
+    queue.visibility_timeout = 0.01
+    queue.enqueue("https://youtu.be/dQw4w9WgXcQ")
+    queue.lease()
+    time.sleep(0.02)
+    queue.lease()
+    time.sleep(0.02)
+
+    assert queue.lease() == []
+    assert queue.dead_letters()[0]['error'] == "Lease expired"
+
+def _consume(path, results):
+    queue = JobQueue(path, visibility_timeout=60)
+    while True:
+        jobs = queue.lease(limit=3)
+        if not jobs:
+            return
+        for job in jobs:
+            results.put(job.id)
+            queue.ack(job)
+
+def test_consumers_in_several_processes(queue):
+    """Test that concurrent processes never lease the same job twice."""
+    ids = queue.enqueue_many([f"https://youtu.be/video{i:06d}" for i in range(200)])
+    results = multiprocessing.Queue()
+    workers = [
+        multiprocessing.Process(target=_consume, args=(str(queue.path), results)) for _ in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    leased = [results.get(timeout=30) for _ in ids]
+    for worker in workers:
+        worker.join(timeout=30)
+
+    assert sorted(leased) == ids
+    assert len(queue) == 0
+
+def test_enqueue_stream_commits_pages(queue):
+    """Test that a lazy listing is queued page by page."""
+    visible = []
+
+    def listing():
+        for i in range(5):
+            visible.append(len(queue))
+            yield f"https://youtu.be/video{i:06d}"
+
+    assert queue.enqueue_stream(listing(), "quick", page_size=2) == 5
+    assert visible == [0, 0, 2, 2, 4]
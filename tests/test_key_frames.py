@@ -0,0 +1,79 @@
+"""Tests for the key frame store module."""
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+np = pytest.importorskip("numpy")
+
+from com.brykly.external_integration.key_frames import KeyFrameStore
+
+def _frame(hue, width=640, height=360):
+    """Create a saturated BGR frame of the given hue."""
+    hsv = np.full((height, width, 3), (hue, 255, 255), dtype=np.uint8)
+    return cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR)
+
+def test_rejects_repeated_scene_without_new_classes():
+    """Test that near-duplicate frames are not kept twice."""
+    store = KeyFrameStore(max_frames=5)
+
+    assert store.offer(_frame(0), 0, 0.0, ["person"])
+    assert not store.offer(_frame(0), 30, 1.0, ["person"])
+    assert store.offer(_frame(0), 60, 2.0, ["person", "dog"])
+    assert len(store) == 2
+
+def test_bounded_count_and_thumbnail_size():
+    """Test that the store never exceeds max_frames and downscales frames."""
+    store = KeyFrameStore(max_frames=3, thumbnail_size=(160, 90))
+
+    for i in range(20):
+        store.offer(_frame(i * 9), i * 30, float(i), ["person"])
+
+    frames = store.frames
+    assert len(frames) == 3
+    assert [f.frame_index for f in frames] == sorted(f.frame_index for f in frames)
+    assert frames[0].load().size == (160, 90)
+    assert all(f.data is not None and f.path is None for f in frames)
+
+def test_keeps_rare_classes_when_full():
+    """Test that the only frame showing a class is not evicted."""
+    store = KeyFrameStore(max_frames=2)
+
+    store.offer(_frame(0), 0, 0.0, ["person"])
+    store.offer(_frame(60), 30, 1.0, ["car"])
+    store.offer(_frame(120), 60, 2.0, ["person"])
+
+    classes = set().union(*(f.class_names for f in store.frames))
+    assert classes == {"person", "car"}
+
+def test_disk_spool(tmp_path):
+    """Test that thumbnails spool to disk and evicted files are removed."""
+    store = KeyFrameStore(max_frames=2, directory=str(tmp_path / "frames"))
+
+    for i in range(6):
+        store.offer(_frame(i * 30), i * 30, float(i), [f"class{i}"])
+
+    files = sorted(store.directory.iterdir())
+    assert store.directory.parent == tmp_path / "frames"
+    assert len(files) == 2
+    assert sorted(f.path for f in store.frames) == files
+    assert all(f.data is None for f in store.frames)
+    assert store.frames[0].load().mode == "RGB"
+
+def test_stores_sharing_a_directory(tmp_path):
+    """Test that stores spooling to one directory keep separate thumbnails."""
+    first = KeyFrameStore(directory=str(tmp_path))
+    second = KeyFrameStore(directory=str(tmp_path))
+
+    first.offer(_frame(0), 0, 0.0, ["person"])
+    second.offer(_frame(90), 0, 0.0, ["car"])
+
+    [a], [b] = first.frames, second.frames
+    assert a.path != b.path and a.path.exists() and b.path.exists()
+    assert a.load().getpixel((0, 0)) != b.load().getpixel((0, 0))
+
+def test_close_deletes_spooled_thumbnails(tmp_path):
+    """Test that closing a store deletes the directory it spooled into."""
+    with KeyFrameStore(directory=str(tmp_path)) as store:
+        store.offer(_frame(0), 0, 0.0, ["person"])
+        assert store.frames[0].path.exists()
+
+    assert list(tmp_path.iterdir()) == []
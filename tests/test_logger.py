@@ -0,0 +1,122 @@
+"""Tests for the logger module."""
+import json
+import logging
+import threading
+import pytest
+from loguru import logger as loguru_logger
+from com.brykly.utils.async_logging import AsyncLogQueue
+from com.brykly.utils.log_context import log_context, timed_stage
+
+@pytest.fixture
+def configured_logger(config_manager, logger):
+    """Reconfigure the logger for a test and restore it afterwards."""
+    yield logger
+    logger.configure(config_manager.get_logging_config())
+
+def test_async_logging_writes_all_records_in_order(configured_logger, tmp_path):
+    """Test that queued records reach the file sink in call order."""
+    log_file = tmp_path / "async.log"
+    configured_logger.configure({
+        "async": True,
+        "file": str(log_file),
+        "format": "{level} {message}",
+        "console_level": "CRITICAL",
+        "file_level": "DEBUG"
+    })
+
+    def work(worker):
+        for i in range(100):
+            configured_logger.debug(f"worker {worker} record {i}")
+
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    configured_logger.flush()
+
+    lines = log_file.read_text().splitlines()
+    assert len(lines) == 400
+    for worker in range(4):
+        records = [line for line in lines if line.startswith(f"DEBUG worker {worker} ")]
+        assert records == [f"DEBUG worker {worker} record {i}" for i in range(100)]
+
+def test_per_sink_levels(configured_logger, tmp_path, capsys):
+    """Test that console and file sinks filter levels independently."""
+    log_file = tmp_path / "levels.log"
+    configured_logger.configure({
+        "file": str(log_file),
+        "format": "{level} {message}",
+        "console_level": "ERROR",
+        "file_level": "INFO"
+    })
+
+    configured_logger.info("to file only")
+    configured_logger.error("to both")
+
+    assert log_file.read_text().splitlines() == ["INFO to file only", "ERROR to both"]
+    assert "to file only" not in capsys.readouterr().out
+
+def test_drop_policy_counts_overflow():
+    """Test that a full queue drops records instead of blocking."""
+    log_queue = AsyncLogQueue(maxsize=2, overflow="drop")  # writer not started
+    handler_id = loguru_logger.add(log_queue.sink, format="{message}")
+    try:
+        for i in range(5):
+            loguru_logger.info(f"record {i}")
+    finally:
+        loguru_logger.remove(handler_id)
+
+    assert log_queue.dropped == 3
+
+def test_invalid_overflow_policy():
+    """Test that unknown overflow policies are rejected."""
+    with pytest.raises(ValueError):
+        AsyncLogQueue(overflow="spill")
+
+def _json_lines(log_file):
+    return [json.loads(line) for line in log_file.read_text().splitlines()]
+
+@pytest.mark.parametrize("async_mode", [False, True])
+def test_json_records_carry_context_from_both_stacks(configured_logger, tmp_path, async_mode):
+    """Test that loguru and stdlib records get the bound run and video IDs."""
+    log_file = tmp_path / "structured.log"
+    configured_logger.configure({
+        "json": True,
+        "async": async_mode,
+        "file": str(log_file),
+        "console_level": "CRITICAL",
+        "file_level": "INFO"
+    })
+
+    with log_context(run_id="run-1", video_id="dQw4w9WgXcQ"):
+        configured_logger.info("from loguru")
+        logging.getLogger("com.brykly.test").warning("from stdlib %s", "logging")
+    configured_logger.info("outside")
+    configured_logger.flush()
+
+    records = _json_lines(log_file)
+    assert [(r["message"], r["level"], r["run_id"], r["video_id"]) for r in records] == [
+        ("from loguru", "INFO", "run-1", "dQw4w9WgXcQ"),
+        ("from stdlib logging", "WARNING", "run-1", "dQw4w9WgXcQ"),
+        ("outside", "INFO", None, None),
+    ]
+    assert records[1]["function"] == "test_json_records_carry_context_from_both_stacks"
+    assert "_replayed" not in records[0]
+
+def test_timed_stage_logs_duration(configured_logger, tmp_path):
+    """Test stage events for latency breakdowns."""
+    log_file = tmp_path / "stages.log"
+    configured_logger.configure({"json": True, "file": str(log_file), "console_level": "CRITICAL"})
+
+    with log_context(video_id="abc"):
+        with timed_stage("process_video"):
+            pass
+        with pytest.raises(RuntimeError):
+            with timed_stage("generate_content", mode="quick"):
+                raise RuntimeError("boom")
+
+    ok, failed = _json_lines(log_file)
+    assert (ok["event"], ok["stage"], ok["status"], ok["video_id"]) == ("stage", "process_video", "ok", "abc")
+    assert ok["duration_ms"] >= 0
+    assert (failed["stage"], failed["status"], failed["mode"]) == ("generate_content", "error", "quick")
@@ -0,0 +1,100 @@
+"""Tests for the metrics registry."""
+import urllib.request
+import pytest
+from com.brykly.utils.log_context import timed_stage
+from com.brykly.utils.metrics import JOBS, STAGE_SECONDS, MetricsRegistry, registry
+from com.brykly.workflow.orchestrator import WorkflowOrchestrator
+
+@pytest.fixture
+def metrics():
+    """The shared registry, cleared before and after the test."""
+    registry.reset()
+    yield registry
+    registry.reset()
+
+def test_registry_is_shared():
+    """Test that every MetricsRegistry() is the same instance."""
+    assert MetricsRegistry() is registry
+
+def test_counter_renders_prometheus_text(metrics):
+    """Test counter totals per label set and the exposition format."""
+    counter = metrics.counter("test_requests_total", "Test requests.", ("cache", "result"))
+    counter.inc(cache="model", result="hit")
+    counter.inc(2, cache="model", result="hit")
+    counter.inc(cache="model", result="miss")
+
+    assert metrics.counter("test_requests_total", "Test requests.", ("cache", "result")) is counter
+    assert counter.value(cache="model", result="hit") == 3
+    text = metrics.render()
+    assert "# TYPE test_requests_total counter" in text
+    assert 'test_requests_total{cache="model",result="hit"} 3' in text
+    assert 'test_requests_total{cache="model",result="miss"} 1' in text
+
+def test_metric_rejects_wrong_labels(metrics):
+    """Test that label names must match the declaration."""
+    counter = metrics.counter("test_labelled_total", "Labelled.", ("format",))
+    with pytest.raises(ValueError):
+        counter.inc(kind="html")
+    with pytest.raises(ValueError):
+        counter.inc(-1, format="html")
+    with pytest.raises(ValueError):
+        metrics.histogram("test_labelled_total", "Not a counter.")
+
+def test_histogram_buckets_are_cumulative(metrics):
+    """Test bucket counts, sum and count for a histogram."""
+    histogram = metrics.histogram("test_latency_seconds", "Latency.", ("stage",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, stage="save")
+
+    text = metrics.render()
+    assert 'test_latency_seconds_bucket{stage="save",le="0.1"} 2' in text
+    assert 'test_latency_seconds_bucket{stage="save",le="1"} 3' in text
+    assert 'test_latency_seconds_bucket{stage="save",le="+Inf"} 4' in text
+    assert 'test_latency_seconds_count{stage="save"} 4' in text
+    assert histogram.sum(stage="save") == pytest.approx(3.65)
+
+def test_timed_stage_observes_latency(metrics):
+    """Test that timed stages feed the stage latency histogram."""
+    with timed_stage("unit"):
+        pass
+    with pytest.raises(RuntimeError):
+        with timed_stage("unit"):
+            raise RuntimeError("boom")
+
+    assert STAGE_SECONDS.count(stage="unit", status="ok") == 1
+    assert STAGE_SECONDS.count(stage="unit", status="error") == 1
+
+def test_serve_exposes_metrics_over_http(metrics):
+    """Test the /metrics endpoint."""
+    metrics.counter("test_served_total", "Served.").inc()
+    server = metrics.serve(0)
+    try:
+        host, port = server.server_address[:2]
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics") as response:
+            body = response.read().decode()
+            content_type = response.headers["Content-Type"]
+    finally:
+        metrics.stop_serving()
+
+    assert content_type.startswith("text/plain")
+    assert "test_served_total 1" in body
+
+def test_batch_dumps_metrics_file(config_manager, test_config_file, tmp_path, monkeypatch, metrics):
+    """Test that a batch run writes the metrics file when configured."""
+    metrics_file = tmp_path / "metrics" / "ytblog.prom"
+    orchestrator = WorkflowOrchestrator(test_config_file)
+    orchestrator.metrics_config = {"file": str(metrics_file)}
+
+    def fake_pipeline(input_data):
+        if input_data["url"].endswith("bad"):
+            raise RuntimeError("boom")
+        with timed_stage("process_video"):
+            return {"markdown": "post.md"}
+
+    monkeypatch.setattr(orchestrator, "_run_pipeline", fake_pipeline)
+    orchestrator.run_batch(["https://youtu.be/good", "https://youtu.be/bad"])
+
+    text = metrics_file.read_text()
+    assert JOBS.value(status="ok") == JOBS.value(status="failed") == 1
+    assert 'ytblog_jobs_total{status="failed"} 1' in text
+    assert 'ytblog_stage_duration_seconds_count{stage="process_video",status="ok"} 1' in text
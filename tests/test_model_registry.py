@@ -0,0 +1,75 @@
+"""Tests for the model registry module."""
+import threading
+import time
+import pytest
+
+pytest.importorskip("numpy")
+
+from com.brykly.external_integration import model_registry
+from com.brykly.external_integration.model_registry import ModelRegistry
+
+class FakeModel:
+    """Counts inference calls."""
+
+    def __init__(self, path):
+        self.path = path
+        self.calls = 0
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        return []
+
+@pytest.fixture
+def registry(monkeypatch, config_manager):
+    """A cleared registry with a counting fake loader."""
+    loads = []
+
+    def fake_load(model_path, device):
+        time.sleep(0.05)
+        loads.append((model_path, device))
+        return FakeModel(model_path)
+
+    monkeypatch.setattr(model_registry, "_load_yolo", fake_load)
+    registry = ModelRegistry()
+    registry.clear()
+    registry.loads = loads
+    yield registry
+    registry.clear()
+
+def test_registry_is_process_wide(registry):
+    """Test that every instance is the same registry."""
+    assert ModelRegistry() is registry
+
+def test_get_loads_once_and_warms_up(registry):
+    """Test that repeated and concurrent gets share one loaded model."""
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(registry.get("yolov8n.pt")))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert registry.loads == [("yolov8n.pt", None)]
+    assert all(model is results[0] for model in results)
+    assert results[0].model.calls == 1  # warm-up inference
+
+def test_models_keyed_by_device(registry):
+    """Test that different devices get separate models."""
+    cpu = registry.get("yolov8n.pt", "cpu", warmup_size=None)
+    default = registry.get("yolov8n.pt", warmup_size=None)
+
+    assert cpu is not default
+    assert cpu.model.calls == 0
+    assert set(registry.loaded()) == {("yolov8n.pt", "cpu"), ("yolov8n.pt", None)}
+
+def test_evict(registry):
+    """Test that eviction forces a reload."""
+    registry.get("yolov8n.pt", warmup_size=None)
+    assert registry.evict("yolov8n.pt")
+    assert not registry.evict("yolov8n.pt")
+
+    registry.get("yolov8n.pt", warmup_size=None)
+    assert len(registry.loads) == 2
@@ -0,0 +1,229 @@
+"""Tests for the workflow orchestrator module."""
+import threading
+import time
+from types import SimpleNamespace
+import pytest
+from com.brykly.utils.log_context import run_id_var
+from com.brykly.workflow import stages
+from com.brykly.workflow.orchestrator import WorkflowOrchestrator
+
+def _context(task_name):
+    return SimpleNamespace(task=SimpleNamespace(name=task_name))
+
+@pytest.fixture
+def video_cache_key():
+    """Return the Prefect cache key function, skipping without Prefect."""
+    pytest.importorskip("prefect")
+    from com.brykly.workflow.prefect_flows import _video_cache_key
+    return _video_cache_key
+
+def test_video_cache_key_uses_video_id_and_mode(video_cache_key):
+    """Test that the cache key ignores URL noise but not mode or task."""
+    key = video_cache_key(
+        _context("process_video"),
+        {"input_data": {"url": "https://youtu.be/dQw4w9WgXcQ?t=1", "mode": "quick"}}
+    )
+    same_video = video_cache_key(
+        _context("process_video"),
+        {"input_data": {"url": "https://www.youtube.com/watch?v=dQw4w9WgXcQ", "mode": "quick"}}
+    )
+    other_mode = video_cache_key(
+        _context("process_video"),
+        {"input_data": {"url": "https://youtu.be/dQw4w9WgXcQ", "mode": "detailed"}}
+    )
+    other_task = video_cache_key(
+        _context("generate_content"),
+        {"input_data": {"url": "https://youtu.be/dQw4w9WgXcQ", "mode": "quick"}}
+    )
+
+    assert key == same_video == "process_video:dQw4w9WgXcQ:quick"
+    assert other_mode != key
+    assert other_task != key
+
+def test_video_cache_key_without_video_id(video_cache_key):
+    """Test that unrecognised URLs disable caching."""
+    key = video_cache_key(
+        _context("process_video"),
+        {"input_data": {"url": "https://www.youtube.com/@somechannel", "mode": "quick"}}
+    )
+    assert key is None
+
+def test_pinned_components_survive_reload(monkeypatch):
+    """Test that a run's pinned components stay put when the App reloads."""
+    app = SimpleNamespace(components="v1")
+    monkeypatch.setattr(stages, "get_app", lambda config_path: app)
+
+    with stages.pin_components("config.yaml") as key:
+        app.components = "v2"
+        assert stages.pinned_components(key) == "v1"
+    with pytest.raises(KeyError):
+        stages.pinned_components(key)
+
+def test_asyncio_backend_is_default(config_manager, test_config_file):
+    """Test that the in-process backend is used unless Prefect is requested."""
+    orchestrator = WorkflowOrchestrator(test_config_file)
+    assert orchestrator.backend == "asyncio"
+
+    with pytest.raises(ValueError):
+        WorkflowOrchestrator(test_config_file, backend="celery")
+
+def test_asyncio_backend_batch(config_manager, test_config_file, monkeypatch):
+    """Test bounded concurrency and per-video failure isolation."""
+    orchestrator = WorkflowOrchestrator(test_config_file)
+    orchestrator.max_workers = 2
+    lock = threading.Lock()
+    running = {"now": 0, "peak": 0}
+
+    def fake_pipeline(input_data):
+        with lock:
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+        time.sleep(0.05)
+        with lock:
+            running["now"] -= 1
+        if "bad" in input_data["url"]:
+            raise ValueError("boom")
+        return {"markdown": f"{input_data['url']}.md"}
+
+    monkeypatch.setattr(orchestrator, "_run_pipeline", fake_pipeline)
+    urls = [f"https://youtu.be/video{i}" for i in range(5)] + ["https://youtu.be/bad"]
+    results = orchestrator.run_batch(urls)
+
+    assert running["peak"] == 2
+    assert results["https://youtu.be/bad"] is None
+    assert results["https://youtu.be/video0"] == {"markdown": "https://youtu.be/video0.md"}
+
+def test_batch_jobs_share_run_id(config_manager, test_config_file, monkeypatch):
+    """Test that worker threads see the batch's run ID."""
+    orchestrator = WorkflowOrchestrator(test_config_file)
+    seen = []
+    monkeypatch.setattr(orchestrator, "_run_pipeline", lambda input_data: seen.append(run_id_var.get()))
+
+    orchestrator.run_batch([f"https://youtu.be/video{i}" for i in range(3)])
+
+    assert len(seen) == 3
+    assert seen[0] is not None and len(set(seen)) == 1
+    assert run_id_var.get() is None
+
+def test_run_queue_drains_jobs(config_manager, test_config_file, monkeypatch, tmp_path):
+    """Test that queued jobs are acknowledged or retried until dead-lettered."""
+    from com.brykly.workflow.job_queue import JobQueue
+    queue = JobQueue(str(tmp_path / "jobs.db"), max_attempts=2, retry_delay=0)
+    queue.enqueue_many([f"https://youtu.be/video{i}" for i in range(4)] + ["https://youtu.be/bad"])
+    orchestrator = WorkflowOrchestrator(test_config_file)
+    orchestrator.max_workers = 2
+    attempts = []
+
+    def fake_pipeline(input_data):
+        attempts.append(input_data["url"])
+        if "bad" in input_data["url"]:
+            raise ValueError("boom")
+        return {"markdown": "post.md"}
+
+    monkeypatch.setattr(orchestrator, "_run_pipeline", fake_pipeline)
+    completed = orchestrator.run_queue(queue, drain=True)
+
+    assert completed == 4
+    assert attempts.count("https://youtu.be/bad") == 2
+    assert len(queue) == 0
+    assert queue.dead_letters()[0]['error'] == "boom"
+
+def test_queue_errors_do_not_stop_worker(config_manager, test_config_file, monkeypatch, tmp_path):
+    """Test that a failed acknowledgement is logged and the job is retried after its lease expires."""
+    import sqlite3
+    from com.brykly.workflow.job_queue import JobQueue
+    queue = JobQueue(str(tmp_path / "jobs.db"), visibility_timeout=0.3)
+    queue.enqueue_many([f"https://youtu.be/video{i}" for i in range(3)])
+    orchestrator = WorkflowOrchestrator(test_config_file)
+    orchestrator.max_workers = 1
+    ack = queue.ack
+    failed_acks = []
+    attempts = []
+
+    def flaky_ack(job):
+        if not failed_acks:
+            failed_acks.append(job.url)
+            raise sqlite3.OperationalError("database is locked")
+        return ack(job)
+
+    monkeypatch.setattr(queue, "ack", flaky_ack)
+    monkeypatch.setattr(orchestrator, "_run_pipeline", lambda input_data: attempts.append(input_data["url"]))
+    completed = orchestrator.run_queue(queue, drain=True)
+
+    assert completed == 4
+    assert attempts.count(failed_acks[0]) == 2
+    assert len(queue) == 0
+
+def test_batch_starts_before_listing_finishes(config_manager, test_config_file, monkeypatch):
+    """Test that videos are processed while a channel is still being listed."""
+    orchestrator = WorkflowOrchestrator(test_config_file)
+    started = threading.Event()
+    seen_while_listing = []
+
+    def expand_urls(urls):
+        yield "https://youtu.be/first000001"
+        seen_while_listing.append(started.wait(5))
+        yield "https://youtu.be/second00001"
+
+    def fake_pipeline(input_data):
+        started.set()
+        return {"markdown": f"{input_data['url']}.md"}
+
+    monkeypatch.setattr(orchestrator, "expand_urls", expand_urls)
+    monkeypatch.setattr(orchestrator, "_run_pipeline", fake_pipeline)
+    results = orchestrator.run_batch(["https://www.youtube.com/@somechannel"])
+
+    assert seen_while_listing == [True]
+    assert list(results) == ["https://youtu.be/first000001", "https://youtu.be/second00001"]
+
+def test_batch_reports_listing_failure(config_manager, test_config_file, monkeypatch):
+    """Test that a failed listing is reported as a failed URL after the listed videos run."""
+    orchestrator = WorkflowOrchestrator(test_config_file)
+    channel = "https://www.youtube.com/@somechannel"
+
+    def expand_urls(urls):
+        for url in urls:
+            if url != channel:
+                yield url
+                continue
+            yield "https://youtu.be/first000001"
+            raise RuntimeError("listing failed")
+
+    monkeypatch.setattr(orchestrator, "expand_urls", expand_urls)
+    monkeypatch.setattr(orchestrator, "_run_pipeline", lambda input_data: {"markdown": "out.md"})
+    results = orchestrator.run_batch([channel, "https://youtu.be/second00001"])
+
+    assert results == {
+        "https://youtu.be/first000001": {"markdown": "out.md"},
+        "https://youtu.be/second00001": {"markdown": "out.md"},
+        channel: None,
+    }
+
+async def test_batch_async_raises_listing_failure(config_manager, test_config_file, monkeypatch):
+    """Test that run_batch_async finishes started jobs and then raises the listing error."""
+    orchestrator = WorkflowOrchestrator(test_config_file)
+    processed = []
+    monkeypatch.setattr(orchestrator, "_run_pipeline", lambda input_data: processed.append(input_data["url"]))
+
+    def inputs():
+        yield {"url": "https://youtu.be/first000001", "mode": "quick"}
+        raise RuntimeError("listing failed")
+
+    with pytest.raises(RuntimeError, match="listing failed"):
+        await orchestrator.run_batch_async(inputs())
+    assert processed == ["https://youtu.be/first000001"]
+
+async def test_workflow_run_id_is_released():
+    """Test that a finished workflow's run ID does not leak into later runs."""
+    from com.brykly.config.configuration_manager import ConfigSnapshot
+    from com.brykly.workflow.base import BaseWorkflow
+
+    seen = []
+    for _ in range(2):
+        workflow = BaseWorkflow(config=ConfigSnapshot({}))
+        await workflow.start()
+        seen.append((workflow.run_id, run_id_var.get()))
+        await workflow.complete()
+
+    assert [run_id for run_id, _ in seen] == [current for _, current in seen]
+    assert run_id_var.get() is None
@@ -0,0 +1,85 @@
+"""Tests for the profiling utilities."""
+import pstats
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+import pytest
+from com.brykly.utils.profiling import Profiler, collapse_call_graph, profile_videos, video_profiler
+
+def busy_work(seconds):
+    """Spin for a while so profilers have something to see."""
+    deadline = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < deadline:
+        total += sum(range(100))
+    return total
+
+def test_cprofile_writes_pstats_and_collapsed_stacks(tmp_path):
+    """Test the cProfile mode's output files."""
+    with Profiler("run", "cprofile", tmp_path) as profiler:
+        busy_work(0.05)
+
+    stats = pstats.Stats(str(profiler.pstats_path))
+    assert any(name == "busy_work" for _, _, name in stats.stats)
+    lines = profiler.collapsed_path.read_text().splitlines()
+    busy = [line for line in lines if line.rsplit(" ", 1)[0].split(";")[-1].startswith("busy_work")]
+    assert busy and all(int(line.rsplit(" ", 1)[1]) > 0 for line in busy)
+
+def test_concurrent_cprofile_runs_one_at_a_time(tmp_path):
+    """Test that cprofile Profilers in several threads never overlap."""
+    spans = []
+
+    def profiled(i):
+        with Profiler(f"video{i}", "cprofile", tmp_path):
+            start = time.perf_counter()
+            busy_work(0.02)
+            spans.append((start, time.perf_counter()))
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(profiled, range(4)))
+
+    spans.sort()
+    assert all(end <= next_start for (_, end), (next_start, _) in zip(spans, spans[1:]))
+    assert len(list(tmp_path.glob("*.pstats"))) == 4
+
+def test_sampling_profiles_calling_thread(tmp_path):
+    """Test the sampling mode's output files."""
+    with Profiler("run", "sampling", tmp_path, interval=0.001) as profiler:
+        busy_work(0.1)
+
+    stats = pstats.Stats(str(profiler.pstats_path))
+    busy = [key for key in stats.stats if key[2] == "busy_work"]
+    assert busy
+    assert stats.stats[busy[0]][3] > 0  # cumulative time
+    assert "busy_work (test_profiling.py:" in profiler.collapsed_path.read_text()
+
+def test_collapse_call_graph_splits_time_between_callers():
+    """Test that a shared callee's time is divided along each edge."""
+    main, a, b, leaf = [("f.py", line, name) for line, name in enumerate("main a b leaf".split())]
+    stats = {
+        main: (1, 1, 0.0, 4.0, {}),
+        a: (1, 1, 0.0, 1.0, {main: (1, 1, 0.0, 1.0)}),
+        b: (1, 1, 0.0, 3.0, {main: (1, 1, 0.0, 3.0)}),
+        leaf: (2, 2, 4.0, 4.0, {a: (1, 1, 1.0, 1.0), b: (1, 1, 3.0, 3.0)}),
+    }
+
+    stacks = collapse_call_graph(stats)
+
+    assert stacks[(main, a, leaf)] == pytest.approx(1e6)
+    assert stacks[(main, b, leaf)] == pytest.approx(3e6)
+
+def test_video_profiler_follows_config(tmp_path):
+    """Test when a video is profiled."""
+    config = {"profiling": {"enabled": True, "videos": ["abc"], "output_dir": str(tmp_path)}}
+
+    assert isinstance(video_profiler({}, "run_abc", "abc"), nullcontext)
+    assert isinstance(video_profiler(config, "run_xyz", "xyz"), nullcontext)
+    profiler = video_profiler(config, "run_abc", "abc")
+    assert isinstance(profiler, Profiler) and profiler.mode == "cprofile"
+
+    with profile_videos("sampling"):
+        requested = video_profiler({}, "run_xyz", "xyz")
+        assert isinstance(requested, Profiler) and requested.mode == "sampling"
+        with profiler:
+            assert isinstance(video_profiler(config, "nested", "abc"), nullcontext)
+    assert profiler.pstats_path.exists()
@@ -0,0 +1,172 @@
+"""Tests for the HTTP job service."""
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+import pytest
+import yaml
+
+pytest.importorskip("fastapi")
+from fastapi.testclient import TestClient
+from com.brykly import service
+from com.brykly.workflow import stages
+
+VIDEO_URL = "https://youtu.be/dQw4w9WgXcQ"
+
+@pytest.fixture
+def fake_app(monkeypatch):
+    """Replace the shared App with components that finish instantly."""
+    release = threading.Event()
+    release.set()
+
+    def generate_content(metadata, mode):
+        release.wait(5)
+        if metadata == "bad":
+            raise ValueError("generation failed")
+        return {"title": metadata, "mode": mode}
+
+    components = SimpleNamespace(
+        video_processor=SimpleNamespace(
+            extract_metadata=lambda url, include_transcript: "bad" if "BAD" in url else url
+        ),
+        include_transcript=lambda mode: mode != "quick",
+        generate_content=generate_content,
+        output_manager=SimpleNamespace(
+            save_all_formats=lambda post, formats: {fmt: f"post.{fmt}" for fmt in formats or ["markdown"]}
+        ),
+    )
+    monkeypatch.setattr(stages, "get_app", lambda config_path: SimpleNamespace(components=components))
+    return release
+
+@pytest.fixture
+def service_config(test_config, tmp_path):
+    def write(**settings):
+        path = tmp_path / "service.yaml"
+        path.write_text(yaml.dump(dict(test_config, service=settings)))
+        return str(path)
+    return write
+
+def wait_for(client, job_id, statuses, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        report = client.get(f"/jobs/{job_id}").json()
+        if report["status"] in statuses:
+            return report
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} never reached {statuses}")
+
+def test_submit_and_poll(config_manager, fake_app, service_config):
+    """Test that a submitted job runs all steps and reports its outputs."""
+    with TestClient(service.create_app(service_config(workers=2))) as client:
+        response = client.post("/jobs", json={"url": VIDEO_URL, "mode": "detailed", "formats": ["html"]})
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+        assert response.headers["location"] == f"/jobs/{job_id}"
+
+        report = wait_for(client, job_id, ("completed", "failed"))
+        assert report["status"] == "completed"
+        assert report["mode"] == "detailed"
+        assert report["outputs"] == {"html": "post.html"}
+        assert [step["name"] for step in report["steps"]] == [
+            "extract_metadata", "generate_content", "save_output"
+        ]
+        assert all(step["status"] == "completed" for step in report["steps"])
+
+def test_failed_job(config_manager, fake_app, service_config):
+    """Test that a failing stage marks the step and the job failed."""
+    with TestClient(service.create_app(service_config())) as client:
+        job_id = client.post("/jobs", json={"url": VIDEO_URL + "&BAD"}).json()["job_id"]
+        report = wait_for(client, job_id, ("completed", "failed"))
+
+        assert report["status"] == "failed"
+        assert report["error"] == "generation failed"
+        assert report["steps"][1]["status"] == "failed"
+
+def test_event_stream(config_manager, fake_app, service_config):
+    """Test that progress is streamed as server-sent events until the job ends."""
+    fake_app.clear()
+    with TestClient(service.create_app(service_config())) as client:
+        job_id = client.post("/jobs", json={"url": VIDEO_URL}).json()["job_id"]
+        events = []
+        with client.stream("GET", f"/jobs/{job_id}/events") as response:
+            assert response.headers["content-type"].startswith("text/event-stream")
+            fake_app.set()
+            for line in response.iter_lines():
+                if line.startswith("event:"):
+                    events.append([line.split(": ", 1)[1]])
+                elif line.startswith("data:"):
+                    events[-1].append(json.loads(line.split(": ", 1)[1]))
+
+    statuses = [data["status"] for name, data in events if name == "status"]
+    assert statuses[-1] == "completed"
+    assert events[-1][0] == "end"
+    assert all(data["job_id"] == job_id for _, data in events)
+    step_counts = [len(data["steps"]) for name, data in events if name == "status"]
+    assert step_counts == sorted(step_counts) and step_counts[-1] == 3
+
+async def test_event_stream_client_disconnects(config_manager, fake_app, service_config):
+    """Test that a client leaving mid-stream unsubscribes cleanly while the job runs on."""
+    fake_app.clear()
+    app = service.create_app(service_config())
+    disconnected = asyncio.Event()
+    requests = [{"type": "http.request", "body": b"", "more_body": False}]
+    sent = []
+
+    async def receive():
+        if requests:
+            return requests.pop()
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+        if message.get("body"):
+            disconnected.set()
+
+    async with app.router.lifespan_context(app):
+        job = app.state.jobs.submit(service.JobRequest(url=VIDEO_URL))
+        scope = {
+            "type": "http", "asgi": {"version": "3.0", "spec_version": "2.3"}, "http_version": "1.1",
+            "method": "GET", "scheme": "http", "path": f"/jobs/{job.id}/events", "raw_path": b"",
+            "root_path": "", "query_string": b"", "headers": [], "client": ("test", 1), "server": ("test", 80),
+        }
+        await asyncio.wait_for(app(scope, receive, send), timeout=5)
+
+        assert sent[0]["status"] == 200 and b"event: status" in sent[1]["body"]
+        assert job._subscribers == []
+        fake_app.set()
+
+def test_queue_full(config_manager, fake_app, service_config):
+    """Test that submissions beyond the queue bound are refused with 503."""
+    fake_app.clear()
+    with TestClient(service.create_app(service_config(workers=1, queue_size=1))) as client:
+        running = client.post("/jobs", json={"url": VIDEO_URL}).json()["job_id"]
+        wait_for(client, running, ("running",))
+        assert client.post("/jobs", json={"url": VIDEO_URL}).status_code == 202
+
+        response = client.post("/jobs", json={"url": VIDEO_URL})
+        assert response.status_code == 503
+        assert response.headers["retry-after"]
+        assert client.get("/health").json()["queued"] == 1
+        fake_app.set()
+
+def test_invalid_requests(config_manager, fake_app, service_config):
+    """Test validation errors and unknown jobs."""
+    with TestClient(service.create_app(service_config())) as client:
+        assert client.post("/jobs", json={"url": VIDEO_URL, "mode": "visual"}).status_code == 422
+        assert client.post("/jobs", json={"url": VIDEO_URL, "formats": ["docx"]}).status_code == 422
+        assert client.post("/jobs", json={"url": "https://example.com/video"}).status_code == 422
+        assert client.get("/jobs/unknown").status_code == 404
+        assert client.get("/jobs/unknown/events").status_code == 404
+
+def test_finished_jobs_are_evicted(config_manager, fake_app, service_config):
+    """Test that only retained_jobs finished jobs are kept."""
+    with TestClient(service.create_app(service_config(retained_jobs=2))) as client:
+        job_ids = []
+        for _ in range(4):
+            job_ids.append(client.post("/jobs", json={"url": VIDEO_URL}).json()["job_id"])
+            wait_for(client, job_ids[-1], ("completed",))
+
+        assert client.get(f"/jobs/{job_ids[0]}").status_code == 404
+        assert client.get(f"/jobs/{job_ids[-1]}").status_code == 200
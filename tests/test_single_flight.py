@@ -0,0 +1,94 @@
+"""Tests for single-flight deduplication."""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from com.brykly.core.video_processor import VideoProcessor
+from com.brykly.utils.single_flight import SingleFlight
+
+def _concurrently(func, count):
+    with ThreadPoolExecutor(max_workers=count) as pool:
+        futures = [pool.submit(func) for _ in range(count)]
+        return [future.exception() or future.result() for future in futures]
+
+def test_concurrent_calls_share_one_result():
+    """Test that identical concurrent calls run once and get the same object."""
+    flights = SingleFlight()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.1)
+        return {"title": "shared"}
+
+    results = _concurrently(lambda: flights.do("dQw4w9WgXcQ", "metadata", (), fetch), 8)
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert flights.in_flight() == 0
+
+def test_errors_are_shared_and_not_remembered():
+    """Test that waiting callers see the failure and the next call runs again."""
+    flights = SingleFlight()
+    calls = []
+
+    def fail():
+        calls.append(1)
+        time.sleep(0.1)
+        raise ValueError("boom")
+
+    results = _concurrently(lambda: flights.do("dQw4w9WgXcQ", "metadata", (), fail), 4)
+    assert len(calls) == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+    with pytest.raises(ValueError):
+        flights.do("dQw4w9WgXcQ", "metadata", (), fail)
+    assert len(calls) == 2
+
+def test_different_keys_run_separately():
+    """Test that the stage, parameters and video ID all distinguish calls."""
+    flights = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fetch(name):
+        calls.append(name)
+        release.wait(5)
+        return name
+
+    keys = [("a" * 11, "transcript", ("en",)), ("a" * 11, "transcript", ("de",)),
+            ("a" * 11, "metadata", ()), ("b" * 11, "transcript", ("en",)),
+            (None, "transcript", ("en",)), (None, "transcript", ("en",))]
+    with ThreadPoolExecutor(max_workers=len(keys)) as pool:
+        futures = [pool.submit(flights.do, *key, lambda i=i: fetch(i)) for i, key in enumerate(keys)]
+        time.sleep(0.1)
+        release.set()
+        assert [future.result() for future in futures] == list(range(len(keys)))
+    assert sorted(calls) == list(range(len(keys)))
+
+def test_video_processor_deduplicates_fetches(monkeypatch):
+    """Test that concurrent extractions of one video fetch info and transcript once."""
+    processor = VideoProcessor({})
+    fetched = []
+
+    def fetch_info(url):
+        fetched.append("info")
+        time.sleep(0.1)
+        return {"id": "dQw4w9WgXcQ", "title": "Video"}
+
+    def fetch_transcript(video_id):
+        fetched.append("transcript")
+        time.sleep(0.1)
+        return ("hello", "en", False)
+
+    monkeypatch.setattr(processor, "_fetch_info", fetch_info)
+    monkeypatch.setattr(processor, "_fetch_transcript", fetch_transcript)
+
+    def extract():
+        metadata = processor.extract_metadata("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+        return metadata.video_id, metadata.transcript
+
+    results = _concurrently(extract, 4)
+
+    assert sorted(fetched) == ["info", "transcript"]
+    assert results == [("dQw4w9WgXcQ", "hello")] * 4
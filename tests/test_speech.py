@@ -0,0 +1,113 @@
+"""Tests for local speech-to-text."""
+import sys
+import wave
+import pytest
+from com.brykly.config.configuration_manager import ConfigSnapshot
+from com.brykly.external_integration import speech
+from com.brykly.external_integration.speech import (
+    SAMPLE_RATE, SpeechTranscriber, create_backend, load_audio, silence_chunks
+)
+from com.brykly.output_management.transcript import TranscriptManager
+from com.brykly.utils.exceptions import TranscriptError
+
+np = pytest.importorskip("numpy")
+
+# (start, end, frequency) of each tone burst; silence everywhere else.
+BURSTS = [(0.5, 4.0, 300), (5.0, 9.5, 500), (10.5, 13.0, 700), (14.0, 19.0, 900)]
+DURATION = 20.0
+
+def synthetic_audio():
+    audio = np.zeros(int(DURATION * SAMPLE_RATE), dtype=np.float32)
+    for start, end, frequency in BURSTS:
+        t = np.arange(int(start * SAMPLE_RATE), int(end * SAMPLE_RATE)) / SAMPLE_RATE
+        audio[int(start * SAMPLE_RATE):int(end * SAMPLE_RATE)] = 0.5 * np.sin(2 * np.pi * frequency * t)
+    return audio
+
+@pytest.fixture(autouse=True)
+def worker_pools():
+    yield
+    speech.shutdown_pools()
+
+@pytest.fixture
+def wav_file(tmp_path):
+    path = tmp_path / "speech.wav"
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes((synthetic_audio() * 32767).astype(np.int16).tobytes())
+    return str(path)
+
+def in_silence(seconds):
+    return not any(start <= seconds <= end for start, end, _ in BURSTS)
+
+def test_chunks_are_cut_in_pauses():
+    """Test that no chunk is longer than the limit and every cut falls in silence."""
+    chunks = silence_chunks(synthetic_audio(), SAMPLE_RATE, chunk_seconds=6, search_seconds=3)
+
+    assert chunks[0][0] == 0 and chunks[-1][1] == int(DURATION * SAMPLE_RATE)
+    for (_, end), (start, _) in zip(chunks, chunks[1:]):
+        assert end == start
+        assert in_silence(start / SAMPLE_RATE)
+    assert all(end - start <= 6 * SAMPLE_RATE for start, end in chunks)
+
+def test_short_audio_is_one_chunk():
+    """Test that audio under the limit is not split."""
+    assert silence_chunks(np.zeros(SAMPLE_RATE, dtype=np.float32), SAMPLE_RATE) == [(0, SAMPLE_RATE)]
+
+def test_parallel_transcription_merges_timestamps(wav_file):
+    """Test that chunks transcribed in worker processes come back in order at absolute times."""
+    transcriber = SpeechTranscriber({"backend": "tones", "chunk_seconds": 6, "workers": 2})
+
+    transcript = transcriber.transcribe_file(wav_file)
+
+    assert transcript.text == "300Hz 500Hz 700Hz 900Hz"
+    for segment, (start, end, _) in zip(transcript.segments, BURSTS):
+        assert segment.start == pytest.approx(start, abs=0.05)
+        assert segment.end == pytest.approx(end, abs=0.05)
+
+def test_in_process_matches_pool(wav_file):
+    """Test that a single worker gives the same segments as the pool."""
+    audio = load_audio(wav_file)
+    single = SpeechTranscriber({"backend": "tones", "chunk_seconds": 6, "workers": 1}).transcribe(audio)
+    pooled = SpeechTranscriber({"backend": "tones", "chunk_seconds": 6, "workers": 3}).transcribe(audio)
+
+    assert single == pooled
+
+def test_transcribers_share_one_pool(wav_file):
+    """Test that transcriptions with the same settings reuse spawned workers."""
+    config = {"backend": "tones", "chunk_seconds": 6, "workers": 2}
+    first = SpeechTranscriber(config).transcribe_file(wav_file)
+    pool = speech._shared_pool(SpeechTranscriber(config).config, 2)
+    second = SpeechTranscriber(dict(config)).transcribe_file(wav_file)
+
+    assert first == second
+    assert list(speech._pools.values()) == [pool]
+    assert pool._mp_context.get_start_method() == "spawn"
+
+def test_backend_by_path():
+    """Test that a backend can be named by a module:factory path."""
+    backend = create_backend({"backend": "com.brykly.external_integration.speech:ToneBackend"})
+    assert backend.transcribe(np.zeros(SAMPLE_RATE, dtype=np.float32), SAMPLE_RATE) == ([], None)
+
+def test_unknown_backend():
+    """Test that an unknown backend name is rejected."""
+    with pytest.raises(ValueError):
+        create_backend({"backend": "nonexistent"})
+
+def transcript_manager(tmp_path, **speech_config):
+    config = ConfigSnapshot({"paths": {"output_dir": str(tmp_path / "output")}, "speech": speech_config})
+    return TranscriptManager(config=config)
+
+async def test_transcript_manager_honours_enabled(tmp_path, wav_file):
+    """Test that the workflow step only transcribes when speech is enabled."""
+    assert await transcript_manager(tmp_path, enabled=False).extract_transcript(wav_file) == ""
+    manager = transcript_manager(tmp_path, enabled=True, backend="tones", workers=1)
+    assert await manager.extract_transcript(wav_file) == "300Hz 500Hz 700Hz 900Hz"
+
+async def test_missing_speech_extra(tmp_path, wav_file, monkeypatch):
+    """Test that a missing faster-whisper install is reported as a TranscriptError."""
+    monkeypatch.setitem(sys.modules, "faster_whisper", None)
+    manager = transcript_manager(tmp_path, enabled=True, workers=1)
+    with pytest.raises(TranscriptError, match="speech"):
+        await manager.extract_transcript(wav_file)
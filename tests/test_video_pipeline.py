@@ -0,0 +1,117 @@
+"""Tests for the pipelined video analysis module."""
+import time
+from types import SimpleNamespace
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+np = pytest.importorskip("numpy")
+
+from com.brykly.external_integration import video_pipeline
+from com.brykly.external_integration.video_pipeline import (
+    VideoAnalysisPipeline,
+    analyze_sharded,
+    shard_ranges
+)
+
+class StubModel:
+    """Detects one 'person' per frame, optionally sleeping per batch."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+
+    def __call__(self, source, **kwargs):
+        time.sleep(self.delay)
+        boxes = SimpleNamespace(cls=[0], conf=[0.9], xyxy=[[0.0, 0.0, 1.0, 1.0]])
+        return [SimpleNamespace(boxes=boxes, names={0: "person"}) for _ in source]
+
+def make_stub_model(config):
+    """Picklable model factory for shard workers."""
+    return StubModel()
+
+@pytest.fixture(autouse=True)
+def shard_pools():
+    yield
+    video_pipeline.shutdown_pools()
+
+@pytest.fixture
+def clip(tmp_path):
+    """Write a 10 second, 10 fps clip."""
+    path = tmp_path / "clip.mp4"
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"mp4v"), 10, (64, 48))
+    for i in range(100):
+        writer.write(np.full((48, 64, 3), (i * 2, 128, 255 - i * 2), dtype=np.uint8))
+    writer.release()
+    return str(path)
+
+def test_shard_ranges_align_to_stride():
+    """Test that shards cover the video and start on sampled frames."""
+    ranges = shard_ranges(frame_count=100, shards=3, stride=7)
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == 100
+    assert all(start % 7 == 0 for start, _ in ranges)
+    assert all(a_end == b_start for (_, a_end), (b_start, _) in zip(ranges, ranges[1:]))
+
+def test_pipeline_reports_stage_stats(clip):
+    """Test that both stages report work and utilisation."""
+    pipeline = VideoAnalysisPipeline(StubModel(), {"sample_interval": 0.5, "batch_size": 4})
+    result = pipeline.run(clip)
+
+    stats = result.stats.to_dict()
+    assert len(result.detections) == 20
+    assert stats["decode"]["items"] == 20
+    assert stats["inference"]["items"] == 20
+    assert stats["dropped_frames"] == 0
+    assert 0 < stats["inference"]["utilisation"] <= 1
+
+def test_pipeline_drop_backpressure(clip):
+    """Test that a slow consumer makes the decoder drop batches."""
+    pipeline = VideoAnalysisPipeline(
+        StubModel(delay=0.2),
+        {"sample_interval": 0.1, "batch_size": 2, "queue_size": 1, "backpressure": "drop"}
+    )
+    result = pipeline.run(clip)
+
+    assert result.stats.dropped_frames > 0
+    assert len(result.detections) + result.stats.dropped_frames == 100
+
+def test_pipeline_rejects_unknown_policy():
+    """Test backpressure validation."""
+    with pytest.raises(ValueError):
+        VideoAnalysisPipeline(StubModel(), {"backpressure": "spill"})
+
+def test_pipeline_propagates_decode_errors(tmp_path):
+    """Test that an unreadable video raises."""
+    with pytest.raises(ValueError):
+        VideoAnalysisPipeline(StubModel(), {}).run(str(tmp_path / "missing.mp4"))
+
+def test_sharded_matches_single_process(clip):
+    """Test that sharding samples exactly the same frames."""
+    config = {"sample_interval": 0.3, "batch_size": 4, "max_key_frames": 3}
+    single = VideoAnalysisPipeline(StubModel(), config).run(clip)
+    sharded = analyze_sharded(make_stub_model, config, clip, shards=3)
+
+    assert sharded.detections.frame_index.tolist() == single.detections.frame_index.tolist()
+    assert len(sharded.key_frames) <= 3
+
+def test_sharded_videos_share_spawned_pool(clip):
+    """Test that sharded videos reuse one pool of spawned workers."""
+    config = {"sample_interval": 0.3, "batch_size": 4}
+    first = analyze_sharded(make_stub_model, config, clip, shards=2)
+    pool = video_pipeline._shard_pool(2)
+    second = analyze_sharded(make_stub_model, config, clip, shards=2)
+
+    assert first.detections.frame_index.tolist() == second.detections.frame_index.tolist()
+    assert list(video_pipeline._pools.values()) == [pool]
+    assert pool._mp_context.get_start_method() == "spawn"
+
+def test_sharded_key_frame_files_are_deleted_on_close(clip, tmp_path):
+    """Test that closing a sharded result deletes every shard's thumbnail directory."""
+    spool = tmp_path / "frames"
+    config = {"sample_interval": 0.3, "batch_size": 4, "max_key_frames": 3, "key_frame_dir": str(spool)}
+
+    result = analyze_sharded(make_stub_model, config, clip, shards=3)
+
+    assert result.key_frames and all(frame.path.exists() for frame in result.key_frames)
+    assert set(spool.iterdir()) == set(result.directories)
+    result.close()
+    assert list(spool.iterdir()) == []
@@ -0,0 +1,130 @@
+"""Tests for the video processor module."""
+import pickle
+import sys
+from itertools import islice
+from types import SimpleNamespace
+import pytest
+from com.brykly.config.configuration_manager import freeze
+from com.brykly.core.video_processor import VideoProcessor, extract_video_id, is_collection_url
+
+@pytest.mark.parametrize("url", [
+    "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+    "https://youtube.com/watch?feature=share&v=dQw4w9WgXcQ",
+    "https://youtu.be/dQw4w9WgXcQ?t=42",
+    "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+    "https://www.youtube.com/embed/dQw4w9WgXcQ",
+])
+def test_extract_video_id(url):
+    """Test video ID extraction from the common URL shapes."""
+    assert extract_video_id(url) == "dQw4w9WgXcQ"
+
+def test_extract_video_id_missing():
+    """Test that URLs without a video ID return None."""
+    assert extract_video_id("https://www.youtube.com/@somechannel") is None
+
+@pytest.mark.parametrize("url,expected", [
+    ("https://www.youtube.com/@somechannel", True),
+    ("https://www.youtube.com/channel/UC1234567890/videos", True),
+    ("https://www.youtube.com/playlist?list=PL123", True),
+    ("https://www.youtube.com/watch?v=dQw4w9WgXcQ&list=PL123", False),
+    ("https://youtu.be/dQw4w9WgXcQ", False),
+])
+def test_is_collection_url(url, expected):
+    """Test that playlists and channels are told apart from videos."""
+    assert is_collection_url(url) is expected
+
+def test_iter_video_urls_is_lazy(monkeypatch):
+    """Test flat, page-by-page listing of a channel through its tabs."""
+    listed = []
+
+    def videos_tab():
+        for i in range(100):
+            listed.append(i)
+            yield {"_type": "url", "ie_key": "Youtube", "id": f"video{i:06d}"}
+
+    pages = {
+        "https://www.youtube.com/@somechannel": {"_type": "playlist", "entries": iter([
+            {"_type": "url", "ie_key": "YoutubeTab", "url": "https://www.youtube.com/@somechannel/videos"},
+        ])},
+        "https://www.youtube.com/@somechannel/videos": {"_type": "playlist", "entries": videos_tab()},
+    }
+
+    class YoutubeDL:
+        def __init__(self, params):
+            assert params["extract_flat"] == "in_playlist"
+        def __enter__(self):
+            return self
+        def __exit__(self, *exc_info):
+            pass
+        def extract_info(self, url, download=True, process=True):
+            assert not download and not process
+            return pages[url]
+
+    monkeypatch.setitem(sys.modules, "yt_dlp", SimpleNamespace(YoutubeDL=YoutubeDL))
+    urls = VideoProcessor({}).iter_video_urls("https://www.youtube.com/@somechannel")
+
+    assert list(islice(urls, 3)) == [f"https://www.youtube.com/watch?v=video{i:06d}" for i in range(3)]
+    assert len(listed) == 3
+
+def test_single_video_url_is_not_expanded():
+    """Test that a video URL yields itself without calling yt-dlp."""
+    assert list(VideoProcessor({}).iter_video_urls("https://youtu.be/dQw4w9WgXcQ")) == [
+        "https://youtu.be/dQw4w9WgXcQ"
+    ]
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_speech_fallback_without_captions(monkeypatch, enabled):
+    """Test that the audio is transcribed only when captions are missing and speech is enabled."""
+    processor = VideoProcessor({"speech": {"enabled": enabled}})
+    monkeypatch.setattr(processor, "_fetch_info", lambda url: {"id": "dQw4w9WgXcQ", "title": "Title"})
+    monkeypatch.setattr(processor, "_fetch_transcript", lambda video_id: None)
+    monkeypatch.setattr(processor, "_speech_transcript", lambda url: ("spoken words", "en", True))
+
+    metadata = processor.extract_metadata("https://youtu.be/dQw4w9WgXcQ")
+
+    assert metadata.transcript == ("spoken words" if enabled else None)
+    assert metadata.is_auto_generated is enabled
+
+def test_transcript_is_lazy(monkeypatch):
+    """Test that the transcript is fetched on first use, once, and never if excluded."""
+    calls = []
+    monkeypatch.setattr(VideoProcessor, "_fetch_info", lambda self, url: {"id": "dQw4w9WgXcQ", "title": "Title"})
+    monkeypatch.setattr(
+        VideoProcessor, "_fetch_transcript", lambda self, video_id: calls.append(video_id) or ("words", "en", False)
+    )
+    processor = VideoProcessor(freeze({
+        "transcript": {"preferred_languages": ["en"]},
+        "api": {"openai": {"api_key": "sk-secret"}},
+    }))
+
+    excluded = processor.extract_metadata("https://youtu.be/dQw4w9WgXcQ", include_transcript=False)
+    assert excluded.transcript is None and excluded.transcript_loaded
+
+    metadata = processor.extract_metadata("https://youtu.be/dQw4w9WgXcQ")
+    assert not metadata.transcript_loaded and calls == []
+    assert (metadata.transcript, metadata.transcript_language, metadata.is_auto_generated) == ("words", "en", False)
+    assert calls == ["dQw4w9WgXcQ"]
+
+    pickled = pickle.dumps(processor.extract_metadata("https://youtu.be/dQw4w9WgXcQ"))
+    assert b"sk-secret" not in pickled
+    assert pickle.loads(pickled).transcript == "words"
+    assert pickle.loads(pickle.dumps(metadata)) == metadata
+
+def test_speech_audio_is_deleted(monkeypatch, tmp_path):
+    """Test that audio downloaded for speech recognition does not outlive it."""
+    from com.brykly.external_integration import speech, youtube
+
+    def download_media(url, directory, max_filesize=None):
+        path = f"{directory}/dQw4w9WgXcQ.audio.m4a"
+        open(path, "wb").close()
+        return path
+
+    monkeypatch.setattr(youtube, "download_media", download_media)
+    monkeypatch.setattr(
+        speech.SpeechTranscriber, "transcribe_file",
+        lambda self, path: speech.SpeechTranscript([speech.Segment(0, 1, "words")], "en")
+    )
+    processor = VideoProcessor({"speech": {"enabled": True}, "paths": {"temp_dir": str(tmp_path)}})
+
+    assert processor._speech_transcript("https://youtu.be/dQw4w9WgXcQ") == ("words", "en", True)
+    assert list(tmp_path.iterdir()) == []
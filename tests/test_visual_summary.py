@@ -0,0 +1,82 @@
+"""Tests for the visual summary module."""
+from types import SimpleNamespace
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from com.brykly.core.content_generator import ContentGenerator
+from com.brykly.core.video_processor import VideoMetadata
+from com.brykly.core.visual_summary import Scene, VisualSummarizer, build_scenes, format_summary
+from com.brykly.external_integration.detections import Detections
+
+def _detections(frame_index, class_id):
+    return Detections(
+        np.array(frame_index, dtype=np.int64),
+        np.array(class_id, dtype=np.int32),
+        np.full(len(class_id), 0.9, dtype=np.float32),
+        np.zeros((len(class_id), 4), dtype=np.float32),
+        {0: "person", 1: "car"}
+    )
+
+def test_build_scenes_splits_on_key_frames():
+    """Test that key frames start scenes and counts are per-frame maxima."""
+    detections = _detections([0, 0, 10, 30, 30, 30, 40], [0, 1, 0, 0, 0, 1, 1])
+    key_frames = [SimpleNamespace(frame_index=30)]
+
+    scenes = build_scenes(detections, key_frames, fps=10.0)
+
+    assert scenes == [
+        Scene(0.0, 3.0, {"person": 1, "car": 1}),
+        Scene(3.0, 4.1, {"person": 2, "car": 1}),
+    ]
+    assert build_scenes(Detections.empty(), [], fps=10.0) == []
+
+def test_format_summary_keeps_busiest_scenes():
+    """Test prompt formatting and truncation to max_scenes."""
+    scenes = [
+        Scene(0.0, 65.0, {"person": 1}),
+        Scene(65.0, 70.0, {"car": 2, "person": 3}),
+        Scene(70.0, 80.0, {"dog": 2}),
+    ]
+
+    assert format_summary(scenes, max_scenes=2) == (
+        "Scene 1 (1:05-1:10): person x3, car x2\n"
+        "Scene 2 (1:10-1:20): dog x2"
+    )
+
+def test_summaries_cached_by_file_hash(config_manager, tmp_path, monkeypatch):
+    """Test that a repeat run on the same file skips analysis."""
+    video = tmp_path / "clip.mp4"
+    video.write_bytes(b"frames")
+    summarizer = VisualSummarizer({
+        "api": {"yolo": {"model": "yolov8n.pt"}},
+        "modes": {"visual_review": {"cache_dir": str(tmp_path / "cache")}}
+    })
+    analyzed = []
+
+    def fake_analyze(video_path):
+        analyzed.append(video_path)
+        return [Scene(0.0, 1.0, {"person": 1})]
+
+    monkeypatch.setattr(summarizer, "_analyze", fake_analyze)
+
+    assert summarizer.summarize(str(video)) == [Scene(0.0, 1.0, {"person": 1})]
+    assert summarizer.summarize(str(video)) == [Scene(0.0, 1.0, {"person": 1})]
+    assert len(analyzed) == 1
+
+    video.write_bytes(b"other frames")
+    summarizer.summarize(str(video))
+    assert len(analyzed) == 2
+
+def test_detailed_review_includes_visual_summary(monkeypatch):
+    """Test that the visual summary is added to the prompt."""
+    generator = ContentGenerator({"api": {"openai": {"api_key": "test_key", "api_url": "http://test"}}})
+    prompts = []
+    monkeypatch.setattr(generator, "_make_api_request", lambda prompt: prompts.append(prompt) or "Title")
+    metadata = VideoMetadata(title="Video", description="", duration=60, upload_date="20240101", channel="Channel")
+
+    generator.generate_detailed_review(metadata, "Scene 1 (0:00-0:05): person x2")
+    generator.generate_detailed_review(metadata)
+
+    assert "Scene 1 (0:00-0:05): person x2" in prompts[0]
+    assert "Visual analysis" not in prompts[1]
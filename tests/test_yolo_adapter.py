@@ -0,0 +1,64 @@
+"""Tests for the YOLO adapter module."""
+from types import SimpleNamespace
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+np = pytest.importorskip("numpy")
+
+from com.brykly.external_integration.yolo_adapter import YOLOAdapter
+
+class RecordingModel:
+    """Model stand-in that records batch sizes and detects one object per frame."""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def __call__(self, source, **kwargs):
+        frames = source if isinstance(source, list) else [source]
+        self.batch_sizes.append(len(frames))
+        boxes = SimpleNamespace(cls=[0], conf=[0.9], xyxy=[[0.0, 0.0, 1.0, 1.0]])
+        return [SimpleNamespace(boxes=boxes, names={0: "person"}) for _ in frames]
+
+@pytest.fixture
+def synthetic_clip(tmp_path):
+    """Write a 6 second, 10 fps clip."""
+    path = tmp_path / "clip.mp4"
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"mp4v"), 10, (64, 48))
+    for i in range(60):
+        writer.write(np.full((48, 64, 3), i * 4, dtype=np.uint8))
+    writer.release()
+    return str(path)
+
+@pytest.fixture
+def yolo_adapter(config_manager):
+    """Create an adapter with a recording model."""
+    adapter = YOLOAdapter()
+    adapter.model = RecordingModel()
+    adapter._authenticated = True
+    return adapter
+
+def test_analyze_video_samples_by_time_and_batches(yolo_adapter, synthetic_clip):
+    """Test that frames are sampled every interval and sent in batches."""
+    yolo_adapter.config = {"sample_interval": 0.5, "batch_size": 4, "max_key_frames": 3}
+
+    insights = yolo_adapter.analyze_video(synthetic_clip)
+
+    # 60 frames at 10 fps sampled every 5 frames -> 12 frames in batches of 4
+    assert yolo_adapter.model.batch_sizes == [4, 4, 4]
+    assert len(insights.detections) == 12
+    assert insights.detections.frame_index.tolist() == list(range(0, 60, 5))
+    assert insights.objects[0].class_name == "person"
+    assert 1 <= len(insights.key_frames) <= 3
+    assert insights.key_frames[0].load().size == (64, 48)
+
+def test_analyze_video_seeks_for_long_strides(yolo_adapter, synthetic_clip, monkeypatch):
+    """Test that long strides use seeking and still hit the right frames."""
+    monkeypatch.setattr(
+        "com.brykly.external_integration.video_pipeline.SEEK_THRESHOLD_FRAMES", 10
+    )
+    yolo_adapter.config = {"sample_interval": 2.0, "batch_size": 8}
+
+    insights = yolo_adapter.analyze_video(synthetic_clip)
+
+    assert yolo_adapter.model.batch_sizes == [3]
+    assert insights.detections.frame_index.tolist() == [0, 20, 40]
@@ -1,12 +1,15 @@
 """Tests for the YouTube service module."""
+import sys
 import pytest
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 from pathlib import Path
 
 from com.brykly.external_integration.youtube import YouTubeAdapter
+from com.brykly.utils.exceptions import VideoProcessingError
 
 @pytest.fixture
-def youtube_service(test_config_file):
+def youtube_service(config_manager, test_config_file):
     """Create a YouTube service instance for testing."""
     return YouTubeAdapter(config_path=test_config_file)
 
@@ -29,15 +32,74 @@ async def test_get_video_info(youtube_service):
         assert info['view_count'] == 1000
         assert info['uploader'] == 'Test Channel'
 
+class FakeYoutubeDL:
+    """Writes a small file where yt-dlp would, recording the options used."""
+    instances = []
+
+    def __init__(self, params):
+        self.params = params
+        FakeYoutubeDL.instances.append(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def extract_info(self, url, download=True):
+        info = {'id': 'dQw4w9WgXcQ', 'ext': 'webm', 'filesize': 1000}
+        max_filesize = self.params.get('max_filesize')
+        if max_filesize and info['filesize'] > max_filesize:
+            return info
+        path = self.prepare_filename(info)
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_bytes(b'x' * info['filesize'])
+        info['requested_downloads'] = [{'filepath': path}]
+        return info
+
+    def prepare_filename(self, info):
+        return self.params['outtmpl'] % info
+
+@pytest.fixture
+def fake_yt_dlp(monkeypatch):
+    FakeYoutubeDL.instances = []
+    monkeypatch.setitem(sys.modules, 'yt_dlp', SimpleNamespace(YoutubeDL=FakeYoutubeDL))
+    return FakeYoutubeDL
+
 @pytest.mark.asyncio
-async def test_download_video(youtube_service):
-    """Test downloading a video."""
-    with patch('yt_dlp.YoutubeDL') as mock_ydl:
-        mock_ydl.return_value.download = AsyncMock()
-        output_path = 'output.mp4'
-        result = await youtube_service.download_video('https://youtube.com/watch?v=test', output_path)
-        assert result == output_path
-        assert Path(output_path).exists()
+async def test_download_video(youtube_service, fake_yt_dlp, tmp_path):
+    """Test that only the audio is downloaded, resumably, into the temp dir."""
+    youtube_service.temp_dir = tmp_path
+    result = await youtube_service.download_video('https://youtube.com/watch?v=dQw4w9WgXcQ')
+
+    assert result == str(tmp_path / 'dQw4w9WgXcQ.audio.webm')
+    assert Path(result).stat().st_size == 1000
+    params = fake_yt_dlp.instances[0].params
+    assert params['format'].startswith('bestaudio')
+    assert params['continuedl'] and not params['overwrites']
+    assert params['max_filesize'] == 500 * 1024 * 1024
+
+@pytest.mark.asyncio
+async def test_download_video_to_path(youtube_service, fake_yt_dlp, tmp_path):
+    """Test an explicit output path and a low-resolution video download."""
+    output_path = tmp_path / 'videos' / 'output.mp4'
+    result = await youtube_service.download_video(
+        'https://youtube.com/watch?v=dQw4w9WgXcQ', str(output_path), audio_only=False
+    )
+
+    assert result == str(output_path)
+    assert output_path.exists()
+    assert '[height<=360]' in fake_yt_dlp.instances[0].params['format']
+
+@pytest.mark.asyncio
+async def test_download_video_size_cap(youtube_service, fake_yt_dlp, tmp_path):
+    """Test that a stream over the size cap is an error, not an empty file."""
+    youtube_service.temp_dir = tmp_path / 'temp'
+    youtube_service.config.snapshot = SimpleNamespace(data={'download': {'max_filesize_mb': 0.0001}})
+
+    with pytest.raises(VideoProcessingError):
+        await youtube_service.download_video('https://youtube.com/watch?v=dQw4w9WgXcQ')
+    assert not youtube_service.temp_dir.exists()
 
 @pytest.mark.asyncio
 async def test_get_video_info_error(youtube_service):